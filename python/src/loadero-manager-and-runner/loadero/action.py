@@ -1,4 +1,13 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from queue import Empty, Queue
+
+from loadero.action_options import RestoreSource
+from loadero.backup_files import write_test_tree
+from loadero.backup_manifest import MANIFEST_FILE_NAME, BackupManifest
+from loadero.metrics import BACKUP_DURATION, RESTORE_DURATION
+from loadero.tree_diff import diff_objects, object_body
 
 
 def create_suites(obj, suites, args_suite, test_ids, args_overwrite_suite):
@@ -199,15 +208,54 @@ def init(obj, args_suite, args_test_ids, args_overwrite_suite):
     local_manager.init_project(suites)
 
 
-def backup(obj, args_suite, args_test_ids, args_overwrite_suite, args_delete_source_test):
-    """Backup tests.
+def backup_test(obj, project_name, test, workers=1):
+    """Backup test.
+
+    Script, groups, participants and asserts of the test are fetched in
+    parallel if workers is greater than 1.
+
+    Args:
+        obj (dict): Contains Logger and Managers objects
+        project_name (string): Loadero project name
+        test (dict): Loadero test dictionary
+        workers (int): Maximum number of parallel API calls
+    """
+    logger = obj["logger"]
+    local_manager = obj["local_manager"]
+
+    logger.info(f"Backing up test id [{test['id']}]...")
+    with BACKUP_DURATION.time(test_id=test["id"]):
+        local_manager.create_test_directory(project_name, test["id"], test["name"])
+        script_file_id = local_manager.write_test_to_file(
+            project_name, test["id"], test["name"])["script_file_id"]
+        with ThreadPoolExecutor(max_workers=min(workers, 4)) as executor:
+            futures = [
+                executor.submit(local_manager.write_script_to_file,
+                                project_name, script_file_id, test["id"], test["name"]),
+                executor.submit(local_manager.write_groups_to_file, project_name, test["id"], test["name"]),
+                executor.submit(local_manager.write_participants_to_file, project_name, test["id"], test["name"]),
+            ]
+            asserts = executor.submit(local_manager.write_asserts_to_file,
+                                      project_name, test["id"], test["name"]).result()
+            local_manager.write_asserts_preconditons_to_file(project_name, test, asserts, workers)
+            for future in futures:
+                future.result()
+        local_manager.flush_file_hashes()
+    logger.info(f"Successfully backed up test id [{test['id']}]!")
+
+
+def select_backup_tests(obj, args_suite, args_test_ids, args_overwrite_suite, incremental=False):
+    """Selects tests to be backed up.
 
     Args:
         obj (dict): Contains Logger and Managers objects
         args_suite (string): Suite name (CLI argument)
         args_test_ids (list): List of test ids (CLI argument)
         args_overwrite_suite (boolean): Overwrite excisting suite (CLI argument)
-        args_delete_source_test (boolean): Delete test from source project after backup (CLI argument)
+        incremental (boolean): Skip tests that were not updated since the last backup (CLI argument)
+
+    Returns:
+        tuple: Project name, BackupManifest, selected test ids, tests to back up and tests that are up to date
     """
     logger = obj["logger"]
     remote_manager = obj["remote_manager"]
@@ -223,28 +271,93 @@ def backup(obj, args_suite, args_test_ids, args_overwrite_suite, args_delete_sou
     # Test ids for backup
     test_ids = backup_handler(obj, loadero_test_ids, args_suite, args_test_ids, args_overwrite_suite)
 
+    project_name = remote_manager.read_project()["name"]
+    manifest = BackupManifest(os.path.join(local_manager.get_project_directory(project_name), MANIFEST_FILE_NAME))
+    tests = []
+    unchanged_tests = []
     for test in all_tests_list:
         if test["id"] not in test_ids:
             continue
-        logger.info(f"Backing up test id [{test['id']}]...")
-        project_name = remote_manager.read_project()["name"]
-        local_manager.create_test_directory(project_name, test["id"], test["name"])
-        script_file_id = local_manager.write_test_to_file(
-            project_name, test["id"], test["name"])["script_file_id"]
-        local_manager.write_script_to_file(project_name, script_file_id, test["id"], test["name"])
-        local_manager.write_groups_to_file(project_name, test["id"], test["name"])
-        local_manager.write_participants_to_file(project_name, test["id"], test["name"])
-        asserts = local_manager.write_asserts_to_file(project_name, test["id"], test["name"])
-        local_manager.write_asserts_preconditons_to_file(project_name, test["id"], test["name"], asserts)
-        logger.info(f"Successfully backed up test id [{test['id']}]!")
-    if args_delete_source_test is True:
+        if incremental and manifest.is_unchanged(
+                test, local_manager.get_test_directory(project_name, test["id"], test["name"])):
+            logger.info(f"Test id [{test['id']}] is not updated since the last backup, skipping.")
+            unchanged_tests.append(test)
+            continue
+        tests.append(test)
+    return project_name, manifest, test_ids, tests, unchanged_tests
+
+
+def select_stream_tests(obj, args_suite, args_test_ids, args_overwrite_suite):
+    """Selects tests to be cloned without the local backup.
+
+    Args:
+        obj (dict): Contains Logger and Managers objects
+        args_suite (string): Suite name (CLI argument)
+        args_test_ids (list): List of test ids (CLI argument)
+        args_overwrite_suite (boolean): Overwrite excisting suite (CLI argument)
+
+    Returns:
+        tuple: Selected test ids and tests
+    """
+    local_manager = obj["local_manager"]
+    remote_manager = obj["remote_manager"]
+
+    all_tests_list = remote_manager.read_all_tests()
+    loadero_test_ids = [test["id"] for test in all_tests_list]
+    if args_suite:
+        # Suites are kept in the local project file
+        test_ids = backup_handler(obj, loadero_test_ids, args_suite, args_test_ids, args_overwrite_suite)
+    elif args_test_ids:
+        test_ids = local_manager.validate_cli_test_ids(loadero_test_ids, args_test_ids)
+    else:
+        test_ids = loadero_test_ids
+    return test_ids, [test for test in all_tests_list if test["id"] in test_ids]
+
+
+def backup(obj, options):
+    """Backup tests.
+
+    If options.incremental is set, tests that were not updated since the
+    last backup recorded in the project's manifest.json and whose backup
+    files are intact are skipped.
+
+    Args:
+        obj (dict): Contains Logger and Managers objects
+        options (ActionOptions): Tests, delete_source_test, workers and incremental
+    """
+    workers = options.workers
+    logger = obj["logger"]
+    remote_manager = obj["remote_manager"]
+    local_manager = obj["local_manager"]
+
+    project_name, manifest, test_ids, tests, unchanged_tests = select_backup_tests(
+        obj, options.tests.suite, options.tests.test_ids, options.tests.overwrite_suite, options.incremental)
+    if unchanged_tests:
+        logger.info(f"Skipped {len(unchanged_tests)} test(s) whose updated timestamp did not change, changes of "
+                    "their groups, participants or asserts that did not update the test are not backed up. "
+                    "Back up without --incremental to back them up.")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(backup_test, obj, project_name, test, workers): test for test in tests}
+        try:
+            for future, test in futures.items():
+                future.result()
+                manifest.record(test, local_manager.get_test_directory(project_name, test["id"], test["name"]))
+        except Exception:
+            # Do not start backups of the remaining tests
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            manifest.save()
+    if options.delete_source_test is True:
         remote_manager.delete_tests(test_ids)
 
     logger.info(f"Tests count: {len(test_ids)}.")
 
 
-def restore_create(obj, local_project_id, local_project_name, test_id, test_name):
-    """Restore test in a project in which test_id does not exist.
+def read_test_tree(obj, local_project_id, local_project_name, test_id, test_name):
+    """Reads test with its script, groups, participants, asserts and assert preconditions from local files.
 
     Args:
         obj (dict): Contains Logger and Managers objects
@@ -254,101 +367,301 @@ def restore_create(obj, local_project_id, local_project_name, test_id, test_name
         test_name (string): Local test name
 
     Returns:
-        int: New Loadero test id
+        dict: Test tree with test, script, groups, participants, asserts and asserts_preconditions keys
     """
     local_manager = obj["local_manager"]
+    test = (local_project_id, local_project_name, test_id, test_name)
+    return {
+        "test": local_manager.read_test_from_file(*test),
+        "script": local_manager.read_script_from_file(*test),
+        "groups": local_manager.read_groups_from_file(*test),
+        "participants": local_manager.read_participants_from_file(*test),
+        "asserts": local_manager.read_asserts_from_file(*test),
+        "asserts_preconditions": local_manager.read_asserts_preconditions_from_file(*test),
+    }
+
+
+def fetch_test_tree(obj, test_id, workers=1):
+    """Reads test with its script, groups, participants, asserts and assert preconditions from Loadero.
+
+    Groups, participants and asserts of the test are read in parallel if
+    workers is greater than 1, the script is read with the test.
+
+    Args:
+        obj (dict): Contains Logger and Managers objects
+        test_id (int): Loadero test id
+        workers (int): Maximum number of parallel API calls
+
+    Returns:
+        dict: Test tree with test, script, groups, participants, asserts and asserts_preconditions keys
+    """
     remote_manager = obj["remote_manager"]
+    test = remote_manager.read_test(test_id)
+    script = test.pop("script")
+    with ThreadPoolExecutor(max_workers=min(workers, 4)) as executor:
+        groups_future = executor.submit(remote_manager.read_all_groups, test_id)
+        participants_future = executor.submit(remote_manager.read_all_participants, test_id)
+        asserts = executor.submit(remote_manager.read_all_asserts, test_id).result()
+        all_asserts_preconditions = dict(zip(
+            [str(a["id"]) for a in asserts],
+            executor.map(lambda a: remote_manager.read_all_assert_preconditions(test_id, a["id"]), asserts)))
+        return {
+            "test": test,
+            "script": script,
+            "groups": groups_future.result(),
+            "participants": participants_future.result(),
+            "asserts": asserts,
+            "asserts_preconditions": all_asserts_preconditions,
+        }
+
+
+def create_journaled(remote_manager, journal, kind, loadero_object):
+    """Creates object on Loadero and records it in the restore journal.
 
-    test_from_file = local_manager.read_test_from_file(local_project_id, local_project_name, test_id, test_name)
-    script = local_manager.read_script_from_file(local_project_id, local_project_name, test_id, test_name)
-    test_from_file["script"] = script
-    new_test_id = remote_manager.create_test(test_from_file)
-    groups = local_manager.read_groups_from_file(local_project_id, local_project_name, test_id, test_name)
-    participants = local_manager.read_participants_from_file(local_project_id, local_project_name, test_id, test_name)
-    asserts = local_manager.read_asserts_from_file(local_project_id, local_project_name, test_id, test_name)
-    all_asserts_preconditions = local_manager.read_asserts_preconditions_from_file(
-        local_project_id, local_project_name, test_id, test_name)
+    Args:
+        remote_manager (RemoteManager): Manager of the project the object is created in
+        journal (RestoreJournal or None): Restore journal, objects are not recorded if None
+        kind (string): Object kind: test, groups, participants, asserts or asserts_preconditions
+        loadero_object (dict): Loadero object dictionary
 
-    for group in groups:
-        local_group_id = group["id"]
-        group["test_id"] = new_test_id
-        new_group_id = remote_manager.create_group(group)
+    Returns:
+        int: Created Loadero object id
+    """
+    create = {
+        "test": remote_manager.create_test,
+        "groups": remote_manager.create_group,
+        "participants": remote_manager.create_participant,
+        "asserts": remote_manager.create_assert,
+        "asserts_preconditions": remote_manager.create_assert_precondition,
+    }[kind]
+    created = create(loadero_object)
+    object_id = created["id"] if isinstance(created, dict) else created
+    if journal is not None:
+        test_id = object_id if kind == "test" else loadero_object["test_id"]
+        journal.record(remote_manager.project_id, {
+            "kind": kind, "id": object_id, "test_id": test_id, "assert_id": loadero_object.get("assert_id")})
+    return object_id
+
+
+def rollback(obj, journal):
+    """Deletes objects recorded in the restore journal from Loadero.
+
+    Objects are deleted in the reverse order of their creation. Objects of a
+    journaled test are deleted with the test. Objects that fail to be deleted
+    are kept in the journal.
 
-        for participant in participants:
-            local_group_id_by_participant = participant["group_id"]
-            if local_group_id == local_group_id_by_participant:
-                participant["test_id"] = new_test_id
-                participant["group_id"] = new_group_id
-                remote_manager.create_participant(participant)
+    Args:
+        obj (dict): Contains Logger and Managers objects
+        journal (RestoreJournal): Restore journal
 
-    for a in asserts:
-        old_a_id = a["id"]
-        a["test_id"] = new_test_id
-        a_id = remote_manager.create_assert(a)
-
-        for key in all_asserts_preconditions:
-            if int(key) == old_a_id:
-                ap = all_asserts_preconditions[key]
-                if ap is None:
-                    continue
-                for precondition in ap:
-                    precondition["test_id"] = new_test_id
-                    precondition["assert_id"] = a_id
-                    remote_manager.create_assert_precondition(precondition)
-    return new_test_id
+    Returns:
+        int: Number of deleted Loadero objects
+    """
+    logger = obj["logger"]
+    remote_manager = obj["remote_manager"]
+    objects = journal.read_objects(remote_manager.project_id)
+    test_ids = {o["test_id"] for o in objects if o["kind"] == "test"}
+    delete = {
+        "test": lambda o: remote_manager.delete_test(o["id"]),
+        "groups": lambda o: remote_manager.delete_group(o["test_id"], o["id"]),
+        "participants": lambda o: remote_manager.delete_participant(o["test_id"], o["id"]),
+        "asserts": lambda o: remote_manager.delete_assert(o["test_id"], o["id"]),
+        "asserts_preconditions": lambda o: remote_manager.delete_assert_precondition(
+            o["test_id"], o["assert_id"], o["id"]),
+    }
+
+    deleted = []
+    for o in reversed(objects):
+        if o["kind"] != "test" and o["test_id"] in test_ids:
+            deleted.append(o)
+            continue
+        try:
+            delete[o["kind"]](o)
+            deleted.append(o)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(f"Failed to delete {o['kind']} id [{o['id']}] of test id [{o['test_id']}]: {e}")
+    journal.remove(remote_manager.project_id, deleted)
+    logger.info(f"Rolled back {len(deleted)} of {len(objects)} objects created by restore.")
+    return len(deleted)
 
 
-def restore_update(obj, local_project_id, local_project_name, test_id, test_name):
-    """Restore test in a project in which test_id exists.
+def restore_create(obj, tree, workers=1, journal=None):
+    """Restore test in a project in which test_id does not exist.
+
+    Objects are created level by level of their dependencies: the test, then
+    groups and asserts, then participants and assert preconditions with the
+    new ids of their groups and asserts. Objects of the same level are created
+    in parallel if workers is greater than 1, so their new ids no longer
+    follow the order of the backup files. Only the test is recorded in the
+    journal, its objects are deleted with it.
 
     Args:
         obj (dict): Contains Logger and Managers objects
-        local_project_id (int): Local project id
-        local_project_name (string): Local project name
-        test_id (int): Local test id
-        test_name (string): Local test name
+        tree (dict): Test tree from read_test_tree or fetch_test_tree
+        workers (int): Maximum number of parallel API calls
+        journal (RestoreJournal or None): Journal of created objects
+
+    Returns:
+        int: New Loadero test id
     """
-    local_manager = obj["local_manager"]
     remote_manager = obj["remote_manager"]
-    test_from_file = local_manager.read_test_from_file(local_project_id, local_project_name, test_id, test_name)
-    script = local_manager.read_script_from_file(local_project_id, local_project_name, test_id, test_name)
-    test_from_file["script"] = script
-    remote_manager.update_test(test_from_file)
-    groups = local_manager.read_groups_from_file(local_project_id, local_project_name, test_id, test_name)
-    participants = local_manager.read_participants_from_file(local_project_id, local_project_name, test_id, test_name)
-    asserts = local_manager.read_asserts_from_file(local_project_id, local_project_name, test_id, test_name)
-    all_asserts_preconditions = local_manager.read_asserts_preconditions_from_file(
-        local_project_id, local_project_name, test_id, test_name)
 
-    for group in groups:
-        local_group_id = group["id"]
-        remote_manager.update_group(group)
+    test_from_file = dict(tree["test"], script=tree["script"])
+    new_test_id = create_journaled(remote_manager, journal, "test", test_from_file)
+    groups = tree["groups"]
+    participants = tree["participants"]
+    asserts = tree["asserts"]
+    all_asserts_preconditions = tree["asserts_preconditions"]
 
-        for participant in participants:
-            local_group_id_by_participant = participant["group_id"]
-            if local_group_id == local_group_id_by_participant:
-                remote_manager.update_participant(participant)
+    participants_by_group = {}
+    for participant in participants:
+        participants_by_group.setdefault(participant["group_id"], []).append(participant)
 
+    for group in groups:
+        group["test_id"] = new_test_id
     for a in asserts:
-        remote_manager.update_assert(a)
+        a["test_id"] = new_test_id
 
-        for key in all_asserts_preconditions:
-            ap = all_asserts_preconditions[key]
-            if ap is None:
-                continue
-            for precondition in ap:
-                remote_manager.update_assert_precondition(precondition)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Groups and asserts depend only on the test
+        group_futures = [executor.submit(remote_manager.create_group, group) for group in groups]
+        assert_futures = [executor.submit(remote_manager.create_assert, a) for a in asserts]
+        new_group_ids = {group["id"]: future.result() for group, future in zip(groups, group_futures)}
+        new_assert_ids = {a["id"]: future.result() for a, future in zip(asserts, assert_futures)}
+
+        # Participants depend on their group, preconditions on their assert
+        futures = []
+        for group in groups:
+            for participant in participants_by_group.get(group["id"], []):
+                participant["test_id"] = new_test_id
+                participant["group_id"] = new_group_ids[group["id"]]
+                futures.append(executor.submit(remote_manager.create_participant, participant))
+        for a in asserts:
+            for precondition in all_asserts_preconditions.get(str(a["id"])) or []:
+                precondition["test_id"] = new_test_id
+                precondition["assert_id"] = new_assert_ids[a["id"]]
+                futures.append(executor.submit(remote_manager.create_assert_precondition, precondition))
+        for future in futures:
+            future.result()
+    return new_test_id
 
 
-def restore(obj, args_local_project_id, args_suite, args_test_ids, args_ignore_project_language_check):
+def restore_update(obj, tree, workers=1, journal=None):
+    """Restore test in a project in which test_id exists.
+
+    The test is read from Loadero once and compared to its backup, only the
+    objects that differ are created, updated or deleted. Created objects are
+    recorded in the journal.
+
+    Args:
+        obj (dict): Contains Logger and Managers objects
+        tree (dict): Test tree from read_test_tree or fetch_test_tree
+        workers (int): Maximum number of parallel API calls
+        journal (RestoreJournal or None): Journal of created objects
+
+    Returns:
+        int: Number of created, updated and deleted Loadero objects
+    """
+    remote_manager = obj["remote_manager"]
+    test_from_file = tree["test"]
+    test_id = test_from_file["id"]
+    script = tree["script"]
+    groups = tree["groups"]
+    participants = tree["participants"]
+    asserts = tree["asserts"]
+    all_asserts_preconditions = tree["asserts_preconditions"]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        remote_test_future = executor.submit(remote_manager.read_test, test_id)
+        remote_groups_future = executor.submit(remote_manager.read_all_groups, test_id)
+        remote_participants_future = executor.submit(remote_manager.read_all_participants, test_id)
+        remote_asserts_future = executor.submit(remote_manager.read_all_asserts, test_id)
+        remote_test = remote_test_future.result()
+        remote_asserts = remote_asserts_future.result()
+        asserts_created, asserts_updated, asserts_deleted = diff_objects("asserts", asserts, remote_asserts)
+        # Preconditions of deleted asserts are deleted with them
+        created_assert_ids = {a["id"] for a in asserts_created}
+        kept_asserts = [a for a in asserts if a["id"] not in created_assert_ids]
+        remote_preconditions = dict(zip(
+            [a["id"] for a in kept_asserts],
+            executor.map(lambda a: remote_manager.read_all_assert_preconditions(test_id, a["id"]), kept_asserts)))
+        groups_created, groups_updated, groups_deleted = diff_objects(
+            "groups", groups, remote_groups_future.result())
+        participants_created, participants_updated, participants_deleted = diff_objects(
+            "participants", participants, remote_participants_future.result())
+        remote_script = remote_test["script"]
+
+        changes = 0
+        if object_body("test", test_from_file) != object_body("test", remote_test) \
+                or script.rstrip("\n") != remote_script.rstrip("\n"):
+            test_from_file["script"] = script
+            remote_manager.update_test(test_from_file)
+            changes += 1
+
+        # Participants are deleted before their groups and created after them
+        futures = [executor.submit(remote_manager.delete_participant, test_id, p["id"]) for p in participants_deleted]
+        futures += [executor.submit(remote_manager.delete_assert, test_id, a["id"]) for a in asserts_deleted]
+        for future in futures:
+            future.result()
+        futures = [executor.submit(remote_manager.delete_group, test_id, g["id"]) for g in groups_deleted]
+        futures += [executor.submit(remote_manager.update_group, g) for g in groups_updated]
+        futures += [executor.submit(remote_manager.update_assert, a) for a in asserts_updated]
+        for group in groups_created:
+            group["test_id"] = test_id
+        for a in asserts_created:
+            a["test_id"] = test_id
+        group_futures = [executor.submit(create_journaled, remote_manager, journal, "groups", group)
+                         for group in groups_created]
+        assert_futures = [executor.submit(create_journaled, remote_manager, journal, "asserts", a)
+                          for a in asserts_created]
+        new_group_ids = {group["id"]: future.result() for group, future in zip(groups_created, group_futures)}
+        new_assert_ids = {a["id"]: future.result() for a, future in zip(asserts_created, assert_futures)}
+        for future in futures:
+            future.result()
+        changes += len(participants_deleted) + len(asserts_deleted) + len(futures) + len(group_futures) \
+            + len(assert_futures)
+
+        futures = [executor.submit(remote_manager.update_participant, p) for p in participants_updated]
+        for participant in participants_created:
+            participant["test_id"] = test_id
+            participant["group_id"] = new_group_ids.get(participant["group_id"], participant["group_id"])
+            futures.append(executor.submit(create_journaled, remote_manager, journal, "participants", participant))
+        for a in asserts_created:
+            for precondition in all_asserts_preconditions.get(str(a["id"])) or []:
+                precondition["test_id"] = test_id
+                precondition["assert_id"] = new_assert_ids[a["id"]]
+                futures.append(executor.submit(
+                    create_journaled, remote_manager, journal, "asserts_preconditions", precondition))
+        for a in kept_asserts:
+            local_preconditions = all_asserts_preconditions.get(str(a["id"])) or []
+            preconditions_created, preconditions_updated, preconditions_deleted = diff_objects(
+                "asserts_preconditions", local_preconditions, remote_preconditions[a["id"]])
+            for precondition in preconditions_created:
+                precondition["test_id"] = test_id
+                precondition["assert_id"] = a["id"]
+                futures.append(executor.submit(
+                    create_journaled, remote_manager, journal, "asserts_preconditions", precondition))
+            futures += [executor.submit(remote_manager.update_assert_precondition, precondition)
+                        for precondition in preconditions_updated]
+            futures += [executor.submit(remote_manager.delete_assert_precondition, test_id, a["id"], precondition["id"])
+                        for precondition in preconditions_deleted]
+        for future in futures:
+            future.result()
+        changes += len(futures)
+    return changes
+
+
+def restore(obj, args_local_project_id, options):
     """Restore tests.
 
+    Objects created in Loadero are recorded in options.journal until their
+    test is restored. If restoring a test fails and options.rollback is set,
+    the journaled objects are deleted before the error is raised.
+
     Args:
         obj (dict): Contains Logger and Managers objects
         args_local_project_id (int): Local project id from which the tests should be restored
-        args_suite (string): Suite name (CLI argument)
-        args_test_ids (list): List of test ids (CLI argument)
-        args_ignore_project_language_check (boolean): Check source and destination project languages (CLI argument)
+        options (ActionOptions): Tests, ignore_project_language_check, workers, incremental, journal and rollback
 
     Returns:
         list: List of restored test ids
@@ -358,8 +671,10 @@ def restore(obj, args_local_project_id, args_suite, args_test_ids, args_ignore_p
     remote_manager = obj["remote_manager"]
     local_project_name = local_manager.get_project_name_from_test_cases(int(args_local_project_id))
 
+    journal = options.journal
+
     # Check project language
-    if args_ignore_project_language_check is False:
+    if options.ignore_project_language_check is False:
         local_project_lang = local_manager.read_project_from_file(
             int(args_local_project_id), local_project_name)["language"]
         dst_project_lang = remote_manager.read_project()["language"]
@@ -378,7 +693,7 @@ def restore(obj, args_local_project_id, args_suite, args_test_ids, args_ignore_p
     logger.info(f"--- Local testID list {local_test_ids}")
 
     # Test ids for restore action
-    test_ids_to_be_restored = restore_handler(obj, args_local_project_id, args_suite, args_test_ids)
+    test_ids_to_be_restored = restore_handler(obj, args_local_project_id, options.tests.suite, options.tests.test_ids)
 
     # Local tests valid for restore
     valid_local_tests = []
@@ -386,29 +701,199 @@ def restore(obj, args_local_project_id, args_suite, args_test_ids, args_ignore_p
         if local_test["id"] in test_ids_to_be_restored:
             valid_local_tests.append(local_test)
 
-    # Loadero test ids
-    loadero_test_ids = remote_manager.read_all_test_ids()
-    loadero_test_ids.sort()
+    # Loadero tests by id
+    source = RestoreSource(args_local_project_id, local_project_name,
+                           {test["id"]: test for test in remote_manager.read_all_tests() or []})
+
+    # Backup manifest tells which tests were not changed on either side since they were backed up
+    if options.incremental and int(remote_manager.project_id) == int(args_local_project_id):
+        source.manifest = BackupManifest(os.path.join(
+            local_manager.get_project_directory(local_project_name), MANIFEST_FILE_NAME))
 
-    if loadero_test_ids is None:
-        loadero_test_ids = []
+    if journal is not None and journal.read_objects(remote_manager.project_id):
+        logger.info(f"Journal {journal.path} has objects created by an interrupted restore, "
+                    "run the rollback action to delete them.")
 
     new_test_ids = []
     for test in valid_local_tests:
-        # Check if test id exists in Loadero and has a backup
-        if test["id"] in loadero_test_ids:
-            logger.info(f"Updating (Restoring) test id [{test['id']}]...")
-            restore_update(obj, args_local_project_id, local_project_name, test["id"], test["name"])
-            logger.info(f"Successfully updated (restored) test id [{test['id']}]")
-        # Check if test id does not exist in Loadero and has a backup
-        else:
-            logger.info(f"Restoring (Creating) test id [{test['id']}]...")
-            new_test_id = restore_create(obj, args_local_project_id, local_project_name, test["id"], test["name"])
-            test_ids = {}
-            test_ids["name"] = [test["id"], new_test_id]
-            logger.info(f"Successfully restored (created) test id [{test_ids['name'][0]}] to new test id [{test_ids['name'][1]}]!")
-            new_test_ids.append(test_ids["name"][1])
+        try:
+            new_test_id = restore_test(obj, test, source, options)
+        except BaseException:
+            if journal is not None and options.rollback:
+                logger.error(f"Restoring test id [{test['id']}] failed, rolling back created objects...")
+                rollback(obj, journal)
+            raise
+        if new_test_id is not None:
+            new_test_ids.append(new_test_id)
 
     logger.info(f"Tests count: {len(valid_local_tests)}.")
 
     return new_test_ids
+
+
+def restore_test(obj, test, source, options, tree=None):
+    """Restore test by updating it if it exists in Loadero or by creating it.
+
+    Args:
+        obj (dict): Contains Logger and Managers objects
+        test (dict): Local test dictionary
+        source (RestoreSource): Local project of the test and Loadero tests of the destination project
+        options (ActionOptions): Workers and journal
+        tree (dict or None): Test tree from fetch_test_tree, read from local files if None
+
+    Returns:
+        int: New Loadero test id or None if the test was updated
+    """
+    logger = obj["logger"]
+    local_manager = obj["local_manager"]
+    remote_manager = obj["remote_manager"]
+    journal = options.journal
+    # Check if test id exists in Loadero and has a backup
+    if test["id"] in source.loadero_tests:
+        test_directory = local_manager.get_test_directory(source.local_project_name, test["id"], test["name"])
+        if source.manifest is not None and source.manifest.is_unchanged(
+                source.loadero_tests[test["id"]], test_directory):
+            logger.info(f"Test id [{test['id']}] is up to date, skipping.")
+            return None
+        logger.info(f"Updating (Restoring) test id [{test['id']}]...")
+        with RESTORE_DURATION.time(test_id=test["id"], action="update"):
+            if tree is None:
+                tree = read_test_tree(
+                    obj, source.local_project_id, source.local_project_name, test["id"], test["name"])
+            changes = restore_update(obj, tree, options.workers, journal)
+        if journal is not None:
+            journal.commit(remote_manager.project_id, test["id"])
+        logger.info(f"Successfully updated (restored) test id [{test['id']}], {changes} objects changed")
+        return None
+
+    # Test id does not exist in Loadero and has a backup
+    logger.info(f"Restoring (Creating) test id [{test['id']}]...")
+    with RESTORE_DURATION.time(test_id=test["id"], action="create"):
+        if tree is None:
+            tree = read_test_tree(obj, source.local_project_id, source.local_project_name, test["id"], test["name"])
+        new_test_id = restore_create(obj, tree, options.workers, journal)
+    if journal is not None:
+        journal.commit(remote_manager.project_id, new_test_id)
+    logger.info(f"Successfully restored (created) test id [{test['id']}] to new test id [{new_test_id}]!")
+    return new_test_id
+
+
+def clone(obj_from, obj_to, options, streaming=False, persist=False):
+    """Clone tests from the source project to the destination project.
+
+    Tests are backed up and restored in a pipeline: up to workers tests are
+    backed up and up to workers tests are restored at the same time, and
+    backed up tests wait for the restore in a queue of at most workers tests,
+    so tests are restored while the next ones are backed up. Tests that are
+    up to date locally are restored first.
+
+    When streaming, tests are read from the source project into memory and
+    restored from there instead of going through the local backup files,
+    which are written only if persist is set.
+
+    Args:
+        obj_from (dict): Contains Logger and Managers objects of the source project
+        obj_to (dict): Contains Logger and Managers objects of the destination project
+        options (ActionOptions): Options of the backup and restore of the tests
+        streaming (boolean): Clone tests in memory without the local backup (CLI argument)
+        persist (boolean): Back up the tests cloned in memory too (CLI argument)
+
+    Returns:
+        list: List of new test ids
+    """
+    logger = obj_from["logger"]
+    local_manager = obj_from["local_manager"]
+    remote_manager_from = obj_from["remote_manager"]
+    remote_manager_to = obj_to["remote_manager"]
+    workers = options.workers
+    journal = options.journal
+
+    if streaming and not persist:
+        project_name = remote_manager_from.read_project()["name"]
+        manifest = None
+        test_ids, tests = select_stream_tests(
+            obj_from, options.tests.suite, options.tests.test_ids, options.tests.overwrite_suite)
+        unchanged_tests = []
+    else:
+        project_name, manifest, test_ids, tests, unchanged_tests = select_backup_tests(
+            obj_from, options.tests.suite, options.tests.test_ids, options.tests.overwrite_suite, options.incremental)
+
+    # Check project language
+    if options.ignore_project_language_check is False:
+        if remote_manager_from.read_project()["language"] != remote_manager_to.read_project()["language"]:
+            logger.critical("Projects' languages are not the same! Action denied!")
+
+    # Loadero tests of the destination project by id
+    source = RestoreSource(remote_manager_from.project_id, project_name,
+                           {test["id"]: test for test in remote_manager_to.read_all_tests() or []})
+    if journal is not None and journal.read_objects(remote_manager_to.project_id):
+        logger.info(f"Journal {journal.path} has objects created by an interrupted restore, "
+                    "run the rollback action to delete them.")
+
+    backed_up_tests = Queue(maxsize=workers)
+    restore_slots = threading.Semaphore(workers)
+
+    def backup_to_queue(test):
+        tree = None
+        try:
+            if streaming:
+                logger.info(f"Reading test id [{test['id']}]...")
+                with BACKUP_DURATION.time(test_id=test["id"]):
+                    tree = fetch_test_tree(obj_from, test["id"], workers)
+                    if persist:
+                        write_test_tree(local_manager, project_name, tree)
+            else:
+                backup_test(obj_from, project_name, test, workers)
+            if manifest is not None:
+                manifest.record(test, local_manager.get_test_directory(project_name, test["id"], test["name"]))
+        except BaseException as e:
+            backed_up_tests.put((test, None, e))
+            raise
+        backed_up_tests.put((test, tree, None))
+
+    def submit_restore(executor, restore_futures, test, tree=None):
+        restore_slots.acquire()  # pylint: disable=consider-using-with
+        for future in restore_futures:
+            if future.done() and future.exception() is not None:
+                restore_slots.release()
+                raise future.exception()
+        future = executor.submit(restore_test, obj_to, test, source, options, tree)
+        future.add_done_callback(lambda _: restore_slots.release())
+        return future
+
+    with ThreadPoolExecutor(max_workers=workers) as backup_executor, \
+            ThreadPoolExecutor(max_workers=workers) as restore_executor:
+        backup_futures = [backup_executor.submit(backup_to_queue, test) for test in tests]
+        restore_futures = []
+        try:
+            for test in unchanged_tests:
+                restore_futures.append(submit_restore(restore_executor, restore_futures, test))
+            for _ in tests:
+                test, tree, error = backed_up_tests.get()
+                if error is not None:
+                    raise error
+                restore_futures.append(submit_restore(restore_executor, restore_futures, test, tree))
+            new_test_ids = [future.result() for future in restore_futures]
+        except BaseException:
+            # Do not start the remaining tests and let the running ones finish before rolling back
+            for future in backup_futures + restore_futures:
+                future.cancel()
+            wait(restore_futures)
+            while not all(future.done() for future in backup_futures):
+                try:
+                    backed_up_tests.get(timeout=0.1)
+                except Empty:
+                    pass
+            if journal is not None and options.rollback:
+                logger.error("Cloning failed, rolling back created objects...")
+                rollback(obj_to, journal)
+            raise
+        finally:
+            if manifest is not None:
+                manifest.save()
+    if options.delete_source_test is True:
+        remote_manager_from.delete_tests(test_ids)
+
+    logger.info(f"Tests count: {len(test_ids)}.")
+
+    return [new_test_id for new_test_id in new_test_ids if new_test_id is not None]
@@ -0,0 +1,76 @@
+from dataclasses import dataclass, field
+
+from loadero.backup_manifest import BackupManifest
+from loadero.journal import RestoreJournal
+
+
+@dataclass
+class TestSelection:
+    """TestSelection class describes which tests of a project an action works with.
+
+    Attributes:
+        suite (string or None): Suite name
+        test_ids (list or None): List of test ids
+        overwrite_suite (boolean): Overwrite existing suite
+    """
+    suite: str or None = None
+    test_ids: list or None = None
+    overwrite_suite: bool = False
+
+
+@dataclass
+class ActionOptions:
+    """ActionOptions class keeps the CLI options of the backup, restore and clone actions.
+
+    Attributes:
+        tests (TestSelection): Tests the action works with
+        delete_source_test (boolean): Delete tests from the source project after backup
+        ignore_project_language_check (boolean): Do not compare source and destination project languages
+        workers (int): Number of tests backed up or restored at the same time and parallel API calls per test
+        incremental (boolean): Skip tests that were not updated since the last backup
+        journal (RestoreJournal or None): Journal of created objects, objects are not journaled if None
+        rollback (boolean): Delete journaled objects if restore fails
+    """
+    tests: TestSelection = field(default_factory=TestSelection)
+    delete_source_test: bool = False
+    ignore_project_language_check: bool = False
+    workers: int = 1
+    incremental: bool = False
+    journal: RestoreJournal or None = None
+    rollback: bool = True
+
+    @classmethod
+    def from_args(cls, args, journal=None):
+        """Creates options from the parsed CLI arguments of test_manager.py.
+
+        Args:
+            args (Namespace): Parsed CLI arguments
+            journal (RestoreJournal or None): Journal of created objects
+
+        Returns:
+            ActionOptions: Action options
+        """
+        return cls(
+            tests=TestSelection(args.suite, args.test_ids, args.overwrite_suite),
+            delete_source_test=args.delete_source_test,
+            ignore_project_language_check=args.ignore_project_language_check,
+            workers=args.workers,
+            incremental=args.incremental,
+            journal=journal,
+            rollback=args.rollback)
+
+
+@dataclass
+class RestoreSource:
+    """RestoreSource class describes where the tests restored to a Loadero project come from.
+
+    Attributes:
+        local_project_id (int): Project id of the local backup
+        local_project_name (string): Project name of the local backup
+        loadero_tests (dict): Loadero test dictionaries of the destination project by test id
+        manifest (BackupManifest or None): Backup manifest of the project, tests are not skipped if None
+    """
+    local_project_id: int
+    local_project_name: str
+    loadero_tests: dict
+    manifest: BackupManifest or None = None
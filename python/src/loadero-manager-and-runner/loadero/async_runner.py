@@ -0,0 +1,438 @@
+import asyncio
+import logging
+import time
+
+from junit_xml import TestCase
+from loadero_python.api_client import APIException
+from urllib3.exceptions import HTTPError
+
+from loadero.logger import Logger
+from loadero.metrics import RUN_DURATION, RUN_QUEUE_WAIT
+from loadero.poll_policy import ACTIVE_STATUSES
+from loadero.report import run_duration
+from loadero.runner import Runner
+from loadero.runner_config import RunnerConfig
+
+
+class AsyncRunner(Runner):
+    """AsyncRunner class for running tests from a single process on one event loop.
+
+    Run statuses are not read per run. A single poller task refreshes every
+    in-flight run through RunRegistry whenever the earliest run is due by its
+    poll policy, and hands the results to the waiting tasks.
+    """
+    __tests = None
+    __polls = None
+    __poller_wakeup = None
+    __launch_slots = None
+    __start_time = None
+    __test_count = None
+
+    def __init__(
+        self,
+        access_token: str or None = None,
+        project_id: int or None = None,
+        level: str = "info",
+        config: RunnerConfig or None = None
+    ) -> None:
+        super().__init__(access_token, project_id, level, config)
+
+        if self.config.concurrency < 1:
+            raise ValueError("AsyncRunner concurrency must be greater than 0.")
+
+        # Run id, launch time and run results of every attempt by test id
+        self.__tests = {}
+        # Next refresh time, waiting future and last result by run id
+        self.__polls = {}
+
+    @staticmethod
+    def check_result(test_run_result, logger):
+        """Check test run result without exiting the process.
+
+        Args:
+            test_run_result (dict): Loadero test run result dictionary
+            logger (Logger): Logger object runner-worker
+
+        Returns:
+            bool: True if the test run passed
+        """
+        run_id = test_run_result["id"]
+        test_id = test_run_result["test_id"]
+        status = test_run_result["status"]
+        if status != "done":
+            logger.error(f"Test: {test_id} execution failed! Run: {run_id} with status: {status}.")
+            return False
+
+        success_rate = test_run_result.get("success_rate") or 0
+        if success_rate == 1:
+            logger.info(f"Test: {test_id} passed run: {run_id} with success rate: {success_rate*100}%.")
+            return True
+
+        logger.error(f"Test: {test_id} failed run: {run_id} with success rate: {success_rate*100}%.")
+        return False
+
+    def schedule_poll(self, run_id, interval):
+        """Set the time when run should be refreshed next.
+
+        Args:
+            run_id (int): Loadero test run id
+            interval (float): Seconds until the next refresh
+        """
+        self.__polls[run_id]["due_time"] = time.time() + interval
+        self.__poller_wakeup.set()
+
+    async def poll_runs(self, semaphore):
+        """Refresh all in-flight runs with batched calls and notify waiting tasks.
+
+        Args:
+            semaphore (asyncio.Semaphore): Limits concurrent API calls
+        """
+        while True:
+            self.__poller_wakeup.clear()
+            due_times = [poll["due_time"] for poll in self.__polls.values() if poll["due_time"] is not None]
+            if not due_times:
+                await self.__poller_wakeup.wait()
+                continue
+
+            delay = min(due_times) - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self.__poller_wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            api_calls = self.registry.api_calls
+            try:
+                async with semaphore:
+                    test_run_results = await asyncio.to_thread(self.registry.refresh)
+            except (APIException, HTTPError) as e:
+                self.logger.error(f"Failed to refresh runs: {e}")
+                retry_time = time.time() + self.poll_policy.next_interval(None, 0, 0)
+                for poll in self.__polls.values():
+                    if poll["due_time"] is not None:
+                        poll["due_time"] = retry_time
+                continue
+            finally:
+                self.count_api_calls(self.registry.api_calls - api_calls)
+
+            now = time.time()
+            for run_id, test_run_result in test_run_results.items():
+                if self.progress is not None:
+                    self.progress.set_status(test_run_result["test_id"], test_run_result["status"])
+                poll = self.__polls.get(run_id)
+                if poll is None or poll["waiter"] is None or poll["waiter"].done():
+                    continue
+                last_result = poll["last_result"]
+                status_changed = last_result is None or last_result["status"] != test_run_result["status"]
+                # Runs that are not due yet still get status changes for free
+                if poll["due_time"] is None or poll["due_time"] <= now or status_changed:
+                    poll["due_time"] = None
+                    poll["last_result"] = test_run_result
+                    poll["waiter"].set_result(test_run_result)
+
+    async def report_progress(self):
+        """Report progress periodically until cancelled."""
+        if self.progress is None:
+            return
+        while True:
+            await asyncio.sleep(self.progress.interval)
+            self.progress.report()
+
+    async def wait_for_test_completion_async(self, test_id, run_id, logger):
+        """Wait test for completion without blocking the event loop.
+
+        Args:
+            test_id (int): Loadero test id
+            run_id (int): Loadero test run id
+            logger (Logger): Logger object runner-worker
+
+        Returns:
+            dict: Loadero test run result dictionary
+        """
+        loop = asyncio.get_running_loop()
+        status = None
+        test_run_result = None
+        attempt = 0
+        status_changed_time = time.time()
+        self.registry.add(test_id, run_id)
+        self.__polls[run_id] = {"due_time": None, "waiter": None, "last_result": None}
+        try:
+            while status is None or status in ACTIVE_STATUSES:
+                self.__polls[run_id]["waiter"] = loop.create_future()
+                self.schedule_poll(run_id, self.poll_policy.next_interval(
+                    test_run_result, attempt, time.time() - status_changed_time))
+                test_run_result = await self.__polls[run_id]["waiter"]
+                new_status = test_run_result["status"]
+                attempt += 1
+                if status != new_status:
+                    logger.debug(
+                        f"Running Loadero test: {test_id} run: {run_id}. Status: {new_status}")
+                    attempt = 0
+                    status_changed_time = time.time()
+                status = new_status
+        finally:
+            self.registry.remove(run_id)
+            self.__polls.pop(run_id, None)
+        return test_run_result
+
+    async def acquire_launch_slot(self, test_id):
+        """Wait until the scheduler admits test.
+
+        Args:
+            test_id (int): Loadero test id
+        """
+        async with self.__launch_slots:
+            await self.__launch_slots.wait_for(lambda: self.scheduler.admit(test_id))
+            # Admission changes the queue head, let the next test check again
+            self.__launch_slots.notify_all()
+
+    async def release_launch_slot(self, test_id):
+        """Release scheduler capacity of a finished test.
+
+        Args:
+            test_id (int): Loadero test id
+        """
+        async with self.__launch_slots:
+            self.scheduler.release(test_id)
+            self.__launch_slots.notify_all()
+
+    async def run_test_async(self, test_id, semaphore, resumed_run=None):
+        """Run test on the event loop.
+
+        Args:
+            test_id (int): Loadero test id
+            semaphore (asyncio.Semaphore): Limits concurrent API calls
+            resumed_run (dict or None): Run id and start time of the run to reattach to
+
+        Returns:
+            dict: Loadero test run result dictionary
+        """
+        worker_logger = Logger(logging.getLogger(f"runner-worker-{test_id}"), self.level)
+        run_id = None
+        if resumed_run is None:
+            await self.acquire_launch_slot(test_id)
+            launch_time = time.time()
+            RUN_QUEUE_WAIT.observe(launch_time - self.__start_time)
+        else:
+            # The scheduler counts the resumed run as running already
+            run_id = resumed_run["run_id"]
+            launch_time = resumed_run["start_time"]
+        self.__tests[test_id] = {"run_id": None, "launch_time": launch_time, "attempts": []}
+        if self.progress is not None:
+            self.progress.launch(test_id, launch_time)
+        try:
+            retries = 0
+            while True:
+                test_run_result = await self.run_attempt_async(test_id, semaphore, worker_logger, run_id)
+                self.__tests[test_id]["attempts"].append(test_run_result)
+                if not self.retry_policy.should_retry(test_run_result, retries):
+                    break
+                retries += 1
+                self.log_retry(test_run_result, retries, worker_logger)
+                await asyncio.sleep(self.retry_policy.delay)
+                run_id = None
+        finally:
+            await self.release_launch_slot(test_id)
+        return test_run_result
+
+    async def run_attempt_async(self, test_id, semaphore, logger, run_id=None):
+        """Launch a run of test and wait for its completion within the test timeout.
+
+        Args:
+            test_id (int): Loadero test id
+            semaphore (asyncio.Semaphore): Limits concurrent API calls
+            logger (Logger): Logger object runner-worker
+            run_id (int or None): Loadero test run id to reattach to instead of launching a run
+
+        Returns:
+            dict: Loadero test run result dictionary
+        """
+        # Relaunches share the timeout of the test, counted from its first launch
+        test_timeout = self.test_timeouts.get(test_id)
+        test = self.__tests[test_id]
+        relaunch = test["run_id"] is not None
+        if run_id is None:
+            if test_timeout is not None and test_timeout <= time.time() - test["launch_time"]:
+                raise asyncio.TimeoutError
+            async with semaphore:
+                run_id = await asyncio.to_thread(self.start_test, test_id, logger)
+            self.count_api_calls()
+            action = "Relaunched" if relaunch else "Created"
+        else:
+            action = "Reattached"
+        test["run_id"] = run_id
+        self.record_launch(test_id, run_id, test["launch_time"])
+        self.logger.info(f"{action} test task for test {test_id} and run {run_id}.")
+        if not relaunch:
+            if sum(t["run_id"] is not None for t in self.__tests.values()) == self.__test_count:
+                self.logger.info(
+                    f"All {self.__test_count} test runs started in {time.time() - self.__start_time:.2f}s.")
+
+        if test_timeout is not None:
+            test_timeout -= time.time() - test["launch_time"]
+        try:
+            # Loop timers keep the deadlines, so only the overdue test is stopped
+            return await asyncio.wait_for(
+                self.wait_for_test_completion_async(test_id, run_id, logger), test_timeout)
+        except asyncio.TimeoutError:
+            try:
+                async with semaphore:
+                    await asyncio.to_thread(self.stop_test, test_id, run_id, logger)
+                self.count_api_calls()
+            except (APIException, HTTPError) as e:
+                self.logger.error(f"Failed to stop test: {test_id} run: {run_id}: {e}")
+            raise
+
+    async def run_tests_async(self, project_id, test_ids, timeout):
+        """Run tests on the event loop.
+
+        Args:
+            project_id (int): Loadero project id
+            test_ids (list): List of Loadero test ids
+            timeout (int): Timeout
+        """
+        start_time = time.time()
+        self.__start_time = start_time
+        self.__test_count = len(test_ids)
+        semaphore = asyncio.Semaphore(self.config.concurrency)
+        self.__poller_wakeup = asyncio.Event()
+        self.__launch_slots = asyncio.Condition()
+        resumed_runs = self.open_journal(project_id, test_ids)
+        test_ids = list(resumed_runs) + self.order_tests(
+            [test_id for test_id in test_ids if test_id not in resumed_runs])
+        self.scheduler.enqueue(test_ids[len(resumed_runs):])
+        # Runs that are already executing on Loadero take their capacity right away
+        for test_id in resumed_runs:
+            self.scheduler.attach(test_id)
+        poller = asyncio.create_task(self.poll_runs(semaphore))
+        progress_reporter = asyncio.create_task(self.report_progress())
+        tasks = {}
+        for test_id in test_ids:
+            tasks[test_id] = asyncio.create_task(
+                self.run_test_async(test_id, semaphore, resumed_runs.get(test_id)))
+        test_ids_by_task = {task: test_id for test_id, task in tasks.items()}
+        outcomes = {"passed": 0, "failed": 0, "aborted": 0, "quarantined": 0}
+        self.report_writer.start()
+        self.start_progress(test_ids)
+
+        # Report tests as they finish, so partial results survive a crash
+        pending = set(tasks.values())
+        # Why the remaining tests were aborted, if they were
+        reason = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=start_time + int(timeout) - time.time(), return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                reason = "timeout"
+                break
+            for task in done:
+                outcomes[self.report_test_task(project_id, test_ids_by_task[task], task)] += 1
+            if pending and self.failure_limit_reached(outcomes):
+                reason = f"{outcomes['failed']} failed test/s"
+                break
+
+        if pending:
+            self.logger.error(f"Aborting script due to {reason}!")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            stops = []
+            for task in pending:
+                run_id = self.__tests.get(test_ids_by_task[task], {}).get("run_id")
+                if run_id is not None:
+                    stops.append(asyncio.to_thread(
+                        self.stop_test, test_ids_by_task[task], run_id, self.logger))
+            await asyncio.gather(*stops, return_exceptions=True)
+            self.count_api_calls(len(stops))
+            for task in pending:
+                outcomes[self.report_test_task(project_id, test_ids_by_task[task], task, reason)] += 1
+
+        poller.cancel()
+        progress_reporter.cancel()
+        await asyncio.gather(poller, progress_reporter, return_exceptions=True)
+        if self.progress is not None:
+            self.progress.report()
+
+        self.logger.info(
+            f"Tests execution completed! Total tests: {len(tasks)}. Passed test count: {outcomes['passed']}. "
+            f"Failed test count: {outcomes['failed']}. Skipped test count: {outcomes['aborted']}. "
+            f"Quarantined test count: {outcomes['quarantined']}.")
+        end_time = time.time()
+        self.logger.info(f"Duration: {end_time - start_time}s.")
+        self.close_journal()
+
+    def report_test_task(self, project_id, test_id, task, reason=None):
+        """Add finished test task to the report.
+
+        Args:
+            project_id (int): Loadero project id
+            test_id (int): Loadero test id
+            task (asyncio.Task): Finished or cancelled test task
+            reason (string or None): Why the task was cancelled, None if it finished
+
+        Returns:
+            string: Test outcome: passed, failed, quarantined or aborted
+        """
+        test = self.__tests.get(test_id, {"run_id": None, "launch_time": None, "attempts": None})
+        run_id = test["run_id"]
+        test_run_result = None
+        if reason is None and task.exception() is None:
+            test_run_result = task.result()
+        elapsed_sec = run_duration(test_run_result)
+        if elapsed_sec is None and test["launch_time"] is not None:
+            elapsed_sec = time.time() - test["launch_time"]
+        test_case = TestCase(name=f'Loadero project id: {project_id} test id: {test_id}', elapsed_sec=elapsed_sec)
+
+        if reason is not None and run_id is None:
+            outcome = "aborted"
+            self.logger.error(f"Test: {test_id} was not started due to {reason}!")
+            test_case.add_error_info(f"Test: {test_id} was not started due to {reason}!")
+        elif reason is not None:
+            outcome = "aborted"
+            self.logger.error(f"Test: {test_id} run: {run_id} was terminated due to {reason}!")
+            test_case.add_error_info(f"Test: {test_id} Run: {run_id} was terminated due to {reason}!")
+        elif isinstance(task.exception(), asyncio.TimeoutError):
+            outcome = "aborted"
+            self.logger.error(f"Test: {test_id} run: {run_id} was terminated due to test timeout!")
+            test_case.add_error_info(f"Test: {test_id} Run: {run_id} was terminated due to test timeout!")
+        elif test_run_result is None:
+            outcome = "failed"
+            self.logger.error(f"Test: {test_id} run: {run_id} raised {task.exception()!r}.")
+            test_case.add_failure_info(f"Test: {test_id} Run: {run_id} failed.")
+        elif self.check_result(test_run_result, self.logger):
+            outcome = "passed"
+        elif self.is_quarantined(test_id):
+            outcome = "quarantined"
+            self.logger.error(f"Test: {test_id} run: {run_id} failed, but the test is quarantined.")
+            test_case.add_skipped_info(f"Test: {test_id} Run: {run_id} failed, but the test is quarantined.")
+        else:
+            outcome = "failed"
+            test_case.add_failure_info(f"Test: {test_id} Run: {run_id} failed.")
+
+        if test_run_result is not None:
+            self.record_duration(test_id, time.time() - test["launch_time"], outcome)
+            if run_duration(test_run_result) is not None:
+                RUN_DURATION.observe(run_duration(test_run_result), test_id=test_id)
+        self.record_attempts(test_id, test["attempts"])
+        self.finish_progress(test_id, outcome)
+        self.report_writer.add(test_case)
+        return outcome
+
+    def run_tests(self, project_id, test_ids, timeout):
+        """Run tests.
+
+        Args:
+            project_id (int): Loadero project id
+            test_ids (list): List of Loadero test ids
+            timeout (int): Timeout
+        """
+        try:
+            asyncio.run(self.run_tests_async(project_id, test_ids, timeout))
+        except RuntimeError:
+            self.logger.error(
+                "Runner Exception Occured!")
+
+    @property
+    def concurrency(self) -> int:
+        return self.config.concurrency
@@ -0,0 +1,49 @@
+import json
+import os
+import uuid
+
+
+def read_json_file(path):
+    """Reads JSON file if it exists.
+
+    Args:
+        path (string): Path to the file
+
+    Returns:
+        dict: File content or an empty dictionary if the file does not exist
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.loads(f.read())
+
+
+def write_text_file(path, text):
+    """Writes file atomically through a temporary file and a rename, so it is never left partially written.
+
+    The temporary file is created with the same mode open uses, so the file
+    gets the permissions a file created by open would get.
+
+    Args:
+        path (string): Path to the file
+        text (string): File content
+    """
+    temp_path = f"{os.path.abspath(path)}.{uuid.uuid4().hex}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def write_json_file(path, content):
+    """Writes JSON file atomically through a temporary file and a rename.
+
+    Args:
+        path (string): Path to the file
+        content (dict): File content
+    """
+    write_text_file(path, json.dumps(content, indent=2, sort_keys=True) + "\n")
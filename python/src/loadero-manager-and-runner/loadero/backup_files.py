@@ -0,0 +1,176 @@
+import os
+import threading
+
+from loadero.atomic_file import read_json_file, write_json_file, write_text_file
+from loadero.backup_manifest import HASHES_FILE_NAME, text_hash
+from loadero.remote_manager import RemoteManager
+from loadero.scheduler import count_compute_units, test_timeout
+
+
+class BackupFiles:
+    """BackupFiles class writes backup files atomically and records hashes of their content.
+
+    Hashes are kept with the file size and modification time in a sidecar
+    file of every directory, so an unchanged file is recognized without
+    reading it. Recorded hashes are written to the sidecar files by flush.
+    """
+    __file_hashes = None
+    __changed_directories = None
+    __lock = None
+
+    def __init__(self) -> None:
+        self.__file_hashes = {}
+        self.__changed_directories = set()
+        self.__lock = threading.Lock()
+
+    def write(self, absolute_path, text):
+        """Writes file atomically and records hash of its content.
+
+        Args:
+            absolute_path (string): A path where the file should be stored
+            text (string): File content
+        """
+        write_text_file(absolute_path, text)
+        self.record_hash(absolute_path, text)
+
+    def read_hashes(self, directory):
+        """Reads hashes of the files written to directory from its sidecar file.
+
+        Args:
+            directory (string): Directory path
+
+        Returns:
+            dict: Content hash, size and modification time dictionaries by file name
+        """
+        if directory not in self.__file_hashes:
+            self.__file_hashes[directory] = read_json_file(os.path.join(directory, HASHES_FILE_NAME))
+        return self.__file_hashes[directory]
+
+    def record_hash(self, absolute_path, text):
+        """Records hash of file content together with the file size and modification time.
+
+        Args:
+            absolute_path (string): File path
+            text (string): File content
+        """
+        directory, file_name = os.path.split(absolute_path)
+        stat = os.stat(absolute_path)
+        with self.__lock:
+            file_hashes = self.read_hashes(directory)
+            file_hashes[file_name] = {"hash": text_hash(text), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            self.__changed_directories.add(directory)
+
+    def flush(self):
+        """Writes the hashes recorded since the last flush to the sidecar files of their directories."""
+        with self.__lock:
+            for directory in sorted(self.__changed_directories):
+                write_json_file(os.path.join(directory, HASHES_FILE_NAME), self.__file_hashes[directory])
+            self.__changed_directories.clear()
+
+    def is_unchanged(self, absolute_path, text):
+        """Check if file already has the content without reading it.
+
+        The recorded hash is trusted only while the file size and modification
+        time are the ones recorded with it, so files changed by hand are
+        still compared by content.
+
+        Args:
+            absolute_path (string): File path
+            text (string): File content
+
+        Returns:
+            bool: True if the recorded hash of the file matches the content
+        """
+        directory, file_name = os.path.split(absolute_path)
+        with self.__lock:
+            recorded = self.read_hashes(directory).get(file_name)
+        if recorded is None:
+            return False
+        stat = os.stat(absolute_path)
+        return stat.st_size == recorded["size"] and stat.st_mtime_ns == recorded["mtime_ns"] \
+            and text_hash(text) == recorded["hash"]
+
+
+def write_test_tree(local_manager, project_name, tree):
+    """Writes test with its script, groups, participants, asserts and assert preconditions to files.
+
+    Args:
+        local_manager (LocalManager): Manager of the local backup
+        project_name (string): Loadero project name
+        tree (dict): Test tree with test, script, groups, participants, asserts and asserts_preconditions keys
+    """
+    test_id = tree["test"]["id"]
+    test_name = tree["test"]["name"]
+    local_manager.create_test_directory(project_name, test_id, test_name)
+    test_path = local_manager.get_test_directory(project_name, test_id, test_name)
+    local_manager.write_to_file(f"{test_path}/test.json", tree["test"], test_id)
+    local_manager.write_script_content_to_file(project_name, tree["script"], test_id, test_name)
+    for file_name in ["groups", "participants", "asserts", "asserts_preconditions"]:
+        local_manager.write_to_file(f"{test_path}/{file_name}.json", tree[file_name], test_id)
+    local_manager.flush_file_hashes()
+
+
+def read_test_values(local_manager, test_ids, read_local, read_remote):
+    """Reads a value of every test from the local backup, or from Loadero if the test is not backed up.
+
+    Args:
+        local_manager (LocalManager): Manager of the local backup
+        test_ids (list): List of Loadero test ids
+        read_local (function): Reads value by project id, project name, test id and test name
+        read_remote (function): Reads value by RemoteManager and test id
+
+    Returns:
+        dict: Values by test id
+    """
+    project_id = int(local_manager.project_id)
+    project_name = None
+    local_tests = {}
+    if os.path.exists(local_manager.test_cases_path):
+        project_name = local_manager.get_project_name_from_test_cases(project_id)
+        if project_name is not None:
+            for test in local_manager.get_tests_from_test_cases(project_id, project_name):
+                local_tests[test["id"]] = test["name"]
+
+    values = {}
+    for test_id in test_ids:
+        if test_id in local_tests:
+            values[test_id] = read_local(project_id, project_name, test_id, local_tests[test_id])
+        else:
+            values[test_id] = read_remote(local_manager.get_remote_manager(), test_id)
+    return values
+
+
+def read_compute_units(local_manager, test_ids):
+    """Counts compute units of tests from the local groups.json and participants.json files, or from Loadero.
+
+    Args:
+        local_manager (LocalManager): Manager of the local backup
+        test_ids (list): List of Loadero test ids
+
+    Returns:
+        dict: Compute units by test id
+    """
+    return read_test_values(
+        local_manager,
+        test_ids,
+        lambda *test: count_compute_units(
+            local_manager.read_groups_from_file(*test), local_manager.read_participants_from_file(*test)),
+        RemoteManager.read_test_compute_units)
+
+
+def read_test_timeouts(local_manager, test_ids, margin):
+    """Derives test run timeouts from the local test.json files, or from Loadero.
+
+    Args:
+        local_manager (LocalManager): Manager of the local backup
+        test_ids (list): List of Loadero test ids
+        margin (float): Seconds added for run initialization and result collection
+
+    Returns:
+        dict: Test run timeouts in seconds by test id
+    """
+    return read_test_values(
+        local_manager,
+        test_ids,
+        lambda *test: test_timeout(local_manager.read_test_from_file(*test), margin),
+        lambda remote_manager, test_id: test_timeout(remote_manager.read_test(test_id), margin))
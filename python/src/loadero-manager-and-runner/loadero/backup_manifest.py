@@ -0,0 +1,102 @@
+import hashlib
+import os
+import threading
+
+from loadero.atomic_file import read_json_file, write_json_file
+
+MANIFEST_FILE_NAME = "manifest.json"
+
+# Sidecar file with hashes of the files LocalManager wrote to a directory
+HASHES_FILE_NAME = ".hashes.json"
+
+
+def text_hash(text):
+    """Hashes text.
+
+    Args:
+        text (string): Text
+
+    Returns:
+        string: SHA-256 hex digest
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def file_hash(path):
+    """Hashes file content.
+
+    Args:
+        path (string): Path to the file
+
+    Returns:
+        string: SHA-256 hex digest or None if the file does not exist
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class BackupManifest:
+    """BackupManifest class records the backed up state of every test in the project directory.
+
+    For every test it keeps the test's updated timestamp and the content hash
+    of every backup file. A test whose updated timestamp has not changed and
+    whose backup files are intact does not have to be fetched again. Changes
+    of groups, participants, asserts and assert preconditions are only seen
+    if they update the test's updated timestamp, so the manifest is only
+    used by incremental backups, restores and clones.
+    """
+    __path = None
+    __tests = None
+    __lock = None
+
+    def __init__(self, path: str) -> None:
+        self.__path = path
+        self.__tests = read_json_file(path).get("tests", {})
+        self.__lock = threading.Lock()
+
+    def is_unchanged(self, test, test_path):
+        """Check if backup of test is up to date.
+
+        Args:
+            test (dict): Loadero test dictionary from the test list
+            test_path (string): Path to the test directory
+
+        Returns:
+            bool: True if test was not updated since the last backup and its backup files were not changed
+        """
+        entry = self.__tests.get(str(test["id"]))
+        if entry is None or entry["updated"] != test.get("updated") or entry["name"] != test["name"]:
+            return False
+        return all(file_hash(os.path.join(test_path, file_name)) == content_hash
+                   for file_name, content_hash in entry["files"].items())
+
+    def record(self, test, test_path):
+        """Records backup of test.
+
+        Args:
+            test (dict): Loadero test dictionary from the test list
+            test_path (string): Path to the test directory
+        """
+        files = {}
+        for file_name in sorted(os.listdir(test_path)):
+            if file_name.startswith("."):
+                continue
+            files[file_name] = file_hash(os.path.join(test_path, file_name))
+        with self.__lock:
+            self.__tests[str(test["id"])] = {"name": test["name"], "updated": test.get("updated"), "files": files}
+
+    def save(self):
+        """Saves manifest."""
+        with self.__lock:
+            write_json_file(self.__path, {"tests": self.__tests})
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def tests(self) -> dict:
+        return dict(self.__tests)
@@ -0,0 +1,364 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from urllib.parse import urljoin, urlsplit
+
+import urllib3
+from loadero_python.api_client import APIException
+
+from loadero.logger import Logger
+from loadero.metrics import API_LATENCY
+from loadero.rate_limiter import TokenBucket
+from loadero.retry_policy import RequestRetryPolicy
+
+# Same as loadero_python APIClient defaults
+DEFAULT_API_BASE = "https://api.loadero.com/v2/"
+DEFAULT_POOL_SIZE = 4
+DEFAULT_TIMEOUT = 30.0
+# Requests are not throttled unless a rate is set
+DEFAULT_RATE = None
+DEFAULT_BURST = 4
+# Connection errors are retried by urllib3, but response statuses only by RequestRetryPolicy,
+# otherwise urllib3 would send rate limited requests with a Retry-After header again itself
+CONNECTION_RETRIES = urllib3.Retry(3, respect_retry_after_header=False)
+
+
+def route_template(url):
+    """Gets route of request URL with ids left out, so requests to the same endpoint share it.
+
+    Args:
+        url (string): Request URL
+
+    Returns:
+        string: URL path with every numeric path segment replaced by :id
+    """
+    return re.sub(r"/\d+(?=/|$)", "/:id", urlsplit(url).path)
+
+
+class ProjectClient:
+    """ProjectClient class sends Loadero API requests of one project through the connection pool of its factory.
+
+    It has the get, post, put and delete methods of the loadero_python
+    APIClient. APIClient is a process wide singleton bound to a single
+    project, so API calls are made with a ProjectClient of every project
+    instead, which lets calls to different projects run at the same time.
+    Requests and responses are converted with the params classes of
+    loadero_python.
+    """
+    __factory = None
+    __project_id = None
+    __access_token = None
+    __api_base = None
+
+    def __init__(self, factory, project_id, access_token, api_base=DEFAULT_API_BASE) -> None:
+        self.__factory = factory
+        self.__project_id = project_id
+        self.__access_token = access_token
+        self.__api_base = api_base
+
+    def request(self, method, route, body=None, query_params=None):
+        """Sends request and decodes its JSON response.
+
+        Args:
+            method (string): HTTP method
+            route (string): Loadero API route or URL
+            body (dict or None): Request JSON body of POST and PUT requests
+            query_params (list or None): Query parameters of GET requests
+
+        Raises:
+            APIException: If the request fails or the response is not JSON
+
+        Returns:
+            dict or None: Decoded response or None if the response is empty
+        """
+        headers = {"Authorization": "LoaderoAuth " + self.__access_token}
+        kwargs = {"fields": query_params} if method == "GET" else {}
+        if method in ["POST", "PUT"]:
+            headers["Content-Type"] = "application/json"
+            kwargs["body"] = "" if body is None else json.dumps(body)
+        response = self.__factory.pool().request(
+            self.__project_id, method, urljoin(self.__api_base, route), headers=headers, **kwargs)
+
+        if response.status // 100 != 2:
+            raise APIException(f"Loadero API request failed: {response.data}")
+
+        if len(response.data) == 0:
+            return None
+
+        if "application/json" not in response.headers.get("Content-Type", ""):
+            raise APIException(
+                f"Loadero API returned content type other that 'application/json': "
+                f"{response.headers.get('Content-Type')}")
+
+        return json.loads(response.data)
+
+    def get(self, route, query_params=None):
+        """Sends GET request.
+
+        Args:
+            route (string): Loadero API route or URL
+            query_params (list or None): Query parameters
+
+        Returns:
+            dict or None: Decoded response
+        """
+        return self.request("GET", route, query_params=query_params)
+
+    def post(self, route, body):
+        """Sends POST request.
+
+        Args:
+            route (string): Loadero API route or URL
+            body (dict or None): Request JSON body
+
+        Returns:
+            dict or None: Decoded response
+        """
+        return self.request("POST", route, body)
+
+    def put(self, route, body):
+        """Sends PUT request.
+
+        Args:
+            route (string): Loadero API route or URL
+            body (dict): Request JSON body
+
+        Returns:
+            dict or None: Decoded response
+        """
+        return self.request("PUT", route, body)
+
+    def delete(self, route):
+        """Sends DELETE request.
+
+        Args:
+            route (string): Loadero API route or URL
+        """
+        self.request("DELETE", route)
+
+    @property
+    def project_id(self) -> int:
+        return self.__project_id
+
+    @property
+    def access_token(self) -> str:
+        return self.__access_token
+
+    @property
+    def api_base(self) -> str:
+        return self.__api_base
+
+    @property
+    def project_route(self) -> str:
+        return f"projects/{self.__project_id}/"
+
+
+class ThrottledPool:
+    """ThrottledPool class sends requests through a connection pool within the rate limit of their project.
+
+    Requests rejected by the rate limit or failed with a server error are
+    sent again as the project's RequestRetryPolicy allows, honoring the
+    Retry-After header. A rate limited request of a throttled project holds
+    back every other request of the project too. The latency of every sent request is observed by
+    API_LATENCY.
+    """
+    __pool = None
+    __factory = None
+    __logger = None
+    __pid = None
+
+    def __init__(self, pool, factory) -> None:
+        self.__pool = pool
+        self.__factory = factory
+        self.__logger = Logger(logging.getLogger("api-client"), "info")
+        self.__pid = os.getpid()
+
+    def request(self, project_id, method, url, **kwargs):
+        """Sends request.
+
+        Args:
+            project_id (int): Loadero project id the request is sent to
+            method (string): HTTP method
+            url (string): Request URL
+            kwargs (dict): urllib3 request arguments
+
+        Returns:
+            HTTPResponse: Response of the last attempt
+        """
+        bucket, retry_policy = self.__factory.limits(project_id)
+        retries = 0
+        while True:
+            if bucket is not None:
+                bucket.acquire()
+            with API_LATENCY.time(method=method, endpoint=route_template(url)):
+                response = self.__pool.request(method, url, **kwargs)
+            if not retry_policy.should_retry(method, response.status, retries):
+                return response
+
+            delay = retry_policy.delay(response.headers.get("Retry-After"), retries)
+            response.drain_conn()
+            retries += 1
+            self.__logger.info(
+                f"Loadero API {method} request failed with status code {response.status}, "
+                f"sending it again in {delay:.1f}s (retry {retries}/{retry_policy.max_retries}).")
+            if response.status == 429 and bucket is not None:
+                bucket.pause(delay)
+            else:
+                time.sleep(delay)
+
+    @property
+    def pool(self) -> urllib3.PoolManager:
+        return self.__pool
+
+    @property
+    def pid(self) -> int:
+        return self.__pid
+
+
+class ClientFactory:
+    """ClientFactory class hands out Loadero API clients of projects with one keep-alive connection pool per process.
+
+    The factory keeps one ProjectClient per project, and every client sends
+    its requests through the same connection pool, so TCP/TLS connections are
+    reused by every RemoteManager, LocalManager and Runner of the process,
+    also by calls to different projects made at the same time. Child
+    processes get their own pool.
+
+    Requests of projects with a rate are throttled by a token bucket per
+    project and process, so child processes are limited each on their own.
+    Requests are sent again on rate limit and server errors. Both are
+    configurable per project.
+    """
+    __pool_size = None
+    __timeout = None
+    __limits = None
+    __buckets = None
+    __clients = None
+    __pool = None
+    __lock = None
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT) -> None:
+        self.__timeout = timeout
+        self.__limits = {}
+        self.__clients = {}
+        self.configure(pool_size)
+
+    def configure(self, pool_size=DEFAULT_POOL_SIZE, rate=DEFAULT_RATE, burst=DEFAULT_BURST, retry_policy=None):
+        """Configures connection pool, dropping the current one, and the default limits of projects.
+
+        Args:
+            pool_size (int): Maximum number of kept-alive connections
+            rate (float or None): Maximum average requests per second of a project, not limited if None
+            burst (int): Maximum requests of a project sent at once before the rate applies
+            retry_policy (RequestRetryPolicy or None): Retry policy of failed requests
+        """
+        if pool_size < 1:
+            raise ValueError("ClientFactory pool size must be greater than 0.")
+
+        self.__pool_size = pool_size
+        # Limits of projects that are not configured separately
+        self.__limits[None] = {"rate": rate, "burst": burst, "retry_policy": retry_policy or RequestRetryPolicy()}
+        self.__reset()
+
+    def configure_project(self, project_id, rate=None, burst=None, retry_policy=None):
+        """Configures limits of project, unset limits fall back to the defaults.
+
+        Args:
+            project_id (int): Loadero project id
+            rate (float or None): Maximum average requests per second
+            burst (int or None): Maximum requests sent at once before the rate applies
+            retry_policy (RequestRetryPolicy or None): Retry policy of failed requests
+        """
+        self.__limits[str(project_id)] = {"rate": rate, "burst": burst, "retry_policy": retry_policy}
+        self.__buckets.pop(str(project_id), None)
+
+    def limits(self, project_id):
+        """Gets rate limiter and retry policy of project.
+
+        Args:
+            project_id (int): Loadero project id
+
+        Returns:
+            tuple: TokenBucket or None if the project is not throttled, and RequestRetryPolicy
+        """
+        project_limits = self.__limits.get(str(project_id), {})
+        default_limits = self.__limits[None]
+        rate = project_limits.get("rate") or default_limits["rate"]
+        with self.__lock:
+            if str(project_id) not in self.__buckets:
+                self.__buckets[str(project_id)] = None if rate is None else TokenBucket(
+                    rate, project_limits.get("burst") or default_limits["burst"])
+            bucket = self.__buckets[str(project_id)]
+        return bucket, project_limits.get("retry_policy") or default_limits["retry_policy"]
+
+    def __reset(self):
+        self.__pool = None
+        self.__lock = threading.Lock()
+        self.__buckets = {}
+
+    def pool(self):
+        """Gets connection pool of the current process, creating it if it does not exist.
+
+        Returns:
+            ThrottledPool: Rate limited urllib3 pool manager
+        """
+        if self.__pool is not None and self.__pool.pid != os.getpid():
+            self.__reset()
+        if self.__pool is None:
+            self.__pool = ThrottledPool(urllib3.PoolManager(
+                maxsize=self.__pool_size, timeout=urllib3.Timeout(total=self.__timeout), block=True,
+                retries=CONNECTION_RETRIES), self)
+        return self.__pool
+
+    def client(self, access_token, project_id):
+        """Gets API client of project, creating it on first use.
+
+        Args:
+            access_token (string or None): Project access token, the last one used for project by default
+            project_id (int): Loadero project id
+
+        Returns:
+            ProjectClient: Loadero API client of the project
+        """
+        # Child processes replace the lock along with the pool before using it
+        self.pool()
+        with self.__lock:
+            api_client = self.__clients.get(str(project_id))
+            if api_client is None or access_token not in [None, api_client.access_token]:
+                api_client = ProjectClient(self, project_id, access_token)
+                self.__clients[str(project_id)] = api_client
+        return api_client
+
+    @property
+    def pool_size(self) -> int:
+        return self.__pool_size
+
+    @property
+    def timeout(self) -> float:
+        return self.__timeout
+
+
+CLIENTS = ClientFactory()
+
+
+def configure_clients(pool_size=None, rate=None, burst=None, max_retries=None, parallel_calls=1):
+    """Configures the API client connection pool and default project limits.
+
+    Unset pool size and burst are sized to the parallel API calls, so they
+    do not hold back the workers or concurrency they are configured with.
+
+    Args:
+        pool_size (int or None): Maximum number of kept-alive connections
+        rate (float or None): Maximum average requests per second of a project, not limited if None
+        burst (int or None): Maximum requests of a project sent at once before the rate applies
+        max_retries (int or None): Maximum times a rate limited or failed request is sent again
+        parallel_calls (int): Maximum number of API calls the process makes at the same time
+    """
+    CLIENTS.configure(
+        pool_size or max(DEFAULT_POOL_SIZE, parallel_calls),
+        rate=rate,
+        burst=burst or max(DEFAULT_BURST, parallel_calls),
+        retry_policy=None if max_retries is None else RequestRetryPolicy(max_retries))
@@ -0,0 +1,172 @@
+from loadero.atomic_file import read_json_file, write_json_file
+
+
+class RunHistory:
+    """RunHistory class keeps observed run durations per test id in a local file."""
+    __path = None
+    __max_samples = None
+    __durations = None
+
+    def __init__(
+        self,
+        path: str = "run_history.json",
+        max_samples: int = 10
+    ) -> None:
+        if max_samples < 1:
+            raise ValueError("RunHistory must keep at least one sample.")
+
+        self.__path = path
+        self.__max_samples = max_samples
+        self.__durations = {}
+        self.load()
+
+    def load(self):
+        """Loads run durations from the history file if it exists."""
+        self.__durations = read_json_file(self.__path)
+
+    def save(self):
+        """Writes run durations to the history file atomically."""
+        write_json_file(self.__path, self.__durations)
+
+    def record(self, test_id, duration):
+        """Records observed run duration of test and saves the history.
+
+        Args:
+            test_id (int): Loadero test id
+            duration (float): Run duration in seconds
+        """
+        samples = self.__durations.setdefault(str(test_id), [])
+        samples.append(round(duration, 3))
+        del samples[:-self.__max_samples]
+        self.save()
+
+    def expected_duration(self, test_id):
+        """Gets expected run duration of test.
+
+        Args:
+            test_id (int): Loadero test id
+
+        Returns:
+            float: Average of the recorded run durations or None if the test has no history
+        """
+        samples = self.__durations.get(str(test_id))
+        if not samples:
+            return None
+        return sum(samples) / len(samples)
+
+    def order_longest_first(self, test_ids):
+        """Orders tests by expected run duration, longest first.
+
+        Tests without history are expected to be the longest, so they are
+        started first and their duration gets known for the next runs.
+
+        Args:
+            test_ids (list): List of Loadero test ids
+
+        Returns:
+            list: List of Loadero test ids
+        """
+        def sort_key(test_id):
+            duration = self.expected_duration(test_id)
+            return (duration is not None, -(duration or 0))
+        return sorted(test_ids, key=sort_key)
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def durations(self) -> dict:
+        return dict(self.__durations)
+
+
+class FlakinessLedger:
+    """FlakinessLedger class keeps the last run statuses per test id in a local file.
+
+    A test is quarantined while its infrastructure failures within the kept
+    runs reach the quarantine threshold.
+    """
+    __path = None
+    __window = None
+    __quarantine_threshold = None
+    __runs = None
+
+    def __init__(
+        self,
+        path: str = "flakiness.json",
+        window: int = 10,
+        quarantine_threshold: int or None = None
+    ) -> None:
+        if window < 1:
+            raise ValueError("FlakinessLedger must keep at least one run.")
+
+        if quarantine_threshold is not None and quarantine_threshold < 1:
+            raise ValueError("FlakinessLedger quarantine threshold must be greater than 0.")
+
+        self.__path = path
+        self.__window = window
+        self.__quarantine_threshold = quarantine_threshold
+        self.__runs = {}
+        self.load()
+
+    def load(self):
+        """Loads runs from the ledger file if it exists."""
+        self.__runs = read_json_file(self.__path)
+
+    def save(self):
+        """Writes runs to the ledger file atomically."""
+        write_json_file(self.__path, self.__runs)
+
+    def record(self, test_id, test_run_results, infra_failures):
+        """Records finished runs of test and saves the ledger.
+
+        Args:
+            test_id (int): Loadero test id
+            test_run_results (list): Loadero test run result dictionaries of every attempt
+            infra_failures (list): True for every attempt that failed for infrastructure reasons
+        """
+        runs = self.__runs.setdefault(str(test_id), [])
+        for test_run_result, infra_failure in zip(test_run_results, infra_failures):
+            runs.append({"run_id": test_run_result["id"], "status": test_run_result["status"],
+                         "infra_failure": infra_failure})
+        del runs[:-self.__window]
+        self.save()
+
+    def infra_failures(self, test_id):
+        """Counts infrastructure failures of test within the kept runs.
+
+        Args:
+            test_id (int): Loadero test id
+
+        Returns:
+            int: Infrastructure failure count
+        """
+        return sum(1 for run in self.__runs.get(str(test_id), []) if run["infra_failure"])
+
+    def is_quarantined(self, test_id):
+        """Check if test is quarantined.
+
+        Args:
+            test_id (int): Loadero test id
+
+        Returns:
+            bool: True if the quarantine threshold is set and reached
+        """
+        return self.__quarantine_threshold is not None and \
+            self.infra_failures(test_id) >= self.__quarantine_threshold
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def window(self) -> int:
+        return self.__window
+
+    @property
+    def quarantine_threshold(self) -> int:
+        return self.__quarantine_threshold
+
+    @property
+    def runs(self) -> dict:
+        return dict(self.__runs)
@@ -0,0 +1,130 @@
+import threading
+
+from loadero.atomic_file import read_json_file, write_json_file
+
+
+class RunJournal:
+    """RunJournal class records launched runs in a local state file.
+
+    The journal is written on every launch, so a runner that is restarted
+    after a crash can reattach to the runs that are still executing on
+    Loadero instead of launching them again.
+    """
+    __path = None
+    __state = None
+
+    def __init__(self, path: str = "runner_state.json") -> None:
+        self.__path = path
+        self.__state = read_json_file(path)
+
+    def start(self, project_id):
+        """Starts a new journal for project, dropping the previous one.
+
+        Args:
+            project_id (int): Loadero project id
+        """
+        self.__state = {"project_id": int(project_id), "finished": False, "runs": {}}
+        write_json_file(self.__path, self.__state)
+
+    def record(self, test_id, run_id, start_time):
+        """Records launched run of test and saves the journal.
+
+        Args:
+            test_id (int): Loadero test id
+            run_id (int): Loadero test run id
+            start_time (float): Time when the test was launched
+        """
+        self.__state["runs"][str(test_id)] = {"run_id": run_id, "start_time": start_time}
+        write_json_file(self.__path, self.__state)
+
+    def finish(self):
+        """Marks journal as finished, so there is nothing to reattach to."""
+        self.__state["finished"] = True
+        write_json_file(self.__path, self.__state)
+
+    def read_runs(self, project_id):
+        """Reads runs of an unfinished journal of project.
+
+        Args:
+            project_id (int): Loadero project id
+
+        Returns:
+            dict: Run id and start time dictionaries by test id
+        """
+        if not self.__state or self.__state["finished"] or self.__state["project_id"] != int(project_id):
+            return {}
+        return {int(test_id): run for test_id, run in self.__state["runs"].items()}
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+
+class RestoreJournal:
+    """RestoreJournal class records Loadero objects created by restore in a local state file.
+
+    Every created object is written to the journal before restore goes on,
+    and the objects of a test are dropped from it once the test is restored.
+    Objects left in the journal by a failed or interrupted restore can be
+    deleted from Loadero, so no partially restored test is left behind.
+    """
+    __path = None
+    __state = None
+    __lock = None
+
+    def __init__(self, path: str = "restore_journal.json") -> None:
+        self.__path = path
+        self.__state = read_json_file(path)
+        self.__lock = threading.Lock()
+
+    def record(self, project_id, journaled_object):
+        """Records created object and saves the journal.
+
+        Args:
+            project_id (int): Loadero project id
+            journaled_object (dict): Created object with its kind (test, groups, participants, asserts or
+                asserts_preconditions), id, test_id and assert_id of an assert precondition
+        """
+        with self.__lock:
+            self.__state.setdefault(str(project_id), []).append(journaled_object)
+            write_json_file(self.__path, self.__state)
+
+    def commit(self, project_id, test_id):
+        """Drops objects of restored test from the journal.
+
+        Args:
+            project_id (int): Loadero project id
+            test_id (int): Loadero test id
+        """
+        self.remove(project_id, [o for o in self.read_objects(project_id) if o["test_id"] == test_id])
+
+    def remove(self, project_id, objects):
+        """Drops objects from the journal, e.g. after they were deleted from Loadero.
+
+        Args:
+            project_id (int): Loadero project id
+            objects (list): Journaled object dictionaries
+        """
+        with self.__lock:
+            remaining = [o for o in self.__state.get(str(project_id), []) if o not in objects]
+            if remaining:
+                self.__state[str(project_id)] = remaining
+            else:
+                self.__state.pop(str(project_id), None)
+            write_json_file(self.__path, self.__state)
+
+    def read_objects(self, project_id):
+        """Reads objects of project in the order they were created.
+
+        Args:
+            project_id (int): Loadero project id
+
+        Returns:
+            list: Journaled object dictionaries
+        """
+        with self.__lock:
+            return list(self.__state.get(str(project_id), []))
+
+    @property
+    def path(self) -> str:
+        return self.__path
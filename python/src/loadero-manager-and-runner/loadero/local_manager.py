@@ -2,15 +2,12 @@ import json
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import inquirer
-from loadero_python.resources.assert_precondition import AssertPreconditionAPI
-from loadero_python.resources.assert_resource import AssertAPI
-from loadero_python.resources.group import GroupAPI
-from loadero_python.resources.participant import ParticipantAPI
-from loadero_python.resources.project import Project
-from loadero_python.resources.test import Script, Test
+from loadero_python.resources.test import Script
 
+from loadero.backup_files import BackupFiles
 from loadero.logger import Logger
 
 from .remote_manager import RemoteManager
@@ -24,6 +21,8 @@ class LocalManager:
     __level = None
     __logger = None
     __test_cases_path = None
+    __remote_manager = None
+    __backup_files = None
 
     def __init__(
         self,
@@ -43,6 +42,17 @@ class LocalManager:
         self.__level = level
         self.__logger = Logger(logging.getLogger("local-manager"), level)
         self.__test_cases_path = test_cases_path
+        self.__backup_files = BackupFiles()
+
+    def get_remote_manager(self):
+        """Gets RemoteManager of the project, creating it on first use.
+
+        Returns:
+            RemoteManager: RemoteManager object
+        """
+        if self.__remote_manager is None:
+            self.__remote_manager = RemoteManager(self.__access_token, self.__project_id, self.__level)
+        return self.__remote_manager
 
     def create_project_directory(self, project_name):
         """Creates a project directory in the test_cases directory.
@@ -59,6 +69,30 @@ class LocalManager:
             self.__logger.debug(
                 f"Directory for project id [{self.__project_id}] already exists!")
 
+    def get_project_directory(self, project_name):
+        """Gets absolute path of the project directory.
+
+        Args:
+            project_name (string): Loadero project name
+
+        Returns:
+            string: Absolute path of the project directory
+        """
+        return os.path.abspath(f"{self.__test_cases_path}/{str(self.__project_id)}_{project_name}")
+
+    def get_test_directory(self, project_name, test_id, test_name):
+        """Gets absolute path of the test directory.
+
+        Args:
+            project_name (string): Loadero project name
+            test_id (int): Loadero test id
+            test_name (string): Loadero test name
+
+        Returns:
+            string: Absolute path of the test directory
+        """
+        return os.path.join(self.get_project_directory(project_name), f"{str(test_id)}_{test_name}")
+
     def create_test_directory(self, project_name, test_id, test_name):
         """Creates a test directory in the project directory.
 
@@ -102,14 +136,14 @@ class LocalManager:
             content_json = content
 
         if not os.path.exists(absolute_path):
-            with open(absolute_path, "w", encoding="utf-8") as f:
-                f.write(content_json)
-                f.write("\n")
+            self.__backup_files.write(absolute_path, content_json + "\n")
             if file_name_no_ext in ['test.json', 'script', 'groups.json', 'participants.json',
                                     'asserts.json', 'asserts_preconditions.json']:
                 self.__logger.debug(f"{file_name} for test id [{loadero_id}] is created!")
             else:
                 self.__logger.debug(f"{file_name} for project id [{loadero_id}] is created!")
+        elif self.__backup_files.is_unchanged(absolute_path, content_json + "\n"):
+            self.__logger.debug(f"{file_name} for id [{loadero_id}] is unchanged!")
         else:
             with open(absolute_path, "r", encoding="utf-8") as f:
                 read_content = f.read()
@@ -118,14 +152,18 @@ class LocalManager:
                 else:
                     read_content_json = read_content
             if content != read_content_json:
-                with open(absolute_path, "w", encoding="utf-8") as f:
-                    f.write(content_json)
-                    f.write("\n")
+                self.__backup_files.write(absolute_path, content_json + "\n")
                 if file_name_no_ext in ['test.json', 'groups.json', 'participants.json', 'asserts.json',
                                         'asserts_preconditions.json']:
                     self.__logger.debug(f"{file_name} for test id [{loadero_id}] is updated!")
                 else:
                     self.__logger.debug(f"{file_name} for project id [{loadero_id}] is updated!")
+            else:
+                self.__backup_files.record_hash(absolute_path, content_json + "\n")
+
+    def flush_file_hashes(self):
+        """Writes hashes of the files written since the last flush to their sidecar files."""
+        self.__backup_files.flush()
 
     def write_project_to_file(self, project_name, suites):
         """Reads project from Loadeo API and writes it to a file.
@@ -137,7 +175,7 @@ class LocalManager:
         Returns:
             dict: Loadero project dictionary
         """
-        project = Project().read().params.to_dict_full()
+        project = self.get_remote_manager().read_project()
 
         absolute_path = os.path.abspath(
             f"{self.__test_cases_path}/{str(self.__project_id)}_{project_name}/"
@@ -168,6 +206,7 @@ class LocalManager:
             local_project['manager_config'] = manager_config
 
         self.write_to_file(absolute_path, local_project, self.__project_id)
+        self.flush_file_hashes()
         return project
 
     def init_project(self, suites):
@@ -178,8 +217,7 @@ class LocalManager:
         """
         self.__logger.info("Initializing Loadero project...")
 
-        remote_manager = RemoteManager(self.__access_token, self.__project_id, self.__level)
-        project_name = remote_manager.read_project()["name"]
+        project_name = self.get_remote_manager().read_project()["name"]
         self.create_project_directory(project_name)
         self.write_project_to_file(project_name, suites)
 
@@ -195,8 +233,21 @@ class LocalManager:
         Returns:
             string: Script content
         """
-        script_content = Script(script_file_id).read().content
+        script_content = self.get_remote_manager().read_script(script_file_id)
+        return self.write_script_content_to_file(project_name, script_content, test_id, test_name)
+
+    def write_script_content_to_file(self, project_name, script_content, test_id, test_name):
+        """Writes script to a file named by the script language.
+
+        Args:
+            project_name (string): Loadero project name
+            script_content (string): Script content
+            test_id (int): Loadero test id
+            test_name (string): Loadero test name
 
+        Returns:
+            string: Script content
+        """
         # If the latest char in script_contetnt is not "\n" add it
         if script_content[-1] != "\n":
             script_content += "\n"
@@ -210,8 +261,7 @@ class LocalManager:
             script_name = 'script.js'
         else:
             # Check project language
-            remote_manager = RemoteManager(self.__access_token, self.__project_id, self.__level)
-            project_lang = remote_manager.read_project()["language"]
+            project_lang = self.get_remote_manager().read_project()["language"]
             if project_lang == 'python':
                 script_name = 'script.py'
             elif project_lang == 'java':
@@ -224,16 +274,18 @@ class LocalManager:
         absolute_path = os.path.abspath(f"{self.__test_cases_path}/{str(self.__project_id)}_{project_name}/"
                                         f"{str(test_id)}_{test_name}/{script_name}")
         if not os.path.exists(absolute_path):
-            with open(absolute_path, "w", encoding="utf-8") as f:
-                f.write(script_content)
+            self.__backup_files.write(absolute_path, script_content)
             self.__logger.debug(f"{script_name} file for test id [{test_id}] is created!")
+        elif self.__backup_files.is_unchanged(absolute_path, script_content):
+            self.__logger.debug(f"{script_name} file for test id [{test_id}] is unchanged!")
         else:
             with open(absolute_path, "r", encoding="utf-8") as f:
                 response = f.read()
             if script_content != response:
-                with open(absolute_path, "w", encoding="utf-8") as f:
-                    f.write(script_content)
+                self.__backup_files.write(absolute_path, script_content)
                 self.__logger.debug(f"{script_name} file for test id [{test_id}] is updated!")
+            else:
+                self.__backup_files.record_hash(absolute_path, script_content)
         return script_content
 
     def write_test_to_file(self, project_name, test_id, test_name):
@@ -247,7 +299,7 @@ class LocalManager:
          Returns:
             dict: Loadero test object
         """
-        test = Test(test_id).read().params.to_dict_full()
+        test = self.get_remote_manager().read_test(test_id)
         test.pop('script', None)
         absolute_path = os.path.abspath(
             f"{self.__test_cases_path}/{str(self.__project_id)}_{project_name}/{str(test_id)}_{test_name}/test.json")
@@ -265,7 +317,7 @@ class LocalManager:
          Returns:
             list: List of Loadero group objects
         """
-        groups = GroupAPI().read_all(test_id).to_dict_full()["results"]
+        groups = self.get_remote_manager().read_all_groups(test_id)
         absolute_path = os.path.abspath(
             f"{self.__test_cases_path}/{str(self.__project_id)}_{project_name}/{str(test_id)}_{test_name}/groups.json")
         self.write_to_file(absolute_path, groups, test_id)
@@ -282,7 +334,7 @@ class LocalManager:
          Returns:
             list: List of Loadero participant objects
         """
-        participants = ParticipantAPI().read_all(test_id).to_dict_full()["results"]
+        participants = self.get_remote_manager().read_all_participants(test_id)
         absolute_path = os.path.abspath(
             f"{self.__test_cases_path}/{str(self.__project_id)}_{project_name}/"
             f"{str(test_id)}_{test_name}/participants.json")
@@ -300,31 +352,38 @@ class LocalManager:
         Returns:
             list: List of Loadero assert objects
         """
-        asserts = AssertAPI().read_all(test_id).to_dict_full()["results"]
+        asserts = self.get_remote_manager().read_all_asserts(test_id)
         absolute_path = os.path.abspath(
             f"{self.__test_cases_path}/{str(self.__project_id)}_{project_name}/{str(test_id)}_{test_name}/asserts.json")
         self.write_to_file(absolute_path, asserts, test_id)
         return asserts
 
-    def write_asserts_preconditons_to_file(self, project_name, test_id, test_name, asserts):
+    def write_asserts_preconditons_to_file(self, project_name, test, asserts, workers):
         """Reads assert preconditions and writes them to a file.
 
+        Preconditions of up to workers asserts are read at the same time,
+        the file lists them in the order of the asserts.
+
         Args:
             project_name (string): Loadero project name
-            test_id (int): Loadero test id
-            test_name (string): Loadero test name
+            test (dict): Loadero test object with id and name
             asserts (list): List of Loadero assert objects returned from the API
+            workers (int): Maximum number of parallel API calls
         """
+        test_id = test["id"]
+        remote_manager = self.get_remote_manager()
         asserts_ids = []
         for a in asserts:
             asserts_ids.append(a["id"])
         all_asserts_preconditons = {}
-        for assert_id in asserts_ids:
-            assert_preconditons = AssertPreconditionAPI.read_all(test_id, assert_id).to_dict_full()["results"]
-            all_asserts_preconditons[f"{assert_id}"] = assert_preconditons
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            all_preconditions = executor.map(
+                lambda assert_id: remote_manager.read_all_assert_preconditions(test_id, assert_id), asserts_ids)
+            for assert_id, assert_preconditons in zip(asserts_ids, all_preconditions):
+                all_asserts_preconditons[f"{assert_id}"] = assert_preconditons
         absolute_path = os.path.abspath(
             f"{self.__test_cases_path}/{str(self.__project_id)}_{project_name}/"
-            f"{str(test_id)}_{test_name}/asserts_preconditions.json")
+            f"{str(test_id)}_{test['name']}/asserts_preconditions.json")
         self.write_to_file(absolute_path, all_asserts_preconditons, test_id)
 
     def read_from_file(self, absolute_path, loadero_id):
@@ -0,0 +1,236 @@
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from loadero.atomic_file import write_text_file
+
+# Seconds, from single API calls up to hour long test runs
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+
+def escape_label_value(value):
+    """Escapes label value for the Prometheus text format.
+
+    Args:
+        value (object): Label value
+
+    Returns:
+        string: Escaped label value
+    """
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_number(value):
+    """Formats number for the Prometheus text format.
+
+    Args:
+        value (float): Number
+
+    Returns:
+        string: Formatted number
+    """
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class Histogram:
+    """Histogram class counts observed values in cumulative buckets by label values."""
+    __name = None
+    __help = None
+    __label_names = None
+    __buckets = None
+    __series = None
+    __lock = None
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS
+    ) -> None:
+        self.__name = name
+        self.__help = help_text
+        self.__label_names = tuple(label_names)
+        self.__buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self.__series = {}
+        self.__lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        """Observes value.
+
+        Args:
+            value (float): Observed value
+            labels (dict): Label values by label name
+        """
+        label_values = tuple(str(labels[label_name]) for label_name in self.__label_names)
+        with self.__lock:
+            series = self.__series.setdefault(
+                label_values, {"buckets": [0] * len(self.__buckets), "sum": 0.0, "count": 0})
+            for i, bucket in enumerate(self.__buckets):
+                if value <= bucket:
+                    series["buckets"][i] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observes seconds spent in the with block.
+
+        Args:
+            labels (dict): Label values by label name
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start_time, **labels)
+
+    def render(self):
+        """Renders histogram in the Prometheus text format.
+
+        Returns:
+            list: List of lines
+        """
+        lines = [f"# HELP {self.__name} {self.__help}", f"# TYPE {self.__name} histogram"]
+        with self.__lock:
+            for label_values, series in sorted(self.__series.items()):
+                labels = [f'{name}="{escape_label_value(value)}"'
+                          for name, value in zip(self.__label_names, label_values)]
+                for bucket, count in zip(self.__buckets, series["buckets"]):
+                    bucket_labels = ",".join(labels + [f'le="{format_number(bucket)}"'])
+                    lines.append(f"{self.__name}_bucket{{{bucket_labels}}} {count}")
+                series_labels = "{" + ",".join(labels) + "}" if labels else ""
+                lines.append(f"{self.__name}_sum{series_labels} {format_number(series['sum'])}")
+                lines.append(f"{self.__name}_count{series_labels} {series['count']}")
+        return lines
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def label_names(self) -> tuple:
+        return self.__label_names
+
+
+class MetricsRegistry:
+    """MetricsRegistry class keeps histograms and exports them to a textfile or over HTTP.
+
+    The textfile can be picked up by node_exporter textfile collector, the
+    HTTP endpoint can be scraped by Prometheus while the CLI is running.
+    """
+    __histograms = None
+    __server = None
+
+    def __init__(self) -> None:
+        self.__histograms = {}
+
+    def histogram(self, name, help_text, label_names=(), buckets=DEFAULT_BUCKETS):
+        """Gets histogram by name, creating it if it does not exist.
+
+        Args:
+            name (string): Metric name
+            help_text (string): Metric description
+            label_names (tuple): Label names
+            buckets (tuple): Bucket upper bounds
+
+        Returns:
+            Histogram: Histogram object
+        """
+        if name not in self.__histograms:
+            self.__histograms[name] = Histogram(name, help_text, label_names, buckets)
+        return self.__histograms[name]
+
+    def render(self):
+        """Renders all metrics in the Prometheus text format.
+
+        Returns:
+            string: Metrics
+        """
+        lines = []
+        for name in sorted(self.__histograms):
+            lines.extend(self.__histograms[name].render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Writes all metrics to file atomically.
+
+        Args:
+            path (string): Path to the metrics file
+        """
+        write_text_file(path, self.render())
+
+    def serve(self, port, address=""):
+        """Serves metrics over HTTP from a background thread.
+
+        Args:
+            port (int): Port to listen on
+            address (string): Address to listen on, all interfaces by default
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                content = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                pass
+
+        self.__server = ThreadingHTTPServer((address, port), MetricsHandler)
+        threading.Thread(target=self.__server.serve_forever, daemon=True).start()
+
+    def shutdown(self):
+        """Stops serving metrics over HTTP."""
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+    @property
+    def histograms(self) -> dict:
+        return dict(self.__histograms)
+
+
+METRICS = MetricsRegistry()
+
+API_LATENCY = METRICS.histogram(
+    "loadero_api_request_duration_seconds", "Loadero API request latency by HTTP method and route.",
+    ("method", "endpoint"))
+RUN_QUEUE_WAIT = METRICS.histogram(
+    "loadero_run_queue_wait_seconds", "Seconds a test waited in the runner queue before it was launched.")
+RUN_DURATION = METRICS.histogram(
+    "loadero_run_duration_seconds", "Loadero test run execution duration by test id.", ("test_id",))
+BACKUP_DURATION = METRICS.histogram(
+    "loadero_backup_test_duration_seconds", "Seconds spent backing up a test by test id.", ("test_id",))
+RESTORE_DURATION = METRICS.histogram(
+    "loadero_restore_test_duration_seconds", "Seconds spent restoring a test by test id and restore action.",
+    ("test_id", "action"))
+
+
+def start_exporter(port):
+    """Starts serving metrics over HTTP if port is set.
+
+    Args:
+        port (int or None): Port to listen on
+    """
+    if port is not None:
+        METRICS.serve(port)
+
+
+def stop_exporter(path):
+    """Writes metrics textfile if path is set and stops serving metrics over HTTP.
+
+    Args:
+        path (string or None): Path to the metrics file
+    """
+    if path is not None:
+        METRICS.write_textfile(path)
+    METRICS.shutdown()
@@ -0,0 +1,154 @@
+import random
+from abc import ABC, abstractmethod
+
+from loadero_python.resources.classificator import RunStatus
+
+# Same statuses Run.poll of loadero_python stops polling at
+FINAL_STATUSES = [
+    RunStatus.RS_ABORTED,
+    RunStatus.RS_AWS_ERROR,
+    RunStatus.RS_DB_ERROR,
+    RunStatus.RS_INSUFFICIENT_RESOURCES,
+    RunStatus.RS_NO_USERS,
+    RunStatus.RS_SERVER_ERROR,
+    RunStatus.RS_TIMEOUT_EXCEEDED,
+    RunStatus.RS_DONE,
+]
+
+ACTIVE_STATUSES = [status.value for status in RunStatus if status not in FINAL_STATUSES]
+
+# Runs leave these statuses quickly, so they are never read rarely
+STATUS_MAX_INTERVALS = {
+    RunStatus.RS_PENDING.value: 10,
+    RunStatus.RS_INITIALIZING.value: 10,
+    RunStatus.RS_STOPPING.value: 5,
+    RunStatus.RS_WAITING_RESULTS.value: 5,
+    RunStatus.RS_COLLECTING_RESULTS.value: 5,
+}
+
+
+class PollPolicy(ABC):
+    """PollPolicy class decides how long to wait before the next run status read."""
+
+    @abstractmethod
+    def next_interval(self, test_run_result, attempt, elapsed):
+        """Get the number of seconds to wait before the next run status read.
+
+        Args:
+            test_run_result (dict or None): Last read Loadero test run result dictionary, None before the first read
+            attempt (int): Number of reads since the run status last changed
+            elapsed (float): Seconds since the run status last changed
+
+        Returns:
+            float: Seconds to wait
+        """
+
+
+class FixedPollPolicy(PollPolicy):
+    """FixedPollPolicy class polls at a fixed interval regardless of run status."""
+    __interval = None
+
+    def __init__(self, interval: float = 10) -> None:
+        if interval <= 0:
+            raise ValueError("FixedPollPolicy interval must be greater than 0.")
+
+        self.__interval = interval
+
+    def next_interval(self, test_run_result, attempt, elapsed):
+        return self.__interval
+
+    @property
+    def interval(self) -> float:
+        return self.__interval
+
+
+class BackoffPollPolicy(PollPolicy):
+    """BackoffPollPolicy class polls with exponential backoff and jitter.
+
+    The backoff restarts on every status change, so transitions are picked up
+    quickly while long stable phases are read rarely. Intervals of statuses in
+    STATUS_MAX_INTERVALS are capped lower.
+    """
+    __minimum = None
+    __maximum = None
+    __factor = None
+    __jitter = None
+
+    def __init__(self, minimum: float = 1, maximum: float = 60, factor: float = 2, jitter: float = 0.1) -> None:
+        if minimum <= 0 or maximum < minimum:
+            raise ValueError("BackoffPollPolicy must be initialized with 0 < minimum <= maximum.")
+
+        if factor < 1:
+            raise ValueError("BackoffPollPolicy factor must be at least 1.")
+
+        self.__minimum = minimum
+        self.__maximum = maximum
+        self.__factor = factor
+        self.__jitter = jitter
+
+    def next_interval(self, test_run_result, attempt, elapsed):
+        status = test_run_result["status"] if test_run_result else None
+        maximum = min(self.__maximum, STATUS_MAX_INTERVALS.get(status, self.__maximum))
+        return self.jittered(self.__minimum * self.__factor ** attempt, maximum)
+
+    def jittered(self, interval, maximum=None):
+        """Spread interval randomly by the jitter fraction so runs are not read in lockstep.
+
+        Args:
+            interval (float): Interval in seconds
+            maximum (float): Upper bound of the interval, defaults to the policy maximum
+
+        Returns:
+            float: Jittered interval in seconds
+        """
+        interval *= random.uniform(1 - self.__jitter, 1 + self.__jitter)
+        return max(self.__minimum, min(interval, maximum or self.__maximum))
+
+    @property
+    def minimum(self) -> float:
+        return self.__minimum
+
+    @property
+    def maximum(self) -> float:
+        return self.__maximum
+
+
+class EtaPollPolicy(BackoffPollPolicy):
+    """EtaPollPolicy class polls running tests based on their expected finish time.
+
+    The expected duration of a running test is its start_interval plus
+    participant_timeout. The policy waits half of the remaining time, so reads
+    become denser as the run approaches its expected finish. Other statuses
+    fall back to exponential backoff.
+    """
+
+    def next_interval(self, test_run_result, attempt, elapsed):
+        if not test_run_result or test_run_result["status"] != "running":
+            return super().next_interval(test_run_result, attempt, elapsed)
+
+        eta = (test_run_result.get("start_interval") or 0) + (test_run_result.get("participant_timeout") or 0)
+        remaining = eta - elapsed
+        if remaining <= 0:
+            return super().next_interval(test_run_result, 0, elapsed)
+        return self.jittered(remaining / 2)
+
+
+def create_poll_policy(name, interval=10, max_interval=60):
+    """Create poll policy by name.
+
+    Args:
+        name (string): Poll policy name: fixed, backoff, eta
+        interval (float): Interval for fixed policy
+        max_interval (float): Maximum interval for backoff and eta policies
+
+    Returns:
+        PollPolicy: Poll policy object
+    """
+    match name.lower():
+        case "fixed":
+            return FixedPollPolicy(interval)
+        case "backoff":
+            return BackoffPollPolicy(maximum=max_interval)
+        case "eta":
+            return EtaPollPolicy(maximum=max_interval)
+    raise ValueError(f"Unknown poll policy: {name}.")
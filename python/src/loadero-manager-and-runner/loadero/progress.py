@@ -0,0 +1,253 @@
+import json
+import logging
+import sys
+import time
+
+from loadero.logger import Logger
+
+
+class ProgressTracker:
+    """ProgressTracker class keeps run statuses, outcomes and API calls of the tests of one runner session.
+
+    Tests are queued until they are launched, tests without an expected
+    duration are expected to take as long as an average test.
+    """
+    __statuses = None
+    __outcomes = None
+    __launch_times = None
+    __expected_durations = None
+    __api_calls = None
+    __start_time = None
+
+    def __init__(self, test_ids: list or None = None, expected_durations: dict or None = None) -> None:
+        self.__statuses = {test_id: "queued" for test_id in test_ids or []}
+        self.__outcomes = {}
+        self.__launch_times = {}
+        self.__expected_durations = {
+            test_id: duration for test_id, duration in (expected_durations or {}).items() if duration is not None}
+        self.__api_calls = 0
+        self.__start_time = time.time()
+
+    def launch(self, test_id, launch_time=None):
+        """Records launch of test.
+
+        Args:
+            test_id (int): Loadero test id
+            launch_time (float or None): Time when the test was launched, now by default
+        """
+        self.__launch_times[test_id] = launch_time or time.time()
+        self.__statuses[test_id] = "launched"
+
+    def set_status(self, test_id, status):
+        """Records run status of test.
+
+        Args:
+            test_id (int): Loadero test id
+            status (string): Loadero run status
+        """
+        self.__statuses[test_id] = status
+
+    def finish(self, test_id, outcome):
+        """Records outcome of finished test.
+
+        Args:
+            test_id (int): Loadero test id
+            outcome (string): Test outcome: passed, failed, quarantined or aborted
+        """
+        self.__outcomes[test_id] = outcome
+
+    def count_api_calls(self, count=1):
+        """Counts API calls made by the runner.
+
+        Args:
+            count (int): Number of API calls
+        """
+        self.__api_calls += count
+
+    def expected_remaining_time(self):
+        """Estimates seconds until every test is finished from the expected run durations.
+
+        Running tests are expected to take what is left of their expected
+        duration, queued tests their whole expected duration shared between the
+        tests running at the same time.
+
+        Returns:
+            float: Estimated seconds or None if there is no expected duration of unfinished tests
+        """
+        known_durations = list(self.__expected_durations.values())
+        if not known_durations:
+            return None
+        # Tests without history are expected to take as long as an average test
+        default_duration = sum(known_durations) / len(known_durations)
+
+        now = time.time()
+        running_remaining = []
+        queued_total = 0
+        for test_id in self.__statuses:
+            if test_id in self.__outcomes:
+                continue
+            expected_duration = self.__expected_durations.get(test_id, default_duration)
+            if test_id in self.__launch_times:
+                running_remaining.append(max(expected_duration - (now - self.__launch_times[test_id]), 0))
+            else:
+                queued_total += expected_duration
+
+        parallel = max(len(running_remaining), 1)
+        return max(running_remaining, default=0) + queued_total / parallel
+
+    def snapshot(self):
+        """Gets current progress.
+
+        Returns:
+            dict: Progress dictionary
+        """
+        now = time.time()
+        elapsed = max(now - self.__start_time, 1e-9)
+        status_counts = {}
+        for status in self.__statuses.values():
+            status_counts[status] = status_counts.get(status, 0) + 1
+        outcome_counts = {}
+        for outcome in self.__outcomes.values():
+            outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
+        eta = self.expected_remaining_time()
+        return {
+            "time": now,
+            "elapsed": round(elapsed, 3),
+            "total": len(self.__statuses),
+            "finished": len(self.__outcomes),
+            "statuses": status_counts,
+            "outcomes": outcome_counts,
+            "runs_per_minute": round(len(self.__outcomes) / elapsed * 60, 3),
+            "api_calls": self.__api_calls,
+            "api_calls_per_second": round(self.__api_calls / elapsed, 3),
+            "eta": None if eta is None else round(eta, 3),
+        }
+
+    @property
+    def api_calls(self) -> int:
+        return self.__api_calls
+
+
+class ProgressReporter:
+    """ProgressReporter class periodically reports run statuses, throughput and ETA of the runner.
+
+    It is fed by what the runner already knows from polling, so reporting
+    does not make any API calls. Reports are logged as text or written as
+    JSON lines to a file or standard output.
+    """
+    __mode = None
+    __interval = None
+    __path = None
+    __logger = None
+    __tracker = None
+    __last_report_time = None
+
+    def __init__(
+        self,
+        mode: str = "text",
+        interval: float = 10,
+        path: str or None = None,
+        level: str = "info"
+    ) -> None:
+        if mode not in ("text", "json"):
+            raise ValueError("ProgressReporter mode must be text or json.")
+
+        if interval <= 0:
+            raise ValueError("ProgressReporter interval must be greater than 0.")
+
+        self.__mode = mode
+        self.__interval = interval
+        self.__path = path
+        self.__logger = Logger(logging.getLogger("progress"), level)
+        self.__tracker = ProgressTracker()
+
+    def start(self, test_ids, expected_durations=None):
+        """Starts reporting progress of tests.
+
+        Args:
+            test_ids (list): List of Loadero test ids
+            expected_durations (dict or None): Expected run durations in seconds by test id
+        """
+        self.__tracker = ProgressTracker(test_ids, expected_durations)
+        self.__last_report_time = time.time()
+
+    def launch(self, test_id, launch_time=None):
+        """Records launch of test.
+
+        Args:
+            test_id (int): Loadero test id
+            launch_time (float or None): Time when the test was launched, now by default
+        """
+        self.__tracker.launch(test_id, launch_time)
+
+    def set_status(self, test_id, status):
+        """Records run status of test.
+
+        Args:
+            test_id (int): Loadero test id
+            status (string): Loadero run status
+        """
+        self.__tracker.set_status(test_id, status)
+
+    def finish(self, test_id, outcome):
+        """Records outcome of finished test.
+
+        Args:
+            test_id (int): Loadero test id
+            outcome (string): Test outcome: passed, failed, quarantined or aborted
+        """
+        self.__tracker.finish(test_id, outcome)
+
+    def count_api_calls(self, count=1):
+        """Counts API calls made by the runner.
+
+        Args:
+            count (int): Number of API calls
+        """
+        self.__tracker.count_api_calls(count)
+
+    def report(self):
+        """Reports current progress."""
+        self.__last_report_time = time.time()
+        progress = self.__tracker.snapshot()
+        if self.__mode == "json":
+            line = json.dumps(progress, sort_keys=True)
+            if self.__path is None:
+                sys.stdout.write(line + "\n")
+                sys.stdout.flush()
+            else:
+                with open(self.__path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            return
+
+        statuses = ", ".join(f"{status}: {count}" for status, count in sorted(progress["statuses"].items()))
+        eta = "unknown" if progress["eta"] is None else f"{progress['eta']:.0f}s"
+        self.__logger.info(
+            f"Progress: {progress['finished']}/{progress['total']} tests finished. Statuses: {statuses}. "
+            f"{progress['runs_per_minute']:.2f} runs/min, {progress['api_calls_per_second']:.2f} API calls/s. "
+            f"ETA: {eta}.")
+
+    def report_if_due(self):
+        """Reports current progress if the report interval has passed since the last report."""
+        if time.time() - self.__last_report_time >= self.__interval:
+            self.report()
+
+    @property
+    def mode(self) -> str:
+        return self.__mode
+
+    @property
+    def interval(self) -> float:
+        return self.__interval
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def tracker(self) -> ProgressTracker:
+        return self.__tracker
+
+    @property
+    def api_calls(self) -> int:
+        return self.__tracker.api_calls
@@ -0,0 +1,47 @@
+import copy
+import threading
+
+
+class ProjectCache:
+    """ProjectCache class keeps Loadero project metadata read during a session.
+
+    Project name and language, statics and metric paths do not change while
+    tests are backed up or restored, so they are read from the API once and
+    shared by every LocalManager and RemoteManager of the process.
+    """
+    __entries = None
+    __locks = None
+    __lock = None
+
+    def __init__(self) -> None:
+        self.__entries = {}
+        self.__locks = {}
+        self.__lock = threading.Lock()
+
+    def get(self, project_id, key, read):
+        """Gets cached value, reading it on first use.
+
+        Concurrent first uses of the same entry wait for a single read.
+
+        Args:
+            project_id (int or None): Loadero project id or None for values shared by all projects
+            key (string): Value name, e.g. project, statics or metric_path
+            read (function): Reads value from Loadero API
+
+        Returns:
+            object: Copy of the cached value
+        """
+        entry = (None if project_id is None else str(project_id), key)
+        with self.__lock:
+            entry_lock = self.__locks.setdefault(entry, threading.Lock())
+        with entry_lock:
+            if entry not in self.__entries:
+                self.__entries[entry] = read()
+            return copy.deepcopy(self.__entries[entry])
+
+    @property
+    def entries(self) -> dict:
+        return dict(self.__entries)
+
+
+PROJECT_CACHE = ProjectCache()
@@ -0,0 +1,66 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """TokenBucket class limits the request rate, allowing short bursts up to the bucket capacity.
+
+    Every request takes a token. Tokens are refilled at the rate, and a
+    request that finds the bucket empty reserves the next token and waits for
+    it, so waiting requests are let through in order.
+    """
+    __rate = None
+    __burst = None
+    __tokens = None
+    __updated = None
+    __lock = None
+
+    def __init__(self, rate: float = 4, burst: int = 4) -> None:
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be greater than 0.")
+
+        if burst < 1:
+            raise ValueError("TokenBucket burst must be greater than 0.")
+
+        self.__rate = rate
+        self.__burst = burst
+        self.__tokens = float(burst)
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __refill(self):
+        now = time.monotonic()
+        self.__tokens = min(self.__tokens + (now - self.__updated) * self.__rate, self.__burst)
+        self.__updated = now
+
+    def acquire(self):
+        """Takes a token, waiting until one is available.
+
+        Returns:
+            float: Seconds waited
+        """
+        with self.__lock:
+            self.__refill()
+            self.__tokens -= 1
+            wait = -self.__tokens / self.__rate if self.__tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds):
+        """Holds back all requests for seconds, e.g. after the API rejected a request by its rate limit.
+
+        Args:
+            seconds (float): Seconds to hold requests back
+        """
+        with self.__lock:
+            self.__refill()
+            self.__tokens = min(self.__tokens, 1 - seconds * self.__rate)
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    @property
+    def burst(self) -> int:
+        return self.__burst
@@ -1,17 +1,19 @@
 import logging
 
-from loadero_python.api_client import APIClient
-from loadero_python.resources.assert_precondition import (
-    AssertPrecondition, AssertPreconditionParams)
-from loadero_python.resources.assert_resource import (Assert, AssertAPI,
-                                                      AssertParams)
-from loadero_python.resources.group import Group, GroupParams
-from loadero_python.resources.participant import Participant, ParticipantParams
-from loadero_python.resources.project import Project, QueryParams
-from loadero_python.resources.run import RunFilterKey
-from loadero_python.resources.test import Test, TestAPI, TestParams
-
+from loadero_python.resources.assert_precondition import \
+    AssertPreconditionParams
+from loadero_python.resources.assert_resource import AssertParams
+from loadero_python.resources.group import GroupParams
+from loadero_python.resources.pagination import PagedResponse
+from loadero_python.resources.participant import ParticipantParams
+from loadero_python.resources.project import ProjectParams, QueryParams
+from loadero_python.resources.run import RunFilterKey, RunParams
+from loadero_python.resources.test import TestParams
+
+from loadero.client_factory import CLIENTS
 from loadero.logger import Logger
+from loadero.project_cache import PROJECT_CACHE
+from loadero.scheduler import count_compute_units
 
 
 class RemoteManager:
@@ -40,16 +42,24 @@ class RemoteManager:
         self.__level = level
         self.__logger = Logger(logging.getLogger("remote-manager"), level)
 
-        self.__api_client = APIClient(access_token=self.__access_token,
-                               project_id=self.__project_id)
+        self.__api_client = CLIENTS.client(self.__access_token, self.__project_id)
 
     def read_project(self):
+        """Reads project from the session cache, reading it from Loadero API on first use.
+
+        Returns:
+            dict: Loadero project
+        """
+        return PROJECT_CACHE.get(self.__project_id, "project", self.fetch_project)
+
+    def fetch_project(self):
         """Reads project from Loadero API.
 
         Returns:
             dict: Loadero project
         """
-        return Project().read().params.to_dict_full()
+        api_client = self.__api_client
+        return ProjectParams().from_dict(api_client.get(api_client.project_route)).to_dict_full()
 
     def create_test(self, test):
         """Creates test on Loadero.
@@ -60,8 +70,9 @@ class RemoteManager:
         Returns:
             int: Created Loadero test id
         """
+        api_client = self.__api_client
         test["mos_test"] = False
-        return Test(params=TestParams().from_dict(test)).create().params.to_dict_full()["id"]
+        return api_client.post(f"{api_client.project_route}tests/", TestParams().from_dict(test).to_dict())["id"]
 
     def update_test(self, test):
         """Updates test on Loadero.
@@ -72,18 +83,32 @@ class RemoteManager:
         Returns:
             int: Updated Loadero test id
         """
-        return Test(params=TestParams().from_dict(test)).update().params.to_dict_full()["id"]
+        api_client = self.__api_client
+        return api_client.put(
+            f"{api_client.project_route}tests/{test['id']}/", TestParams().from_dict(test).to_dict())["id"]
 
     def delete_test(self, test_id):
         """Deletes test on Loadero.
 
+        Args:
+            test_id (int): Loadero test id
+        """
+        api_client = self.__api_client
+        api_client.delete(f"{api_client.project_route}tests/{test_id}/")
+
+    def read_test(self, test_id):
+        """Reads test from Loadero.
+
         Args:
             test_id (int): Loadero test id
 
         Returns:
-            Test: Deleted Loadero test object
+            dict: Loadero test dictionary
         """
-        return Test(test_id).delete()
+        api_client = self.__api_client
+        test = TestParams().from_dict(api_client.get(f"{api_client.project_route}tests/{test_id}/"))
+        test.script.content = self.read_script(test.script.file_id)
+        return test.to_dict_full()
 
     def read_all_tests(self):
         """Reads all tests from Loadero.
@@ -91,9 +116,8 @@ class RemoteManager:
         Returns:
             list: List of all Loadero tests
         """
-        # APIClient should be reinitialized because of clone and sync actions
-        APIClient(access_token=self.__access_token, project_id=self.__project_id)
-        tests = TestAPI().read_all()
+        api_client = self.__api_client
+        tests = PagedResponse(TestParams).from_dict(api_client.get(f"{api_client.project_route}tests/"))
         all_tests = tests.to_dict_full()["results"]
         return all_tests
 
@@ -106,7 +130,10 @@ class RemoteManager:
         Returns:
             int: Created Loadero group id
         """
-        return Group(params=GroupParams().from_dict(group)).create().params.to_dict_full()["id"]
+        api_client = self.__api_client
+        return api_client.post(
+            f"{api_client.project_route}tests/{group['test_id']}/groups/",
+            GroupParams().from_dict(group).to_dict())["id"]
 
     def update_group(self, group):
         """Updates group on Loadero.
@@ -117,7 +144,10 @@ class RemoteManager:
         Returns:
             int: Updated Loadero group id
         """
-        return Group(params=GroupParams().from_dict(group)).update().params.to_dict_full()["id"]
+        api_client = self.__api_client
+        return api_client.put(
+            f"{api_client.project_route}tests/{group['test_id']}/groups/{group['id']}/",
+            GroupParams().from_dict(group).to_dict())["id"]
 
     def create_participant(self, participant):
         """Creates participant on Loadero.
@@ -128,7 +158,10 @@ class RemoteManager:
         Returns:
             int: Loadero participant id
         """
-        return Participant(params=ParticipantParams().from_dict(participant)).create().params.to_dict_full()["id"]
+        api_client = self.__api_client
+        return api_client.post(
+            f"{api_client.project_route}tests/{participant['test_id']}/participants/",
+            ParticipantParams().from_dict(participant).to_dict())["id"]
 
     def update_participant(self, participant):
         """Updates participant on Loadero.
@@ -139,7 +172,10 @@ class RemoteManager:
         Returns:
             int: Updated participant id
         """
-        return Participant(params=ParticipantParams().from_dict(participant)).update().params.to_dict_full()["id"]
+        api_client = self.__api_client
+        return api_client.put(
+            f"{api_client.project_route}tests/{participant['test_id']}/participants/{participant['id']}/",
+            ParticipantParams().from_dict(participant).to_dict())["id"]
 
     def create_assert(self, assert_):
         """Creates assert on Loadero.
@@ -150,7 +186,10 @@ class RemoteManager:
         Returns:
             int: Loadero assert id
         """
-        return Assert(params=AssertParams().from_dict(assert_)).create().params.to_dict_full()["id"]
+        api_client = self.__api_client
+        return api_client.post(
+            f"{api_client.project_route}tests/{assert_['test_id']}/asserts/",
+            AssertParams().from_dict(assert_).to_dict())["id"]
 
     def update_assert(self, assert_):
         """Updates assert on Loadero.
@@ -161,7 +200,10 @@ class RemoteManager:
         Returns:
             int: Updated Loadero assert id
         """
-        return Assert(params=AssertParams().from_dict(assert_)).update().params.to_dict_full()["id"]
+        api_client = self.__api_client
+        return api_client.put(
+            f"{api_client.project_route}tests/{assert_['test_id']}/asserts/{assert_['id']}/",
+            AssertParams().from_dict(assert_).to_dict())["id"]
 
     def read_all_asserts(self, test_id):
         """Reads asserts from Loadero.
@@ -172,7 +214,9 @@ class RemoteManager:
         Returns:
             list: List of all asserts
         """
-        asserts = AssertAPI.read_all(test_id)
+        api_client = self.__api_client
+        asserts = PagedResponse(AssertParams).from_dict(
+            api_client.get(f"{api_client.project_route}tests/{test_id}/asserts/"))
         all_asserts = asserts.to_dict_full()["results"]
         return all_asserts
 
@@ -185,8 +229,11 @@ class RemoteManager:
         Returns:
             dict: Loadero precondition dictionary
         """
-        return AssertPrecondition(params=AssertPreconditionParams().from_dict(precondition))\
-            .create().params.to_dict_full()
+        api_client = self.__api_client
+        return AssertPreconditionParams().from_dict(api_client.post(
+            f"{api_client.project_route}tests/{precondition['test_id']}/asserts/"
+            f"{precondition['assert_id']}/preconditions/",
+            AssertPreconditionParams().from_dict(precondition).to_dict())).to_dict_full()
 
     def update_assert_precondition(self, precondition):
         """Updates assert precondition on Loadero.
@@ -195,9 +242,107 @@ class RemoteManager:
             precondition (dict): Updated precondition dictionary
 
         Returns:
-            AssertPrecondition: Updated Loadero AssertPrecondition object
+            dict: Updated Loadero precondition dictionary
         """
-        return AssertPrecondition(params=AssertPreconditionParams().from_dict(precondition)).update()
+        api_client = self.__api_client
+        return AssertPreconditionParams().from_dict(api_client.put(
+            f"{api_client.project_route}tests/{precondition['test_id']}/asserts/"
+            f"{precondition['assert_id']}/preconditions/{precondition['id']}/",
+            AssertPreconditionParams().from_dict(precondition).to_dict())).to_dict_full()
+
+    def read_script(self, script_file_id):
+        """Reads test script from Loadero.
+
+        Args:
+            script_file_id (int): Loadero script file id
+
+        Returns:
+            string: Script content
+        """
+        api_client = self.__api_client
+        return api_client.get(f"{api_client.project_route}files/{script_file_id}/")["content"]
+
+    def read_all_groups(self, test_id):
+        """Reads groups of test from Loadero.
+
+        Args:
+            test_id (int): Loadero test id
+
+        Returns:
+            list: List of all groups
+        """
+        api_client = self.__api_client
+        return PagedResponse(GroupParams).from_dict(
+            api_client.get(f"{api_client.project_route}tests/{test_id}/groups/")).to_dict_full()["results"]
+
+    def read_all_participants(self, test_id):
+        """Reads participants of test from Loadero.
+
+        Args:
+            test_id (int): Loadero test id
+
+        Returns:
+            list: List of all participants
+        """
+        api_client = self.__api_client
+        return PagedResponse(ParticipantParams).from_dict(
+            api_client.get(f"{api_client.project_route}tests/{test_id}/participants/")).to_dict_full()["results"]
+
+    def read_all_assert_preconditions(self, test_id, assert_id):
+        """Reads preconditions of assert from Loadero.
+
+        Args:
+            test_id (int): Loadero test id
+            assert_id (int): Loadero assert id
+
+        Returns:
+            list: List of all assert preconditions
+        """
+        api_client = self.__api_client
+        return PagedResponse(AssertPreconditionParams).from_dict(api_client.get(
+            f"{api_client.project_route}tests/{test_id}/asserts/{assert_id}/preconditions/")).to_dict_full()["results"]
+
+    def delete_group(self, test_id, group_id):
+        """Deletes group on Loadero.
+
+        Args:
+            test_id (int): Loadero test id
+            group_id (int): Loadero group id
+        """
+        api_client = self.__api_client
+        api_client.delete(f"{api_client.project_route}tests/{test_id}/groups/{group_id}/")
+
+    def delete_participant(self, test_id, participant_id):
+        """Deletes participant on Loadero.
+
+        Args:
+            test_id (int): Loadero test id
+            participant_id (int): Loadero participant id
+        """
+        api_client = self.__api_client
+        api_client.delete(f"{api_client.project_route}tests/{test_id}/participants/{participant_id}/")
+
+    def delete_assert(self, test_id, assert_id):
+        """Deletes assert on Loadero.
+
+        Args:
+            test_id (int): Loadero test id
+            assert_id (int): Loadero assert id
+        """
+        api_client = self.__api_client
+        api_client.delete(f"{api_client.project_route}tests/{test_id}/asserts/{assert_id}/")
+
+    def delete_assert_precondition(self, test_id, assert_id, precondition_id):
+        """Deletes assert precondition on Loadero.
+
+        Args:
+            test_id (int): Loadero test id
+            assert_id (int): Loadero assert id
+            precondition_id (int): Loadero assert precondition id
+        """
+        api_client = self.__api_client
+        api_client.delete(
+            f"{api_client.project_route}tests/{test_id}/asserts/{assert_id}/preconditions/{precondition_id}/")
 
     # Helper functions
     def delete_tests(self, test_ids):
@@ -222,8 +367,27 @@ class RemoteManager:
             test_ids_list.append(test["id"])
         return test_ids_list
 
+    def read_test_compute_units(self, test_id):
+        """Counts compute units of test from Loadero groups and participants.
+
+        Args:
+            test_id (int): Loadero test id
+
+        Returns:
+            float: Compute units of the test
+        """
+        return count_compute_units(self.read_all_groups(test_id), self.read_all_participants(test_id))
+
     # Test generator
     def read_statics(self):
+        """Read statics from the session cache, reading them from Loadero API on first use.
+
+        Returns:
+            list: List of statics
+        """
+        return PROJECT_CACHE.get(None, "statics", self.fetch_statics)
+
+    def fetch_statics(self):
         """Read statics
 
         Returns:
@@ -234,6 +398,14 @@ class RemoteManager:
         return api_client.get(url)
 
     def read_metric_path(self):
+        """Read metric path from the session cache, reading it from Loadero API on first use.
+
+        Returns:
+            list: List of metric path
+        """
+        return PROJECT_CACHE.get(None, "metric_path", self.fetch_metric_path)
+
+    def fetch_metric_path(self):
         """Read metric path
 
         Returns:
@@ -268,15 +440,12 @@ class RemoteManager:
         Returns:
             list: List of test runs
         """
-        test_runs = Test(test_id).runs(query_params=QueryParams()
-                                       .limit(limit)
-                                       .offset(offset)
-                                       .filter(RunFilterKey.EXECUTION_FINISHED_FROM, limit)
-                                       .filter("order_by", "-id"))[0]
-        test_runs_ids = []
-        for test_run in test_runs:
-            test_runs_ids.append(test_run.params.to_dict_full())
-        return test_runs_ids
+        api_client = self.__api_client
+        query_params = QueryParams().limit(limit).offset(offset) \
+            .filter(RunFilterKey.EXECUTION_FINISHED_FROM, limit).filter("order_by", "-id")
+        test_runs = PagedResponse(RunParams).from_dict(
+            api_client.get(f"{api_client.project_route}tests/{test_id}/runs/", query_params.parse()))
+        return test_runs.to_dict_full()["results"]
 
     def read_all_test_run_results(self, test_id, run_id):
         """Read all test run results
@@ -0,0 +1,76 @@
+import os
+import shutil
+from datetime import datetime
+
+from junit_xml import TestSuite, to_xml_report_string
+
+from loadero.atomic_file import write_text_file
+
+
+def run_duration(test_run_result):
+    """Gets test run execution duration.
+
+    Args:
+        test_run_result (dict or None): Loadero test run result dictionary
+
+    Returns:
+        float: Execution duration in seconds or None if the run has not been executed
+    """
+    if not test_run_result:
+        return None
+    if "execution_started" not in test_run_result or "execution_finished" not in test_run_result:
+        return None
+    execution_started = datetime.fromisoformat(str(test_run_result["execution_started"]))
+    execution_finished = datetime.fromisoformat(str(test_run_result["execution_finished"]))
+    return (execution_finished - execution_started).total_seconds()
+
+
+class ReportWriter:
+    """ReportWriter class writes JUnit XML report incrementally.
+
+    The report is rewritten after every finished test through a temporary file
+    and a rename, so a crashed or killed runner leaves a valid report with all
+    results collected until then.
+    """
+    __report_dir = None
+    __file_name = None
+    __test_cases = None
+
+    def __init__(
+        self,
+        report_dir: str = "reports",
+        file_name: str = "report.xml"
+    ) -> None:
+        self.__report_dir = report_dir
+        self.__file_name = file_name
+        self.__test_cases = []
+
+    def start(self):
+        """Removes previous reports and writes an empty report."""
+        if os.path.exists(self.__report_dir):
+            shutil.rmtree(self.__report_dir)
+        os.makedirs(self.__report_dir)
+        self.__test_cases = []
+        self.write()
+
+    def add(self, test_case):
+        """Adds test case to the report and writes it.
+
+        Args:
+            test_case (TestCase): junit_xml TestCase object
+        """
+        self.__test_cases.append(test_case)
+        self.write()
+
+    def write(self):
+        """Writes JUnit XML report atomically."""
+        test_suite = TestSuite("JUnitXmlReporter", self.__test_cases)
+        write_text_file(self.report_path, to_xml_report_string([test_suite]))
+
+    @property
+    def report_path(self) -> str:
+        return os.path.join(self.__report_dir, self.__file_name)
+
+    @property
+    def test_cases(self) -> list:
+        return list(self.__test_cases)
@@ -0,0 +1,157 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+# Run statuses caused by Loadero infrastructure rather than the test script or asserts
+INFRA_FAILURE_STATUSES = ["aborted", "aws-error", "db-error", "server-error", "insufficient-resources"]
+
+# Server error statuses of API requests that are worth sending again
+RETRY_SERVER_ERROR_STATUSES = [500, 502, 503, 504]
+IDEMPOTENT_METHODS = ["GET", "PUT", "DELETE"]
+
+
+class RetryPolicy:
+    """RetryPolicy class decides if a run that failed for infrastructure reasons is relaunched.
+
+    Runs that are done are never relaunched, even if their success rate is
+    below 100%, because that is a script or assert failure.
+    """
+    __max_retries = None
+    __delay = None
+    __statuses = None
+
+    def __init__(
+        self,
+        max_retries: int = 0,
+        delay: float = 10,
+        statuses: list or None = None
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("RetryPolicy max retries must not be negative.")
+
+        if delay < 0:
+            raise ValueError("RetryPolicy delay must not be negative.")
+
+        self.__max_retries = max_retries
+        self.__delay = delay
+        self.__statuses = list(INFRA_FAILURE_STATUSES if statuses is None else statuses)
+
+    def is_infra_failure(self, test_run_result):
+        """Check if run failed for infrastructure reasons.
+
+        Args:
+            test_run_result (dict): Loadero test run result dictionary
+
+        Returns:
+            bool: True if the run status is an infrastructure failure status
+        """
+        return test_run_result["status"] in self.__statuses
+
+    def should_retry(self, test_run_result, retries):
+        """Check if test should be relaunched.
+
+        Args:
+            test_run_result (dict): Loadero test run result dictionary
+            retries (int): Number of times the test was already relaunched
+
+        Returns:
+            bool: True if the run failed for infrastructure reasons and retries are left
+        """
+        return self.is_infra_failure(test_run_result) and retries < self.__max_retries
+
+    @property
+    def max_retries(self) -> int:
+        return self.__max_retries
+
+    @property
+    def delay(self) -> float:
+        return self.__delay
+
+    @property
+    def statuses(self) -> list:
+        return list(self.__statuses)
+
+
+class RequestRetryPolicy:
+    """RequestRetryPolicy class decides if a failed Loadero API request is sent again and when.
+
+    Requests rejected by the API rate limit are always sent again. Server
+    errors are retried only for idempotent methods, because a POST that
+    failed with a server error may still have created the resource.
+    """
+    __max_retries = None
+    __backoff = None
+    __max_backoff = None
+    __jitter = None
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff: float = 1,
+        max_backoff: float = 60,
+        jitter: float = 0.1
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("RequestRetryPolicy max retries must not be negative.")
+
+        if backoff <= 0 or max_backoff < backoff:
+            raise ValueError("RequestRetryPolicy backoff must be greater than 0 and not above max backoff.")
+
+        if not 0 <= jitter < 1:
+            raise ValueError("RequestRetryPolicy jitter must be between 0 and 1.")
+
+        self.__max_retries = max_retries
+        self.__backoff = backoff
+        self.__max_backoff = max_backoff
+        self.__jitter = jitter
+
+    def should_retry(self, method, status, retries):
+        """Check if request should be sent again.
+
+        Args:
+            method (string): HTTP method
+            status (int): HTTP response status code
+            retries (int): Number of times the request was already sent again
+
+        Returns:
+            bool: True if the request was rate limited or failed with a retryable server error and retries are left
+        """
+        if retries >= self.__max_retries:
+            return False
+        if status == 429:
+            return True
+        return status in RETRY_SERVER_ERROR_STATUSES and method.upper() in IDEMPOTENT_METHODS
+
+    def delay(self, retry_after, retries):
+        """Gets seconds to wait before sending request again.
+
+        Args:
+            retry_after (string or None): Retry-After response header in seconds or as HTTP date
+            retries (int): Number of times the request was already sent again
+
+        Returns:
+            float: Seconds to wait
+        """
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0), self.__max_backoff)
+            except ValueError:
+                try:
+                    retry_time = parsedate_to_datetime(retry_after).timestamp()
+                    return min(max(retry_time - time.time(), 0), self.__max_backoff)
+                except (TypeError, ValueError):
+                    pass
+        delay = self.__backoff * 2 ** retries * random.uniform(1 - self.__jitter, 1 + self.__jitter)
+        return min(delay, self.__max_backoff)
+
+    @property
+    def max_retries(self) -> int:
+        return self.__max_retries
+
+    @property
+    def backoff(self) -> float:
+        return self.__backoff
+
+    @property
+    def max_backoff(self) -> float:
+        return self.__max_backoff
@@ -0,0 +1,110 @@
+from loadero_python.resources.pagination import PagedResponse
+from loadero_python.resources.project import QueryParams
+from loadero_python.resources.run import RunFilterKey, RunParams
+
+from loadero.client_factory import ProjectClient
+from loadero.poll_policy import ACTIVE_STATUSES
+
+
+def read_run(api_client, run_id):
+    """Reads run from Loadero API.
+
+    Args:
+        api_client (ProjectClient): Loadero API client of the run's project
+        run_id (int): Loadero test run id
+
+    Returns:
+        dict: Loadero test run result dictionary
+    """
+    return RunParams().from_dict(api_client.get(f"{api_client.project_route}runs/{run_id}/")).to_dict_full()
+
+
+class RunRegistry:
+    """RunRegistry class keeps in-flight Loadero runs and refreshes them with project level run list calls.
+
+    One paged list call filtered by active statuses covers every in-flight run.
+    Only runs that dropped out of the active list are read one by one, which
+    happens once per run when it finishes.
+    """
+    __api_client = None
+    __runs = None
+    __page_limit = None
+    __api_calls = None
+
+    def __init__(self, api_client: ProjectClient, page_limit: int = 100) -> None:
+        if page_limit < 1:
+            raise ValueError("RunRegistry page limit must be greater than 0.")
+
+        self.__api_client = api_client
+        self.__runs = {}
+        self.__page_limit = page_limit
+        self.__api_calls = 0
+
+    def add(self, test_id, run_id):
+        """Add run to the registry.
+
+        Args:
+            test_id (int): Loadero test id
+            run_id (int): Loadero test run id
+        """
+        self.__runs[run_id] = test_id
+
+    def remove(self, run_id):
+        """Remove run from the registry.
+
+        Args:
+            run_id (int): Loadero test run id
+        """
+        self.__runs.pop(run_id, None)
+
+    def read_active_runs(self):
+        """Reads all active runs in the project page by page.
+
+        Returns:
+            dict: Loadero test run result dictionaries by run id
+        """
+        active_runs = {}
+        offset = 0
+        while True:
+            query_params = QueryParams().limit(self.__page_limit).offset(offset) \
+                .filter(RunFilterKey.STATUS, *ACTIVE_STATUSES)
+            runs = PagedResponse(RunParams).from_dict(self.__api_client.get(
+                f"{self.__api_client.project_route}runs/", query_params.parse())).to_dict_full()["results"]
+            self.__api_calls += 1
+            for run in runs:
+                active_runs[run["id"]] = run
+            if len(runs) < self.__page_limit:
+                return active_runs
+            offset += self.__page_limit
+
+    def refresh(self):
+        """Refresh all registered runs.
+
+        Returns:
+            dict: Loadero test run result dictionaries by run id
+        """
+        runs = dict(self.__runs)
+        if not runs:
+            return {}
+
+        active_runs = self.read_active_runs()
+        test_run_results = {}
+        for run_id in runs:
+            if run_id in active_runs:
+                test_run_results[run_id] = active_runs[run_id]
+            else:
+                test_run_results[run_id] = read_run(self.__api_client, run_id)
+                self.__api_calls += 1
+        return test_run_results
+
+    @property
+    def runs(self) -> dict:
+        return dict(self.__runs)
+
+    @property
+    def page_limit(self) -> int:
+        return self.__page_limit
+
+    @property
+    def api_calls(self) -> int:
+        return self.__api_calls
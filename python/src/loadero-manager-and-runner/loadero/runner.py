@@ -1,28 +1,49 @@
+import heapq
 import logging
-import os
-import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
 
-from junit_xml import TestCase, TestSuite, to_xml_report_file
-from loadero_python.api_client import APIClient
-from loadero_python.resources.run import Run, RunAPI, RunParams
+from junit_xml import TestCase
+from loadero_python.api_client import APIException
+from urllib3.exceptions import HTTPError
 
+from loadero.client_factory import CLIENTS, ProjectClient
+from loadero.history import FlakinessLedger, RunHistory
+from loadero.journal import RunJournal
 from loadero.logger import Logger
+from loadero.metrics import RUN_DURATION, RUN_QUEUE_WAIT
+from loadero.poll_policy import ACTIVE_STATUSES, PollPolicy
+from loadero.progress import ProgressReporter
+from loadero.report import ReportWriter, run_duration
+from loadero.retry_policy import RetryPolicy
+from loadero.run_registry import RunRegistry
+from loadero.runner_config import RunnerConfig
+from loadero.scheduler import LaunchScheduler
 
 
 class Runner:
-    """Runner class for running tests in parallel."""
+    """Runner class for running tests in parallel.
+
+    Every test runs in its own process, but run statuses are not read per
+    process. The parent process refreshes every in-flight run through
+    RunRegistry whenever the earliest run is due by its poll policy, and pipes
+    the results to the test processes waiting for them.
+    """
     __access_token = None
     __project_id = None
     __level = None
     __logger = None
+    __config = None
+    __registry = None
 
     def __init__(
         self,
         access_token: str or None = None,
         project_id: int or None = None,
-        level: str = "info"
+        level: str = "info",
+        config: RunnerConfig or None = None
     ) -> None:
 
         if access_token is None:
@@ -31,12 +52,16 @@ class Runner:
         if project_id is None:
             raise TypeError("Runner must be initialized with project id.")
 
+        config = config or RunnerConfig()
+        if config.max_failures is not None and config.max_failures < 1:
+            raise ValueError("Runner max failures must be greater than 0.")
+
         self.__access_token = access_token
         self.__project_id = project_id
         self.__level = level
         self.__logger = Logger(logging.getLogger("runner"), level)
-
-        APIClient(access_token=self.__access_token, project_id=self.__project_id)
+        self.__config = config
+        self.__registry = RunRegistry(self.api_client)
 
     def start_test(self, test_id, logger):
         """Start test.
@@ -48,25 +73,27 @@ class Runner:
         Returns:
             int: Loadero test run id
         """
-        run_id = RunAPI().create(RunParams(test_id=test_id)).to_dict_full()["id"]
+        api_client = self.api_client
+        run_id = api_client.post(f"{api_client.project_route}tests/{test_id}/runs/", None)["id"]
         logger.debug(f"Started Loadero test: {test_id} run: {run_id}.")
         return run_id
 
-    def wait_for_test_completion(self, test_id, run_id, logger):
+    def wait_for_test_completion(self, test_id, run_id, logger, conn):
         """Wait test for completion.
 
         Args:
             test_id (int): Loadero test id
             run_id (int): Loadero test run id
             logger (Logger): Logger object runner-worker
+            conn (Pipe object): Connection the run_tests method sends the refreshed run results to
 
         Returns:
             dict: Loadero test run result dictionary
         """
         status = None
-        while status in [None, "pending", "initializing", "running", "waiting-results"]:
-            time.sleep(10)
-            test_run_result = Run(run_id).read().params.to_dict_full()
+        test_run_result = None
+        while status is None or status in ACTIVE_STATUSES:
+            test_run_result = conn.recv()
             new_status = test_run_result["status"]
             if status != new_status:
                 logger.debug(
@@ -100,21 +127,43 @@ class Runner:
             logger.error(
                 f"Test: {test_id} execution failed! Run: {run_id} with status: {status}.")
 
-    def run_test(self, test_id, logger, conn):
+    def run_test(self, test_id, logger, conn, run_id=None):
         """Run test.
 
         Args:
             test_id (int): Loadero test id
             logger (Logger): Logger object runner-worker
             conn (Pipe object): Connection between run_test method and run_tests method
+            run_id (int or None): Loadero test run id to reattach to instead of starting the test
         """
-        APIClient(access_token=self.__access_token, project_id=self.__project_id)
-        run_id = self.start_test(test_id, logger)
-        conn.send(run_id)
-        test_run_result = self.wait_for_test_completion(
-            test_id, run_id, logger)
+        retries = 0
+        while True:
+            if run_id is None:
+                run_id = self.start_test(test_id, logger)
+            conn.send(run_id)
+            test_run_result = self.wait_for_test_completion(
+                test_id, run_id, logger, conn)
+            conn.send(test_run_result)
+            if not self.retry_policy.should_retry(test_run_result, retries):
+                break
+            retries += 1
+            self.log_retry(test_run_result, retries, logger)
+            time.sleep(self.retry_policy.delay)
+            run_id = None
         self.check_status(test_run_result, logger)
 
+    def log_retry(self, test_run_result, retries, logger):
+        """Log relaunch of test whose run failed for infrastructure reasons.
+
+        Args:
+            test_run_result (dict): Loadero test run result dictionary of the failed run
+            retries (int): Number of times the test is relaunched including this time
+            logger (Logger): Logger object runner-worker
+        """
+        logger.error(
+            f"Test: {test_run_result['test_id']} run: {test_run_result['id']} ended with status: "
+            f"{test_run_result['status']}. Relaunching test, retry {retries}/{self.retry_policy.max_retries}.")
+
     def stop_test(self, test_id, run_id, logger):
         """Stop test run
 
@@ -123,9 +172,372 @@ class Runner:
             run_id (int): Loadero test run id
             logger (Logger): Logger object runner-worker
         """
-        RunAPI().stop(RunParams(run_id=run_id, test_id=test_id))
+        api_client = self.api_client
+        api_client.post(f"{api_client.project_route}tests/{test_id}/runs/{run_id}/stop/", None)
         logger.debug(f"Stopped Loadero test: {test_id} run: {run_id}.")
 
+    def stop_tests(self, runs, logger):
+        """Stop test runs concurrently.
+
+        Args:
+            runs (list): List of (Loadero test id, Loadero test run id) tuples
+            logger (Logger): Logger object runner-worker
+        """
+        def stop(run):
+            test_id, run_id = run
+            try:
+                self.stop_test(test_id, run_id, logger)
+            except (APIException, HTTPError) as e:
+                self.__logger.error(f"Failed to stop test: {test_id} run: {run_id}: {e}")
+
+        if not runs:
+            return
+        with ThreadPoolExecutor(max_workers=len(runs)) as executor:
+            list(executor.map(stop, runs))
+        self.count_api_calls(len(runs))
+
+    def open_journal(self, project_id, test_ids):
+        """Start a new run journal, or read the runs to reattach to when resuming.
+
+        Args:
+            project_id (int): Loadero project id
+            test_ids (list): List of Loadero test ids
+
+        Returns:
+            dict: Run id and start time dictionaries by test id of the runs to reattach to
+        """
+        if self.journal is None:
+            return {}
+        if not self.resume:
+            self.journal.start(project_id)
+            return {}
+
+        resumed_runs = {test_id: run for test_id, run in self.journal.read_runs(project_id).items()
+                        if test_id in test_ids}
+        if resumed_runs:
+            self.__logger.info(f"Reattaching to {len(resumed_runs)} run/s from {self.journal.path}: "
+                               f"{[run['run_id'] for run in resumed_runs.values()]}.")
+        else:
+            self.journal.start(project_id)
+            self.__logger.info(f"There are no runs to reattach to in {self.journal.path}.")
+        return resumed_runs
+
+    def record_launch(self, test_id, run_id, start_time):
+        """Record launched run in the run journal.
+
+        Args:
+            test_id (int): Loadero test id
+            run_id (int): Loadero test run id
+            start_time (float): Time when the test was launched
+        """
+        if self.journal is not None:
+            self.journal.record(test_id, run_id, start_time)
+
+    def close_journal(self):
+        """Mark run journal as finished after every test is reported."""
+        if self.journal is not None:
+            self.journal.finish()
+
+    def start_progress(self, test_ids):
+        """Start progress reporting of tests with their expected durations from the run history.
+
+        Args:
+            test_ids (list): List of Loadero test ids
+        """
+        if self.progress is None:
+            return
+        expected_durations = {}
+        if self.history is not None:
+            expected_durations = {test_id: self.history.expected_duration(test_id) for test_id in test_ids}
+        self.progress.start(test_ids, expected_durations)
+
+    def count_api_calls(self, count=1):
+        """Count API calls in the progress report.
+
+        Args:
+            count (int): Number of API calls
+        """
+        if self.progress is not None:
+            self.progress.count_api_calls(count)
+
+    def finish_progress(self, test_id, outcome):
+        """Record outcome of finished test in the progress report.
+
+        Args:
+            test_id (int): Loadero test id
+            outcome (string): Test outcome: passed, failed, quarantined or aborted
+        """
+        if self.progress is not None:
+            self.progress.finish(test_id, outcome)
+
+    def record_attempts(self, test_id, test_run_results):
+        """Record finished runs of test in the flakiness ledger.
+
+        Args:
+            test_id (int): Loadero test id
+            test_run_results (list): Loadero test run result dictionaries of every attempt
+        """
+        if self.ledger is None or not test_run_results:
+            return
+        infra_failures = [self.retry_policy.is_infra_failure(result) for result in test_run_results]
+        self.ledger.record(test_id, test_run_results, infra_failures)
+
+    def is_quarantined(self, test_id):
+        """Check if test is quarantined in the flakiness ledger.
+
+        Args:
+            test_id (int): Loadero test id
+
+        Returns:
+            bool: True if failures of the test are reported as skipped
+        """
+        return self.ledger is not None and self.ledger.is_quarantined(test_id)
+
+    def failure_limit_reached(self, outcomes):
+        """Check if enough tests failed to abort the remaining tests.
+
+        Args:
+            outcomes (dict): Test outcome counts
+
+        Returns:
+            bool: True if max failures is set and reached
+        """
+        return self.max_failures is not None and outcomes["failed"] >= self.max_failures
+
+    def order_tests(self, test_ids):
+        """Order tests longest expected run first, so long runs do not start last.
+
+        Args:
+            test_ids (list): List of Loadero test ids
+
+        Returns:
+            list: List of Loadero test ids
+        """
+        if self.history is None:
+            return list(test_ids)
+        ordered_test_ids = self.history.order_longest_first(test_ids)
+        self.__logger.debug(f"Test ids ordered by expected duration: {ordered_test_ids}.")
+        return ordered_test_ids
+
+    def record_duration(self, test_id, duration, outcome):
+        """Record run duration of finished test in the run history.
+
+        Args:
+            test_id (int): Loadero test id
+            duration (float): Seconds from test launch until the run finished
+            outcome (string): Test outcome: passed, failed or aborted
+        """
+        # Aborted runs did not finish, their duration says nothing about the test
+        if self.history is None or outcome == "aborted" or duration is None:
+            return
+        self.history.record(test_id, duration)
+
+    @staticmethod
+    def receive_messages(conn, loadero_id, progress=None):
+        """Receive run id and run result sent by run_test method.
+
+        Args:
+            conn (Connection object): Parent end of the pipe to run_test method
+            loadero_id (dict): Test process tracking dictionary
+            progress (ProgressReporter or None): Progress reporter that counts the created runs
+
+        Returns:
+            bool: False if run_test method closed the pipe
+        """
+        try:
+            while conn.poll():
+                message = conn.recv()
+                # Run results are dictionaries, every relaunch sends a new run id first
+                if isinstance(message, dict):
+                    loadero_id["result"] = message
+                    loadero_id["attempts"].append(message)
+                else:
+                    loadero_id["run_id"] = message
+                    # Reattached runs are not created
+                    if progress is not None and message != loadero_id.get("resumed_run_id"):
+                        progress.count_api_calls()
+        except EOFError:
+            return False
+        return True
+
+    def track_run(self, loadero_id, previous_run_id):
+        """Register new run of test process, so it is refreshed with the other in-flight runs.
+
+        Args:
+            loadero_id (dict): Test process tracking dictionary
+            previous_run_id (int or None): Loadero test run id of the previous attempt
+        """
+        self.__registry.remove(previous_run_id)
+        self.__registry.add(loadero_id["test_id"], loadero_id["run_id"])
+        loadero_id["poll"] = {"due_time": time.time() + self.poll_policy.next_interval(None, 0, 0),
+                              "last_result": None, "attempt": 0, "status_changed_time": time.time()}
+
+    @staticmethod
+    def next_poll_time(loadero_ids):
+        """Get the time when the earliest in-flight run is due to be refreshed.
+
+        Args:
+            loadero_ids (list): Test process tracking dictionaries
+
+        Returns:
+            float or None: Due time of the earliest run, None if no run is in flight
+        """
+        due_times = [loadero_id["poll"]["due_time"] for loadero_id in loadero_ids
+                     if loadero_id["poll"] is not None and loadero_id["poll"]["due_time"] is not None]
+        return min(due_times) if due_times else None
+
+    def refresh_runs(self, loadero_ids):
+        """Refresh all in-flight runs with batched calls once the earliest is due and send the results.
+
+        Args:
+            loadero_ids (list): Test process tracking dictionaries
+        """
+        next_poll_time = self.next_poll_time(loadero_ids)
+        if next_poll_time is None or next_poll_time > time.time():
+            return
+
+        api_calls = self.__registry.api_calls
+        try:
+            test_run_results = self.__registry.refresh()
+        except (APIException, HTTPError) as e:
+            self.__logger.error(f"Failed to refresh runs: {e}")
+            retry_time = time.time() + self.poll_policy.next_interval(None, 0, 0)
+            for loadero_id in loadero_ids:
+                if loadero_id["poll"] is not None and loadero_id["poll"]["due_time"] is not None:
+                    loadero_id["poll"]["due_time"] = retry_time
+            return
+        finally:
+            self.count_api_calls(self.__registry.api_calls - api_calls)
+
+        # Pipes of exited test processes are closed, they are reported as they are
+        polls = {loadero_id["run_id"]: loadero_id for loadero_id in loadero_ids
+                 if loadero_id["poll"] is not None and loadero_id["poll"]["due_time"] is not None
+                 and not loadero_id["conn"].closed}
+        now = time.time()
+        for run_id, test_run_result in test_run_results.items():
+            if self.progress is not None:
+                self.progress.set_status(test_run_result["test_id"], test_run_result["status"])
+            if run_id not in polls:
+                continue
+            poll = polls[run_id]["poll"]
+            status_changed = poll["last_result"] is None or poll["last_result"]["status"] != test_run_result["status"]
+            # Runs that are not due yet still get status changes for free
+            if poll["due_time"] > now and not status_changed:
+                continue
+            self.update_poll(poll, test_run_result, status_changed)
+            try:
+                polls[run_id]["conn"].send(test_run_result)
+            except BrokenPipeError:
+                # Test process crashed, it is reported when its exit is noticed
+                pass
+
+    def update_poll(self, poll, test_run_result, status_changed):
+        """Set the time when run should be refreshed next, or stop refreshing it once it finished.
+
+        Args:
+            poll (dict): Next refresh time, last result, poll attempt and status change time of the run
+            test_run_result (dict): Loadero test run result dictionary
+            status_changed (bool): True if the run status changed since the last result
+        """
+        now = time.time()
+        poll["attempt"] = 0 if status_changed else poll["attempt"] + 1
+        if status_changed:
+            poll["status_changed_time"] = now
+        poll["last_result"] = test_run_result
+        if test_run_result["status"] in ACTIVE_STATUSES:
+            poll["due_time"] = now + self.poll_policy.next_interval(
+                test_run_result, poll["attempt"], now - poll["status_changed_time"])
+        else:
+            # The test process sends the result back and relaunches the test or exits
+            poll["due_time"] = None
+            self.__registry.remove(test_run_result["id"])
+
+    def report_test_process(self, project_id, loadero_id, reason="timeout"):
+        """Add finished test process to the report.
+
+        Args:
+            project_id (int): Loadero project id
+            loadero_id (dict): Test process tracking dictionary of the finished process
+            reason (string): Why the process was terminated if it did not finish
+
+        Returns:
+            string: Test outcome: passed, failed, quarantined or aborted
+        """
+        p = loadero_id["process"]
+        test_id = loadero_id["test_id"]
+        run_id = loadero_id["run_id"]
+        self.__registry.remove(run_id)
+        elapsed_sec = run_duration(loadero_id["result"])
+        if elapsed_sec is None:
+            elapsed_sec = time.time() - loadero_id["start_time"]
+        test_case = TestCase(
+            name=f'Loadero project id: {project_id} test id: {test_id}', elapsed_sec=elapsed_sec)
+
+        self.__logger.info(
+            f"Finished test process {p.pid} for test {test_id} and run {run_id} with code {p.exitcode}.")
+        execution_failed = loadero_id["result"] is not None and loadero_id["result"]["status"] != "done"
+        if p.exitcode == 0 and not execution_failed:  # Test passes
+            outcome = "passed"
+        elif p.exitcode in (0, 1) and self.is_quarantined(test_id):  # Quarantined test fails
+            outcome = "quarantined"
+            self.__logger.error(f"Test: {test_id} run: {run_id} failed, but the test is quarantined.")
+            test_case.add_skipped_info(f"Test: {test_id} Run: {run_id} failed, but the test is quarantined.")
+        elif p.exitcode in (0, 1):  # Test fails or its run was not executed
+            outcome = "failed"
+            test_case.add_failure_info(f"Test: {test_id} Run: {run_id} failed.")
+        else:  # check for SIGTERM p.exitcode not in (0, 1)
+            outcome = "aborted"
+            if run_id is not None and not loadero_id.get("stopped"):
+                self.stop_test(test_id, run_id, self.__logger)
+                self.count_api_calls()
+            self.__logger.error(f"Test: {test_id} run: {run_id} was terminated due to {reason}!")
+            test_case.add_error_info(f"Test: {test_id} Run: {run_id} was terminated due to {reason}!")
+
+        if loadero_id["result"] is not None:
+            self.record_duration(test_id, time.time() - loadero_id["start_time"], outcome)
+            if outcome != "aborted" and run_duration(loadero_id["result"]) is not None:
+                RUN_DURATION.observe(run_duration(loadero_id["result"]), test_id=test_id)
+        self.record_attempts(test_id, loadero_id["attempts"])
+        self.finish_progress(test_id, outcome)
+        self.report_writer.add(test_case)
+        return outcome
+
+    def abort_test_processes(self, project_id, loadero_ids, conns, reason):
+        """Terminate test processes that did not finish, stop their runs and report them.
+
+        Args:
+            project_id (int): Loadero project id
+            loadero_ids (list): Test process tracking dictionaries of the processes
+            conns (dict): Pipes of running test processes
+            reason (string): Why the processes are terminated
+
+        Returns:
+            list: Outcomes of the tests that were not reported yet
+        """
+        for loadero_id in loadero_ids:
+            loadero_id["process"].terminate()
+        runs = []
+        for loadero_id in loadero_ids:
+            p = loadero_id["process"]
+            p.join()
+            if not loadero_id["reported"]:
+                conn = loadero_id["conn"]
+                if conn in conns and not self.receive_messages(conn, loadero_id, self.progress):
+                    del conns[conn]
+                    conn.close()
+                if loadero_id["run_id"] is not None and p.exitcode not in (0, 1):
+                    runs.append((loadero_id["test_id"], loadero_id["run_id"]))
+                    loadero_id["stopped"] = True
+        # Stop all runs at once instead of waiting for each stop call in turn
+        self.stop_tests(runs, self.__logger)
+        outcomes = []
+        for loadero_id in loadero_ids:
+            if not loadero_id["reported"]:
+                loadero_id["reported"] = True
+                self.scheduler.release(loadero_id["test_id"])
+                outcomes.append(self.report_test_process(project_id, loadero_id, reason))
+        return outcomes
+
     def run_tests(self, project_id, test_ids, timeout):
         """Run tests.
 
@@ -135,90 +547,162 @@ class Runner:
             timeout (int): Timeout
         """
         try:
-            parent_conn, child_conn = Pipe()
             proceses = []
             loadero_ids = {}
+            # Pipes of running test processes
+            conns = {}
+            # Heap of (deadline, process id) of tests with their own timeout
+            deadlines = []
+            all_runs_started = False
+            # Why the remaining tests were aborted, if they were
+            reason = None
             start_time = time.time()
-            # Counts test passes
-            pass_counter = 0
-            # Counts test failures
-            fail_counter = 0
-            # Counts tests that are aborted
-            aborted_counter = 0
-            # report data
-            test_cases = []
-            for test_id in test_ids:
-                worker_logger = Logger(logging.getLogger(
-                    f"runner-worker-{test_id}"), self.__level)
-                # Create a process for each test id
-                p = Process(
-                    target=self.run_test, args=(test_id, worker_logger, child_conn, ))
-                # Start the created process
-                p.start()
-                # Receive current run_id from run_test function
-                run_id = parent_conn.recv()
-                # Store test_id and run_id for each test for further tracking as a dictionary
-                loadero_ids[p.pid] = {"test_id": test_id, "run_id": run_id}
-                self.__logger.info(
-                    f"Created test process {p.pid} for test {test_id} and run {run_id}.")
-                proceses.append(p)
+            # Counts test passes, failures and tests that are aborted
+            outcomes = {"passed": 0, "failed": 0, "aborted": 0, "quarantined": 0}
+            resumed_runs = self.open_journal(project_id, test_ids)
+            self.scheduler.enqueue(self.order_tests(
+                [test_id for test_id in test_ids if test_id not in resumed_runs]))
+            # Runs that are already executing on Loadero take their capacity right away
+            for test_id in resumed_runs:
+                self.scheduler.attach(test_id)
+            launches = list(resumed_runs)
+            self.report_writer.start()
+            self.start_progress(test_ids)
 
             # Check if timeout occurred
             while time.time() - start_time <= int(timeout):
+                # Start queued tests as long as the scheduler admits them
+                launches += self.scheduler.pop_admissible()
+                for test_id in launches:
+                    resumed_run = resumed_runs.get(test_id)
+                    worker_logger = Logger(logging.getLogger(
+                        f"runner-worker-{test_id}"), self.__level)
+                    # Test process sends its run ids and results, run results are sent back to it
+                    parent_conn, child_conn = Pipe()
+                    # Create a process for each test id
+                    p = Process(target=self.run_test, args=(
+                        test_id, worker_logger, child_conn, resumed_run["run_id"] if resumed_run else None))
+                    # Start the created process without waiting for its run to be created
+                    p.start()
+                    child_conn.close()
+                    # Store test_id and run_id for each test for further tracking as a dictionary
+                    loadero_ids[p.pid] = {"test_id": test_id, "run_id": None, "result": None, "attempts": [],
+                                          "start_time": resumed_run["start_time"] if resumed_run else time.time(),
+                                          "resumed_run_id": resumed_run["run_id"] if resumed_run else None,
+                                          "conn": parent_conn, "process": p, "reported": False, "poll": None}
+                    if self.progress is not None:
+                        self.progress.launch(test_id, loadero_ids[p.pid]["start_time"])
+                    if resumed_run is None:
+                        RUN_QUEUE_WAIT.observe(loadero_ids[p.pid]["start_time"] - start_time)
+                    conns[parent_conn] = p
+                    proceses.append(p)
+                    if test_id in self.__config.test_timeouts:
+                        heapq.heappush(deadlines, (
+                            loadero_ids[p.pid]["start_time"] + self.__config.test_timeouts[test_id], p.pid))
+                launches = []
+
+                # Receive run ids and run results from run_test method as they arrive
+                wait_timeout = 1
+                if deadlines:
+                    wait_timeout = min(wait_timeout, max(deadlines[0][0] - time.time(), 0))
+                next_poll_time = self.next_poll_time(loadero_ids.values())
+                if next_poll_time is not None:
+                    wait_timeout = min(wait_timeout, max(next_poll_time - time.time(), 0))
+                ready_conns = wait(list(conns), timeout=wait_timeout) if conns else []
+                for conn in ready_conns:
+                    p = conns[conn]
+                    loadero_id = loadero_ids.get(p.pid)
+                    starting = loadero_id["run_id"] is None
+                    previous_run_id = loadero_id["run_id"]
+                    if not self.receive_messages(conn, loadero_id, self.progress):
+                        del conns[conn]
+                        conn.close()
+                    if loadero_id["run_id"] != previous_run_id:
+                        self.record_launch(loadero_id["test_id"], loadero_id["run_id"], loadero_id["start_time"])
+                        self.track_run(loadero_id, previous_run_id)
+                    if starting and loadero_id["run_id"] is not None:
+                        action = "Reattached" if loadero_id["test_id"] in resumed_runs else "Created"
+                        self.__logger.info(
+                            f"{action} test process {p.pid} for test {loadero_id['test_id']} "
+                            f"and run {loadero_id['run_id']}.")
+                    elif starting and conn not in conns:
+                        self.__logger.error(
+                            f"Test process {p.pid} for test {loadero_id['test_id']} exited before starting a run.")
+
+                # Refresh all in-flight runs at once and pipe their statuses to the test processes
+                self.refresh_runs(list(loadero_ids.values()))
+
+                if not all_runs_started and not self.scheduler.queue and \
+                        all(loadero_ids.get(p.pid)["run_id"] is not None for p in conns.values()):
+                    all_runs_started = True
+                    self.__logger.info(
+                        f"All {len(proceses)} test runs started in {time.time() - start_time:.2f}s.")
+
+                # Stop only the tests that are over their own timeout
+                overdue_pids = []
+                while deadlines and deadlines[0][0] <= time.time():
+                    _, pid = heapq.heappop(deadlines)
+                    if not loadero_ids[pid]["reported"]:
+                        overdue_pids.append(pid)
+                for outcome in self.abort_test_processes(
+                        project_id, [loadero_ids[pid] for pid in overdue_pids], conns, "test timeout"):
+                    outcomes[outcome] += 1
+
                 live_process_counter = 0
                 for p in proceses:
+                    loadero_id = loadero_ids.get(p.pid)
                     if p.is_alive():
                         live_process_counter += 1
-                if live_process_counter > 0:
-                    time.sleep(1)
+                    elif not loadero_id["reported"]:
+                        # Report finished tests right away, so partial results survive a crash
+                        if loadero_id["conn"] in conns:
+                            self.receive_messages(loadero_id["conn"], loadero_id, self.progress)
+                        loadero_id["reported"] = True
+                        self.scheduler.release(loadero_id["test_id"])
+                        outcomes[self.report_test_process(project_id, loadero_id)] += 1
+                if self.failure_limit_reached(outcomes):
+                    reason = f"{outcomes['failed']} failed test/s"
+                    self.__logger.error(f"Aborting script due to {reason}!")
+                    break
+                if self.progress is not None:
+                    self.progress.report_if_due()
+                if live_process_counter > 0 or self.scheduler.queue:
+                    # Waiting for pipes already paused the loop
+                    if not conns:
+                        time.sleep(1)
                 else:
                     break
             else:
+                reason = "timeout"
                 self.__logger.error("Aborting script due to timeout!")
-                for p in proceses:
-                    p.terminate()
-
-            # Processing exit codes
-            for p in proceses:
-                # Report data
-                test_case = TestCase(
-                    name=f'Loadero project id: {project_id} test id: {loadero_ids.get(p.pid)["test_id"]}')
-
-                self.__logger.info(
-                    f"Finished test process {p.pid} for test {loadero_ids.get(p.pid)['test_id']} and "
-                    f"run {loadero_ids.get(p.pid)['run_id']} with code {p.exitcode}.")
-                if p.exitcode == 0:  # Test passes
-                    pass_counter += 1
-                elif p.exitcode == 1:  # Test fails
-                    fail_counter += 1
-                    test_case.add_failure_info(
-                        f"Test: {loadero_ids.get(p.pid)['test_id']} Run: {loadero_ids.get(p.pid)['run_id']} failed.")
-                else: # check for SIGTERM p.exitcode not in (0, 1)
-                    aborted_counter += 1
-                    self.stop_test(loadero_ids.get(p.pid)['test_id'], loadero_ids.get(p.pid)['run_id'], worker_logger)
-                    self.__logger.error(
-                        f"Test: {loadero_ids.get(p.pid)['test_id']} "
-                        f"run: {loadero_ids.get(p.pid)['run_id']} was terminated due to timeout!")
-                    test_case.add_error_info(
-                        f"Test: {loadero_ids.get(p.pid)['test_id']} Run: {loadero_ids.get(p.pid)['run_id']} "
-                        "was terminated due to timeout!")
-
-                test_cases.append(test_case)
+
+            if reason is not None:
+                for outcome in self.abort_test_processes(
+                        project_id, [loadero_ids[p.pid] for p in proceses], conns, reason):
+                    outcomes[outcome] += 1
+
+            # Tests that were still queued when the script was aborted
+            for test_id in self.scheduler.queue:
+                outcomes["aborted"] += 1
+                test_case = TestCase(name=f'Loadero project id: {project_id} test id: {test_id}')
+                self.__logger.error(f"Test: {test_id} was not started due to {reason}!")
+                test_case.add_error_info(f"Test: {test_id} was not started due to {reason}!")
+                self.report_writer.add(test_case)
+                self.finish_progress(test_id, "aborted")
+
+            for conn in conns:
+                conn.close()
+
+            if self.progress is not None:
+                self.progress.report()
 
             self.__logger.info(
-                f"Tests execution completed! Total tests: {len(proceses)}. Passed test count: {pass_counter}. "
-                f"Failed test count: {fail_counter}. Skipped test count: {aborted_counter}.")
+                f"Tests execution completed! Total tests: {len(self.report_writer.test_cases)}. "
+                f"Passed test count: {outcomes['passed']}. Failed test count: {outcomes['failed']}. "
+                f"Skipped test count: {outcomes['aborted']}. Quarantined test count: {outcomes['quarantined']}.")
             end_time = time.time()
             self.__logger.info(f"Duration: {end_time - start_time}s.")
-
-            # Report data
-            test_suite = TestSuite("JUnitXmlReporter", test_cases)
-            report_dir = 'reports'
-            if os.path.exists(report_dir):
-                shutil.rmtree(report_dir)
-            os.makedirs(report_dir)
-            with open(os.path.join(report_dir, 'report.xml'), 'w', encoding="utf-8") as f:
-                to_xml_report_file(f, [test_suite])
+            self.close_journal()
 
         except RuntimeError:
             self.__logger.error(
@@ -232,10 +716,66 @@ class Runner:
     def project_id(self) -> str:
         return self.__project_id
 
+    @property
+    def api_client(self) -> ProjectClient:
+        return CLIENTS.client(self.__access_token, self.__project_id)
+
+    @property
+    def registry(self) -> RunRegistry:
+        return self.__registry
+
     @property
     def level(self) -> str:
-        return self.level
+        return self.__level
 
     @property
     def logger(self) -> Logger:
-        return self.logger
+        return self.__logger
+
+    @property
+    def config(self) -> RunnerConfig:
+        return self.__config
+
+    @property
+    def poll_policy(self) -> PollPolicy:
+        return self.__config.poll_policy
+
+    @property
+    def scheduler(self) -> LaunchScheduler:
+        return self.__config.scheduler
+
+    @property
+    def report_writer(self) -> ReportWriter:
+        return self.__config.records.report_writer
+
+    @property
+    def history(self) -> RunHistory:
+        return self.__config.records.history
+
+    @property
+    def max_failures(self) -> int:
+        return self.__config.max_failures
+
+    @property
+    def test_timeouts(self) -> dict:
+        return dict(self.__config.test_timeouts)
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self.__config.retry_policy
+
+    @property
+    def ledger(self) -> FlakinessLedger:
+        return self.__config.records.ledger
+
+    @property
+    def journal(self) -> RunJournal:
+        return self.__config.records.journal
+
+    @property
+    def resume(self) -> bool:
+        return self.__config.records.resume
+
+    @property
+    def progress(self) -> ProgressReporter:
+        return self.__config.records.progress
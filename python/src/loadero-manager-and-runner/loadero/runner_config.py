@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+
+from loadero.history import FlakinessLedger, RunHistory
+from loadero.journal import RunJournal
+from loadero.poll_policy import FixedPollPolicy, PollPolicy
+from loadero.progress import ProgressReporter
+from loadero.report import ReportWriter
+from loadero.retry_policy import RetryPolicy
+from loadero.scheduler import LaunchScheduler
+
+
+@dataclass
+class RunRecords:
+    """RunRecords class keeps where the runner records tests and their runs.
+
+    Attributes:
+        report_writer (ReportWriter): JUnit report of the tests
+        history (RunHistory or None): Run durations used to order tests, tests are not ordered if None
+        ledger (FlakinessLedger or None): Flakiness of the tests, no test is quarantined if None
+        journal (RunJournal or None): Launched runs, runs are not journaled if None
+        resume (boolean): Reattach to the runs in the journal instead of launching them again
+        progress (ProgressReporter or None): Progress reporter, progress is not reported if None
+    """
+    report_writer: ReportWriter = field(default_factory=ReportWriter)
+    history: RunHistory or None = None
+    ledger: FlakinessLedger or None = None
+    journal: RunJournal or None = None
+    resume: bool = False
+    progress: ProgressReporter or None = None
+
+
+@dataclass
+class RunnerConfig:
+    """RunnerConfig class keeps how Runner and AsyncRunner run tests.
+
+    Attributes:
+        poll_policy (PollPolicy): Intervals of run status reads
+        scheduler (LaunchScheduler): Order and limits of test launches
+        retry_policy (RetryPolicy): Relaunches of infrastructure-failed runs
+        max_failures (int or None): Number of failed tests that aborts the remaining tests, never aborted if None
+        test_timeouts (dict): Test run timeouts in seconds by test id
+        concurrency (int): Maximum number of concurrent API calls of AsyncRunner
+        records (RunRecords): Where tests and their runs are recorded
+    """
+    poll_policy: PollPolicy = field(default_factory=FixedPollPolicy)
+    scheduler: LaunchScheduler = field(default_factory=LaunchScheduler)
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    max_failures: int or None = None
+    test_timeouts: dict = field(default_factory=dict)
+    concurrency: int = 10
+    records: RunRecords = field(default_factory=RunRecords)
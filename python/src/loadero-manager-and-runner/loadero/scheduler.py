@@ -0,0 +1,156 @@
+def count_compute_units(groups, participants):
+    """Counts compute units a test run uses.
+
+    Args:
+        groups (list): List of Loadero group dictionaries
+        participants (list): List of Loadero participant dictionaries
+
+    Returns:
+        float: Compute units of the test
+    """
+    group_counts = {}
+    for group in groups:
+        group_counts[group["id"]] = group.get("count", 1)
+
+    compute_units = 0
+    for participant in participants:
+        # Compute unit names are the unit count prefixed with "g", e.g. "g0.5", "g2"
+        compute_unit = float(str(participant["compute_unit"]).lstrip("g"))
+        compute_units += compute_unit * participant["count"] * group_counts.get(participant["group_id"], 1)
+    return compute_units
+
+
+def test_timeout(test, margin):
+    """Derives run timeout of test from its start interval and participant timeout.
+
+    Args:
+        test (dict): Loadero test dictionary
+        margin (float): Seconds added for run initialization and result collection
+
+    Returns:
+        float: Test run timeout in seconds
+    """
+    return (test.get("start_interval") or 0) + (test.get("participant_timeout") or 0) + margin
+
+
+class LaunchScheduler:
+    """LaunchScheduler class admits queued tests while the parallel run limit and compute unit budget allow it.
+
+    Tests are admitted strictly in queue order. Tests behind one that does not
+    fit wait for it even if they would fit themselves, so smaller tests can
+    not starve a large one by taking every compute unit that frees up. A test
+    that alone exceeds the budget is admitted once nothing else is running.
+    """
+    __max_parallel = None
+    __cu_budget = None
+    __compute_units = None
+    __queue = None
+    __running = None
+
+    def __init__(
+        self,
+        max_parallel: int or None = None,
+        cu_budget: float or None = None,
+        compute_units: dict or None = None
+    ) -> None:
+        if max_parallel is not None and max_parallel < 1:
+            raise ValueError("LaunchScheduler max parallel must be greater than 0.")
+
+        if cu_budget is not None and cu_budget <= 0:
+            raise ValueError("LaunchScheduler compute unit budget must be greater than 0.")
+
+        self.__max_parallel = max_parallel
+        self.__cu_budget = cu_budget
+        self.__compute_units = compute_units or {}
+        self.__queue = []
+        self.__running = {}
+
+    def enqueue(self, test_ids):
+        """Add tests to the end of the queue.
+
+        Args:
+            test_ids (list): List of Loadero test ids
+        """
+        self.__queue.extend(test_ids)
+
+    def fits(self, test_id):
+        """Check if test can be started now.
+
+        Args:
+            test_id (int): Loadero test id
+
+        Returns:
+            bool: True if the test fits in the parallel run limit and compute unit budget
+        """
+        if self.__max_parallel is not None and len(self.__running) >= self.__max_parallel:
+            return False
+        if self.__cu_budget is None or not self.__running:
+            return True
+        return self.used_compute_units + self.__compute_units.get(test_id, 0) <= self.__cu_budget
+
+    def admit(self, test_id):
+        """Admit test if it is the first queued test and it fits.
+
+        Args:
+            test_id (int): Loadero test id
+
+        Returns:
+            bool: True if the test was admitted
+        """
+        if not self.__queue or self.__queue[0] != test_id or not self.fits(test_id):
+            return False
+        self.__queue.pop(0)
+        self.__running[test_id] = self.__compute_units.get(test_id, 0)
+        return True
+
+    def attach(self, test_id):
+        """Mark test as running without checking the limits, e.g. for a run that is already executing.
+
+        Args:
+            test_id (int): Loadero test id
+        """
+        if test_id in self.__queue:
+            self.__queue.remove(test_id)
+        self.__running[test_id] = self.__compute_units.get(test_id, 0)
+
+    def pop_admissible(self):
+        """Admit queued tests from the front of the queue while they fit.
+
+        Returns:
+            list: List of admitted Loadero test ids in queue order
+        """
+        admitted = []
+        while self.__queue:
+            test_id = self.__queue[0]
+            if not self.admit(test_id):
+                break
+            admitted.append(test_id)
+        return admitted
+
+    def release(self, test_id):
+        """Release the capacity of a finished test.
+
+        Args:
+            test_id (int): Loadero test id
+        """
+        self.__running.pop(test_id, None)
+
+    @property
+    def used_compute_units(self) -> float:
+        return sum(self.__running.values())
+
+    @property
+    def queue(self) -> list:
+        return list(self.__queue)
+
+    @property
+    def running(self) -> list:
+        return list(self.__running)
+
+    @property
+    def max_parallel(self) -> int:
+        return self.__max_parallel
+
+    @property
+    def cu_budget(self) -> float:
+        return self.__cu_budget
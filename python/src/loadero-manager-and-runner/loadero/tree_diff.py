@@ -0,0 +1,57 @@
+from loadero_python.resources.assert_precondition import AssertPreconditionParams
+from loadero_python.resources.assert_resource import AssertParams
+from loadero_python.resources.group import GroupParams
+from loadero_python.resources.participant import ParticipantParams
+from loadero_python.resources.test import TestParams
+
+# Params classes that know which fields of a Loadero object are sent on create and update, by backup file name
+PARAMS_CLASSES = {
+    "test": TestParams,
+    "groups": GroupParams,
+    "participants": ParticipantParams,
+    "asserts": AssertParams,
+    "asserts_preconditions": AssertPreconditionParams,
+}
+
+
+def object_body(kind, loadero_object):
+    """Gets fields of Loadero object that are sent to Loadero API on create and update.
+
+    Read only fields, e.g. created and updated timestamps, are left out, so
+    a backed up object can be compared to the one read from Loadero.
+
+    Args:
+        kind (string): Object kind: test, groups, participants, asserts or asserts_preconditions
+        loadero_object (dict): Loadero object dictionary
+
+    Returns:
+        dict: Request body dictionary
+    """
+    fields = {key: value for key, value in loadero_object.items() if key != "script"}
+    return PARAMS_CLASSES[kind]().from_dict(fields).to_dict()
+
+
+def diff_objects(kind, local_objects, remote_objects):
+    """Compares backed up objects to the ones read from Loadero by id.
+
+    Args:
+        kind (string): Object kind: groups, participants, asserts or asserts_preconditions
+        local_objects (list): Backed up Loadero object dictionaries
+        remote_objects (list): Loadero object dictionaries read from Loadero
+
+    Returns:
+        tuple: Lists of local objects to create, local objects to update and remote objects to delete
+    """
+    remote_objects_by_id = {remote_object["id"]: remote_object for remote_object in remote_objects}
+    local_ids = {local_object["id"] for local_object in local_objects}
+
+    created = []
+    updated = []
+    for local_object in local_objects:
+        remote_object = remote_objects_by_id.get(local_object["id"])
+        if remote_object is None:
+            created.append(local_object)
+        elif object_body(kind, local_object) != object_body(kind, remote_object):
+            updated.append(local_object)
+    deleted = [remote_object for remote_object in remote_objects if remote_object["id"] not in local_ids]
+    return created, updated, deleted
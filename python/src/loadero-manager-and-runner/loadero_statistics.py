@@ -3,8 +3,10 @@ import logging
 import os
 import pandas
 
+from loadero.client_factory import configure_clients
 from loadero.local_manager import LocalManager
 from loadero.logger import Logger
+from loadero.metrics import start_exporter, stop_exporter
 from loadero.remote_manager import RemoteManager
 from helpers.statistics_helpers import generate_test_success_rate_histogram, generate_asserts_statstics
 
@@ -17,16 +19,27 @@ def parse_arguments():
     parser.add_argument("--test_ids", help="List of Test Id(s)", default=[], required=True, nargs="*", type=int)
     parser.add_argument("--n", help="Number of test runs", default=100, required=False, type=int)
     parser.add_argument("--offset", help="Offset", default=1, required=False, type=int)
+    parser.add_argument("--rate_limit", help="Maximum average Loadero API requests per second",
+                        default=None, required=False, type=float)
+    parser.add_argument("--rate_burst", help="Maximum Loadero API requests sent at once before the rate limit applies",
+                        default=None, required=False, type=int)
+    parser.add_argument("--api_retries", help="Maximum times a rate limited or failed API request is sent again",
+                        default=None, required=False, type=int)
+    parser.add_argument("--metrics_file", help="File where Prometheus metrics are written on exit",
+                        default=None, required=False)
+    parser.add_argument("--metrics_port", help="Port where Prometheus metrics are served while running",
+                        default=None, required=False, type=int)
     parser.add_argument("--log_level", help="Log Levels: info, debug", default="info",
                         choices=["info", "INFO", "debug", "DEBUG"], required=False)
     args = parser.parse_args()
     return args
 
 if __name__ == "__main__":
+    # Parse command line arguments
+    args = parse_arguments()
+    start_exporter(args.metrics_port)
+    configure_clients(rate=args.rate_limit, burst=args.rate_burst, max_retries=args.api_retries)
     try:
-        # Parse command line arguments
-        args = parse_arguments()
-
         # Create a remote manager instance for accessing Loadero data
         remote_manager = RemoteManager(args.access_token, args.project_id)
 
@@ -172,3 +185,5 @@ if __name__ == "__main__":
 
     except ConnectionError:
         logger.error("Invalid parameters: Access denied")
+    finally:
+        stop_exporter(args.metrics_file)
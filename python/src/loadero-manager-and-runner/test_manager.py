@@ -1,9 +1,14 @@
 import argparse
+import dataclasses
 import logging
 
 from loadero import action as act
+from loadero.action_options import ActionOptions
+from loadero.client_factory import CLIENTS, configure_clients
+from loadero.journal import RestoreJournal
 from loadero.local_manager import LocalManager
 from loadero.logger import Logger
+from loadero.metrics import start_exporter, stop_exporter
 from loadero.remote_manager import RemoteManager
 
 
@@ -36,8 +41,9 @@ def parse_arguments():
     parser.add_argument("--test_ids", help="Loadero test ids", required=False, nargs="*", type=int)
     parser.add_argument("--suite", help="Suite name", required=False)
     parser.add_argument(
-        "--action", help="Actions: backup, restore, clone, init, sync",
-        choices=["backup", "BACKUP", "restore", "RESTORE", "clone", "CLONE", "init", "INIT", "sync", "SYNC"],
+        "--action", help="Actions: backup, restore, clone, init, sync, rollback",
+        choices=["backup", "BACKUP", "restore", "RESTORE", "clone", "CLONE", "init", "INIT", "sync", "SYNC",
+                 "rollback", "ROLLBACK"],
         required=True)
     parser.add_argument("--log_level", help="Logging levels: info, debug", default="info",
                         choices=["info", "INFO", "debug", "DEBUG"], required=False)
@@ -46,6 +52,34 @@ def parse_arguments():
     parser.add_argument("--ignore_project_language_check",
                         help="Ignore the comparison of source project's and destination project's languages",
                         default=False, required=False, type=parse_boolean)
+    parser.add_argument("--workers",
+                        help="Number of tests backed up at the same time and parallel API calls per restored test",
+                        default=1, required=False, type=int)
+    parser.add_argument("--incremental", help="Skip tests not updated since the last backup",
+                        default=False, required=False, type=parse_boolean)
+    parser.add_argument("--pool_size", help="Maximum number of kept-alive Loadero API connections",
+                        default=None, required=False, type=int)
+    parser.add_argument("--rate_limit_from", help="Maximum average API requests per second to the source project",
+                        default=None, required=False, type=float)
+    parser.add_argument("--rate_limit_to",
+                        help="Maximum average API requests per second to the destination project",
+                        default=None, required=False, type=float)
+    parser.add_argument("--rate_burst", help="Maximum Loadero API requests sent at once before the rate limit applies",
+                        default=None, required=False, type=int)
+    parser.add_argument("--api_retries", help="Maximum times a rate limited or failed API request is sent again",
+                        default=None, required=False, type=int)
+    parser.add_argument("--metrics_file", help="File where Prometheus metrics are written on exit",
+                        default=None, required=False)
+    parser.add_argument("--metrics_port", help="Port where Prometheus metrics are served while running",
+                        default=None, required=False, type=int)
+    parser.add_argument("--journal_file", help="File where objects created by restore are recorded until it finishes",
+                        default="restore_journal.json", required=False)
+    parser.add_argument("--rollback", help="Delete the objects created by a restore that failed",
+                        default=True, required=False, type=parse_boolean)
+    parser.add_argument("--streaming", help="Clone tests in memory without the local backup",
+                        default=False, required=False, type=parse_boolean)
+    parser.add_argument("--streaming_backup", help="Back up the tests cloned in memory too",
+                        default=False, required=False, type=parse_boolean)
     parser.add_argument("--overwrite_suite", help="Overwrite suite", required=False, type=parse_boolean, default=False)
 
     cli_args = parser.parse_args()
@@ -57,62 +91,87 @@ if __name__ == "__main__":
 
     logger = Logger(logging.getLogger("test-manager"), args.log_level.lower())
     obj = {"logger": logger}
-
-    match args.action.lower():
-        case "init":
-            logger.info("Action INIT.")
-
-            local_manager_from = LocalManager(args.access_token_from, args.project_id_from, args.log_level.lower())
-            obj["local_manager"] = local_manager_from
-            act.init(obj, args.suite, args.test_ids, args.overwrite_suite)
-
-        case "backup":
-            logger.info("Action BACKUP.")
-
-            local_manager_from = LocalManager(args.access_token_from, args.project_id_from, args.log_level.lower())
-            remote_manager_from = RemoteManager(args.access_token_from, args.project_id_from, args.log_level.lower())
-            obj["local_manager"] = local_manager_from
-            obj["remote_manager"] = remote_manager_from
-
-            act.backup(obj, args.suite, args.test_ids, args.overwrite_suite, args.delete_source_test)
-
-        case "restore":
-            logger.info("Action RESTORE.")
-
-            local_manager_to = LocalManager(args.access_token_to, args.project_id_to, args.log_level.lower())
-            remote_manager_to = RemoteManager(args.access_token_to, args.project_id_to, args.log_level.lower())
-            obj["local_manager"] = local_manager_to
-            obj["remote_manager"] = remote_manager_to
-
-            act.restore(obj, args.local_project_id, args.suite, args.test_ids, args.ignore_project_language_check)
-
-        case "clone":
-            logger.info("Action CLONE.")
-
-            local_manager_from = LocalManager(args.access_token_from, args.project_id_from, args.log_level.lower())
-            remote_manager_from = RemoteManager(args.access_token_from, args.project_id_from, args.log_level.lower())
-            local_manager_to = LocalManager(args.access_token_to, args.project_id_to, args.log_level.lower())
-            remote_manager_to = RemoteManager(args.access_token_to, args.project_id_to, args.log_level.lower())
-
-            obj["local_manager"] = local_manager_from
-            act.init(obj, args.suite, args.test_ids, args.overwrite_suite)
-
-            obj["remote_manager"] = remote_manager_from
-            act.backup(obj, args.suite, args.test_ids, args.overwrite_suite, args.delete_source_test)
-
-            obj["local_manager"] = local_manager_to
-            obj["remote_manager"] = remote_manager_to
-            act.restore(obj, args.project_id_from, args.suite, args.test_ids, args.ignore_project_language_check)
-
-        case "sync":
-            logger.info("Action SYNC.")
-
-            local_manager_to = LocalManager(args.access_token_to, args.project_id_to, args.log_level.lower())
-            remote_manager_to = RemoteManager(args.access_token_to, args.project_id_to, args.log_level.lower())
-
-            obj["local_manager"] = local_manager_to
-            obj["remote_manager"] = remote_manager_to
-            restored_test_ids = act.restore(obj, args.project_id_from, args.suite,
-                                            args.test_ids, args.ignore_project_language_check)
-            act.init(obj, args.suite, restored_test_ids, args.overwrite_suite)
-            act.backup(obj, args.suite, restored_test_ids, args.overwrite_suite, args.delete_source_test)
+    start_exporter(args.metrics_port)
+    try:
+        # Up to workers tests are handled at the same time with up to workers API calls each
+        configure_clients(args.pool_size, burst=args.rate_burst, max_retries=args.api_retries,
+                          parallel_calls=args.workers * args.workers)
+        if args.project_id_from is not None:
+            CLIENTS.configure_project(args.project_id_from, rate=args.rate_limit_from)
+        if args.project_id_to is not None:
+            CLIENTS.configure_project(args.project_id_to, rate=args.rate_limit_to)
+
+        match args.action.lower():
+            case "init":
+                logger.info("Action INIT.")
+
+                local_manager_from = LocalManager(args.access_token_from, args.project_id_from, args.log_level.lower())
+                obj["local_manager"] = local_manager_from
+                act.init(obj, args.suite, args.test_ids, args.overwrite_suite)
+
+            case "backup":
+                logger.info("Action BACKUP.")
+
+                local_manager_from = LocalManager(args.access_token_from, args.project_id_from, args.log_level.lower())
+                remote_manager_from = RemoteManager(
+                    args.access_token_from, args.project_id_from, args.log_level.lower())
+                obj["local_manager"] = local_manager_from
+                obj["remote_manager"] = remote_manager_from
+
+                act.backup(obj, ActionOptions.from_args(args))
+
+            case "restore":
+                logger.info("Action RESTORE.")
+                journal = RestoreJournal(args.journal_file)
+
+                local_manager_to = LocalManager(args.access_token_to, args.project_id_to, args.log_level.lower())
+                remote_manager_to = RemoteManager(args.access_token_to, args.project_id_to, args.log_level.lower())
+                obj["local_manager"] = local_manager_to
+                obj["remote_manager"] = remote_manager_to
+
+                act.restore(obj, args.local_project_id, ActionOptions.from_args(args, journal))
+
+            case "clone":
+                logger.info("Action CLONE.")
+                journal = RestoreJournal(args.journal_file)
+
+                local_manager_from = LocalManager(args.access_token_from, args.project_id_from, args.log_level.lower())
+                remote_manager_from = RemoteManager(
+                    args.access_token_from, args.project_id_from, args.log_level.lower())
+                local_manager_to = LocalManager(args.access_token_to, args.project_id_to, args.log_level.lower())
+                remote_manager_to = RemoteManager(args.access_token_to, args.project_id_to, args.log_level.lower())
+
+                if not args.streaming or args.streaming_backup:
+                    obj["local_manager"] = local_manager_from
+                    act.init(obj, args.suite, args.test_ids, args.overwrite_suite)
+
+                obj_from = {
+                    "logger": logger, "local_manager": local_manager_from, "remote_manager": remote_manager_from}
+                obj_to = {"logger": logger, "local_manager": local_manager_to, "remote_manager": remote_manager_to}
+                act.clone(obj_from, obj_to, ActionOptions.from_args(args, journal), args.streaming,
+                          args.streaming_backup)
+
+            case "sync":
+                logger.info("Action SYNC.")
+                journal = RestoreJournal(args.journal_file)
+
+                local_manager_to = LocalManager(args.access_token_to, args.project_id_to, args.log_level.lower())
+                remote_manager_to = RemoteManager(args.access_token_to, args.project_id_to, args.log_level.lower())
+
+                obj["local_manager"] = local_manager_to
+                obj["remote_manager"] = remote_manager_to
+                options = ActionOptions.from_args(args, journal)
+                restored_test_ids = act.restore(obj, args.project_id_from, options)
+                act.init(obj, args.suite, restored_test_ids, args.overwrite_suite)
+                act.backup(obj, dataclasses.replace(
+                    options, tests=dataclasses.replace(options.tests, test_ids=restored_test_ids)))
+
+            case "rollback":
+                logger.info("Action ROLLBACK.")
+                journal = RestoreJournal(args.journal_file)
+
+                remote_manager_to = RemoteManager(args.access_token_to, args.project_id_to, args.log_level.lower())
+                obj["remote_manager"] = remote_manager_to
+                act.rollback(obj, journal)
+    finally:
+        stop_exporter(args.metrics_file)
@@ -1,10 +1,21 @@
 import argparse
 import logging
 
+from loadero.async_runner import AsyncRunner
+from loadero.backup_files import read_compute_units, read_test_timeouts
+from loadero.client_factory import configure_clients
+from loadero.history import FlakinessLedger, RunHistory
+from loadero.journal import RunJournal
 from loadero.local_manager import LocalManager
 from loadero.logger import Logger
+from loadero.metrics import start_exporter, stop_exporter
+from loadero.poll_policy import create_poll_policy
+from loadero.progress import ProgressReporter
 from loadero.remote_manager import RemoteManager
+from loadero.retry_policy import RetryPolicy
 from loadero.runner import Runner
+from loadero.runner_config import RunnerConfig, RunRecords
+from loadero.scheduler import LaunchScheduler
 
 
 def parse_arguments():
@@ -15,7 +26,63 @@ def parse_arguments():
     parser.add_argument("--project_id", help="Project id of the project in Loadero", required=True)
     parser.add_argument("--test_ids", help="Loadero test id(s) to be run", required=False, nargs="*", type=int)
     parser.add_argument("--suite", help="Suite to be run", required=False)
-    parser.add_argument("--timeout", help="Runner timeout in seconds", default=60*60, required=False)
+    parser.add_argument("--timeout", help="Runner timeout in seconds", default=60*60, required=False, type=int)
+    parser.add_argument("--test_timeout_margin",
+                        help="Stop each test after its start interval, participant timeout and this many seconds",
+                        default=None, required=False, type=float)
+    parser.add_argument("--engine", help="Runner engines: process, asyncio", default="process",
+                        choices=["process", "PROCESS", "asyncio", "ASYNCIO"], required=False)
+    parser.add_argument("--concurrency", help="Maximum concurrent API calls for the asyncio engine",
+                        default=10, required=False, type=int)
+    parser.add_argument("--poll_policy", help="Run status poll policies: fixed, backoff, eta", default="fixed",
+                        choices=["fixed", "FIXED", "backoff", "BACKOFF", "eta", "ETA"], required=False)
+    parser.add_argument("--poll_interval", help="Poll interval in seconds for the fixed poll policy",
+                        default=10, required=False, type=float)
+    parser.add_argument("--poll_max_interval",
+                        help="Maximum poll interval in seconds for backoff and eta poll policies",
+                        default=60, required=False, type=float)
+    parser.add_argument("--max_parallel", help="Maximum number of tests running at the same time",
+                        default=None, required=False, type=int)
+    parser.add_argument("--cu_budget", help="Maximum compute units used by tests running at the same time",
+                        default=None, required=False, type=float)
+    parser.add_argument("--history_file", help="File where run durations are kept to start longest tests first",
+                        default="run_history.json", required=False)
+    parser.add_argument("--fail_fast", help="Stop all other tests after the first failed test",
+                        action="store_true", required=False)
+    parser.add_argument("--max_failures", help="Stop all other tests after this many failed tests",
+                        default=None, required=False, type=int)
+    parser.add_argument("--retries", help="Maximum relaunches of a test whose run failed for infrastructure reasons",
+                        default=0, required=False, type=int)
+    parser.add_argument("--retry_delay", help="Seconds to wait before relaunching a test",
+                        default=10, required=False, type=float)
+    parser.add_argument("--flakiness_file", help="File where the last run statuses of tests are kept",
+                        default="flakiness.json", required=False)
+    parser.add_argument("--quarantine_threshold",
+                        help="Report failures of tests with this many infrastructure failures in their last runs "
+                             "as skipped",
+                        default=None, required=False, type=int)
+    parser.add_argument("--state_file", help="File where launched runs are recorded to resume the runner",
+                        default="runner_state.json", required=False)
+    parser.add_argument("--resume", help="Reattach to the unfinished runs recorded in the state file",
+                        action="store_true", required=False)
+    parser.add_argument("--progress", help="Progress reports: none, text, json", default="none",
+                        choices=["none", "NONE", "text", "TEXT", "json", "JSON"], required=False)
+    parser.add_argument("--progress_interval", help="Seconds between progress reports",
+                        default=10, required=False, type=float)
+    parser.add_argument("--progress_file", help="File where json progress reports are appended instead of stdout",
+                        default=None, required=False)
+    parser.add_argument("--pool_size", help="Maximum number of kept-alive Loadero API connections",
+                        default=None, required=False, type=int)
+    parser.add_argument("--rate_limit", help="Maximum average Loadero API requests per second",
+                        default=None, required=False, type=float)
+    parser.add_argument("--rate_burst", help="Maximum Loadero API requests sent at once before the rate limit applies",
+                        default=None, required=False, type=int)
+    parser.add_argument("--api_retries", help="Maximum times a rate limited or failed API request is sent again",
+                        default=None, required=False, type=int)
+    parser.add_argument("--metrics_file", help="File where Prometheus metrics are written on exit",
+                        default=None, required=False)
+    parser.add_argument("--metrics_port", help="Port where Prometheus metrics are served while running",
+                        default=None, required=False, type=int)
     parser.add_argument("--log_level", help="Log levels: info, debug", default="info",
                         choices=["info", "INFO", "debug", "DEBUG"], required=False)
 
@@ -26,50 +93,92 @@ def parse_arguments():
 if __name__ == "__main__":
 
     args = parse_arguments()
+    start_exporter(args.metrics_port)
+    try:
+        # Test processes of the process engine make one API call at a time each
+        configure_clients(args.pool_size, args.rate_limit, args.rate_burst, args.api_retries,
+                          args.concurrency if args.engine.lower() == "asyncio" else 1)
 
-    remote_manager = RemoteManager(args.access_token, args.project_id)
-    local_manager = LocalManager(args.access_token, args.project_id)
+        remote_manager = RemoteManager(args.access_token, args.project_id)
+        local_manager = LocalManager(args.access_token, args.project_id)
 
-    logger = Logger(logging.getLogger("test-runner"), args.log_level.lower())
+        logger = Logger(logging.getLogger("test-runner"), args.log_level.lower())
 
-    # Loadero test ids
-    loadero_test_ids = remote_manager.read_all_test_ids()
+        # Loadero test ids
+        loadero_test_ids = remote_manager.read_all_test_ids()
 
-    # Set optional parameters
-    test_ids = []
-    if args.test_ids and not args.suite:
-        test_ids = local_manager.validate_cli_test_ids(loadero_test_ids, args.test_ids)
-    elif args.suite and not args.test_ids:
-        project_name = local_manager.get_project_name_from_test_cases(int(args.project_id))
-        # Get test ids from suite
-        suites = local_manager.get_suites(
-            f'./test_cases/{args.project_id}_{project_name}/{args.project_id}_{project_name}.json')
-        if not bool(suites):
-            logger.critical(f'There is no {args.suite} suite!')
-        else:
-            suite_test_ids = suites[args.suite]['test_ids']
-            test_ids = local_manager.validate_cli_test_ids(loadero_test_ids, suite_test_ids)
-    elif args.test_ids and args.suite:
-        project_name = local_manager.get_project_name_from_test_cases(int(args.project_id))
-        suites = local_manager.get_suites(
-            f'./test_cases/{args.project_id}_{project_name}/{args.project_id}_{project_name}.json')
-        if not bool(suites):
-            logger.error(f'There is no {args.suite} suite!')
-            test_ids = args.test_ids
-        else:
-            if not bool(suites[args.suite]):
-                logger.error(f'{args.suite} suite is empty!')
-                test_ids = args.test_ids
+        # Set optional parameters
+        test_ids = []
+        # Test timeouts in seconds by test id from the suite
+        suite_timeouts = {}
+        if args.test_ids and not args.suite:
+            test_ids = local_manager.validate_cli_test_ids(loadero_test_ids, args.test_ids)
+        elif args.suite and not args.test_ids:
+            project_name = local_manager.get_project_name_from_test_cases(int(args.project_id))
+            # Get test ids from suite
+            suites = local_manager.get_suites(
+                f'./test_cases/{args.project_id}_{project_name}/{args.project_id}_{project_name}.json')
+            if not bool(suites):
+                logger.critical(f'There is no {args.suite} suite!')
             else:
                 suite_test_ids = suites[args.suite]['test_ids']
-                temp = [ele for ele in suite_test_ids if ele not in args.test_ids]
-                test_ids = local_manager.validate_cli_test_ids(loadero_test_ids, temp + args.test_ids)
-    else:
-        test_ids = loadero_test_ids
+                suite_timeouts = suites[args.suite].get('timeouts', {})
+                test_ids = local_manager.validate_cli_test_ids(loadero_test_ids, suite_test_ids)
+        elif args.test_ids and args.suite:
+            project_name = local_manager.get_project_name_from_test_cases(int(args.project_id))
+            suites = local_manager.get_suites(
+                f'./test_cases/{args.project_id}_{project_name}/{args.project_id}_{project_name}.json')
+            if not bool(suites):
+                logger.error(f'There is no {args.suite} suite!')
+                test_ids = args.test_ids
+            else:
+                if not bool(suites[args.suite]):
+                    logger.error(f'{args.suite} suite is empty!')
+                    test_ids = args.test_ids
+                else:
+                    suite_test_ids = suites[args.suite]['test_ids']
+                    suite_timeouts = suites[args.suite].get('timeouts', {})
+                    temp = [ele for ele in suite_test_ids if ele not in args.test_ids]
+                    test_ids = local_manager.validate_cli_test_ids(loadero_test_ids, temp + args.test_ids)
+        else:
+            test_ids = loadero_test_ids
 
-    # Initialize runner
-    runner = Runner(args.access_token, args.project_id, args.log_level.lower())
+        # Initialize runner
+        poll_policy = create_poll_policy(args.poll_policy, args.poll_interval, args.poll_max_interval)
+        compute_units = None
+        if args.cu_budget is not None:
+            compute_units = read_compute_units(local_manager, test_ids)
+            logger.debug(f"Compute units by test id: {compute_units}.")
+        scheduler = LaunchScheduler(args.max_parallel, args.cu_budget, compute_units)
+        test_timeouts = {}
+        if args.test_timeout_margin is not None:
+            test_timeouts = read_test_timeouts(local_manager, test_ids, args.test_timeout_margin)
+        # Suite timeouts take precedence over the ones derived from tests
+        for test_id, test_timeout in suite_timeouts.items():
+            test_timeouts[int(test_id)] = test_timeout
+        logger.debug(f"Test timeouts by test id: {test_timeouts}.")
+        history = RunHistory(args.history_file)
+        retry_policy = RetryPolicy(args.retries, args.retry_delay)
+        ledger = FlakinessLedger(args.flakiness_file, quarantine_threshold=args.quarantine_threshold)
+        journal = RunJournal(args.state_file)
+        progress = None
+        if args.progress.lower() != "none":
+            progress = ProgressReporter(args.progress.lower(), args.progress_interval, args.progress_file,
+                                        args.log_level.lower())
+        max_failures = args.max_failures
+        if args.fail_fast and max_failures is None:
+            max_failures = 1
+        config = RunnerConfig(
+            poll_policy=poll_policy, scheduler=scheduler, retry_policy=retry_policy, max_failures=max_failures,
+            test_timeouts=test_timeouts, concurrency=args.concurrency,
+            records=RunRecords(history=history, ledger=ledger, journal=journal, resume=args.resume, progress=progress))
+        if args.engine.lower() == "asyncio":
+            runner = AsyncRunner(args.access_token, args.project_id, args.log_level.lower(), config)
+        else:
+            runner = Runner(args.access_token, args.project_id, args.log_level.lower(), config)
 
-    # Run tests
-    logger.info(f"Starting {len(test_ids)} test/s. Test ids: {test_ids}. Timeout: {args.timeout}s.")
-    runner.run_tests(args.project_id, test_ids, args.timeout)
+        # Run tests
+        logger.info(f"Starting {len(test_ids)} test/s. Test ids: {test_ids}. Timeout: {args.timeout}s.")
+        runner.run_tests(args.project_id, test_ids, args.timeout)
+    finally:
+        stop_exporter(args.metrics_file)
@@ -0,0 +1,50 @@
+import os
+
+from loadero.atomic_file import read_json_file, write_text_file
+from loadero.backup_files import BackupFiles
+from loadero.backup_manifest import HASHES_FILE_NAME
+
+
+def test_hashes_are_written_to_sidecar_on_flush(tmp_path):
+    backup_files = BackupFiles()
+    backup_files.write(str(tmp_path / "groups.json"), "[]\n")
+    backup_files.write(str(tmp_path / "participants.json"), "[]\n")
+
+    assert not (tmp_path / HASHES_FILE_NAME).exists()
+    backup_files.flush()
+    assert sorted(read_json_file(str(tmp_path / HASHES_FILE_NAME))) == ["groups.json", "participants.json"]
+
+
+def test_flushed_hashes_are_used_by_next_backup(tmp_path):
+    path = str(tmp_path / "groups.json")
+    backup_files = BackupFiles()
+    backup_files.write(path, "[]\n")
+    backup_files.flush()
+
+    next_backup_files = BackupFiles()
+    assert next_backup_files.is_unchanged(path, "[]\n")
+    assert not next_backup_files.is_unchanged(path, "[{}]\n")
+
+
+def test_file_changed_by_hand_is_not_unchanged(tmp_path):
+    path = str(tmp_path / "groups.json")
+    backup_files = BackupFiles()
+    backup_files.write(path, "[]\n")
+    backup_files.flush()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[{}]\n")
+
+    assert not BackupFiles().is_unchanged(path, "[]\n")
+
+
+def test_atomic_write_keeps_open_permissions_and_umask(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        write_text_file(str(tmp_path / "test.json"), "{}\n")
+        assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(umask)
+
+    assert (tmp_path / "test.json").read_text(encoding="utf-8") == "{}\n"
+    assert os.stat(tmp_path / "test.json").st_mode & 0o777 == 0o644
+    assert os.listdir(tmp_path) == ["test.json"]
@@ -0,0 +1,103 @@
+import json
+import logging
+import os
+
+import pytest
+
+from loadero import action as act
+from loadero.action_options import ActionOptions
+from loadero.backup_files import write_test_tree
+from loadero.backup_manifest import MANIFEST_FILE_NAME, BackupManifest
+from loadero.local_manager import LocalManager
+from loadero.logger import Logger
+
+SCRIPT = "def test_on_loadero(driver: TestUIDriver):\n    pass\n"
+TEST = {"id": 5, "name": "test", "project_id": 1, "script_file_id": 9, "start_interval": 1,
+        "participant_timeout": 60, "mode": "load", "increment_strategy": "linear", "updated": "2024-01-01"}
+
+
+class FakeRemoteManager:
+    """Loadero project 1 with a single test that records which tests were read."""
+
+    def __init__(self):
+        self.project_id = 1
+        self.test_reads = []
+
+    def read_project(self):
+        return {"id": 1, "language": "python", "name": "proj"}
+
+    def read_all_tests(self):
+        return [dict(TEST)]
+
+    def read_test(self, test_id):
+        self.test_reads.append(test_id)
+        return dict(TEST, script=SCRIPT)
+
+    def read_all_groups(self, _test_id):
+        return []
+
+    def read_all_participants(self, _test_id):
+        return []
+
+    def read_all_asserts(self, _test_id):
+        return []
+
+
+@pytest.fixture(name="obj")
+def fixture_obj(tmp_path):
+    test_cases_path = tmp_path / "test_cases"
+    project_directory = test_cases_path / "1_proj"
+    project_directory.mkdir(parents=True)
+    project = {"id": 1, "language": "python", "name": "proj", "manager_config": {"suites": {}}}
+    (project_directory / "1_proj.json").write_text(json.dumps(project), encoding="utf-8")
+
+    local_manager = LocalManager("token", 1, test_cases_path=str(test_cases_path))
+    write_test_tree(local_manager, "proj", {
+        "test": TEST, "script": SCRIPT, "groups": [], "participants": [], "asserts": [],
+        "asserts_preconditions": {}})
+    manifest = BackupManifest(str(project_directory / MANIFEST_FILE_NAME))
+    manifest.record(TEST, local_manager.get_test_directory("proj", TEST["id"], TEST["name"]))
+    manifest.save()
+    return {
+        "logger": Logger(logging.getLogger("test-manifest"), "info"),
+        "local_manager": local_manager,
+        "remote_manager": FakeRemoteManager(),
+    }
+
+
+def test_recorded_test_is_unchanged(obj):
+    test_path = obj["local_manager"].get_test_directory("proj", TEST["id"], TEST["name"])
+    manifest = BackupManifest(os.path.join(os.path.dirname(test_path), MANIFEST_FILE_NAME))
+
+    assert manifest.is_unchanged(TEST, test_path)
+    assert not manifest.is_unchanged(dict(TEST, updated="2024-02-01"), test_path)
+    assert not manifest.is_unchanged(dict(TEST, name="renamed"), test_path)
+
+
+def test_edited_backup_file_is_not_unchanged(obj):
+    test_path = obj["local_manager"].get_test_directory("proj", TEST["id"], TEST["name"])
+    with open(os.path.join(test_path, "groups.json"), "w", encoding="utf-8") as f:
+        f.write("[{}]\n")
+
+    manifest = BackupManifest(os.path.join(os.path.dirname(test_path), MANIFEST_FILE_NAME))
+    assert not manifest.is_unchanged(TEST, test_path)
+
+
+def test_backup_skips_unchanged_tests_only_if_incremental(obj):
+    _, _, _, tests, unchanged_tests = act.select_backup_tests(obj, None, None, False)
+    assert [test["id"] for test in tests] == [5]
+    assert not unchanged_tests
+
+    _, _, _, tests, unchanged_tests = act.select_backup_tests(obj, None, None, False, incremental=True)
+    assert not tests
+    assert [test["id"] for test in unchanged_tests] == [5]
+
+
+def test_restore_skips_unchanged_tests_only_if_incremental(obj):
+    remote_manager = obj["remote_manager"]
+
+    act.restore(obj, 1, ActionOptions(incremental=True))
+    assert not remote_manager.test_reads
+
+    act.restore(obj, 1, ActionOptions())
+    assert remote_manager.test_reads == [5]
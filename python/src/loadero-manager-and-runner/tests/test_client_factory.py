@@ -0,0 +1,125 @@
+import json
+
+import httpretty
+import pytest
+from loadero_python.api_client import APIException
+
+from loadero.client_factory import DEFAULT_API_BASE, ClientFactory, configure_clients
+from loadero.metrics import Histogram
+from loadero.retry_policy import RequestRetryPolicy
+
+PROJECT_URL = f"{DEFAULT_API_BASE}projects/7/"
+
+
+class Responses:
+    """Responds with the given responses in turn, repeating the last one, and keeps the requests."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __call__(self, request, uri, response_headers):
+        status, body, headers = self.responses[min(len(self.requests), len(self.responses) - 1)]
+        self.requests.append(request)
+        response_headers.update(headers or {})
+        response_headers["Content-Type"] = "application/json"
+        return status, response_headers, json.dumps(body)
+
+
+@pytest.fixture(name="factory")
+def fixture_factory():
+    factory = ClientFactory()
+    factory.configure(rate=1000, burst=1000, retry_policy=RequestRetryPolicy(max_retries=2, backoff=0.01))
+    return factory
+
+
+@pytest.fixture(autouse=True)
+def fixture_httpretty():
+    httpretty.enable(allow_net_connect=False)
+    yield
+    httpretty.disable()
+    httpretty.reset()
+
+
+def test_rate_limited_request_is_sent_again_after_retry_after(factory):
+    responses = Responses((429, {"error": "rate limited"}, {"Retry-After": "0"}), (200, {"id": 1}, None))
+    httpretty.register_uri(httpretty.GET, f"{PROJECT_URL}tests/1/", body=responses)
+
+    assert factory.client("token", 7).get("projects/7/tests/1/") == {"id": 1}
+    assert len(responses.requests) == 2
+
+
+def test_server_error_is_retried_for_idempotent_requests(factory):
+    responses = Responses(
+        (503, {"error": "unavailable"}, None), (502, {"error": "bad gateway"}, None), (200, {"id": 1}, None))
+    httpretty.register_uri(httpretty.GET, f"{PROJECT_URL}tests/1/", body=responses)
+
+    assert factory.client("token", 7).get("projects/7/tests/1/") == {"id": 1}
+    assert len(responses.requests) == 3
+
+
+def test_server_error_is_not_retried_for_post(factory):
+    responses = Responses((503, {"error": "unavailable"}, None), (201, {"id": 1}, None))
+    httpretty.register_uri(httpretty.POST, f"{PROJECT_URL}tests/", body=responses)
+
+    with pytest.raises(APIException):
+        factory.client("token", 7).post("projects/7/tests/", {"name": "test"})
+    assert len(responses.requests) == 1
+
+
+def test_request_fails_when_retries_run_out(factory):
+    responses = Responses((429, {"error": "rate limited"}, {"Retry-After": "0"}))
+    httpretty.register_uri(httpretty.GET, f"{PROJECT_URL}tests/1/", body=responses)
+
+    with pytest.raises(APIException):
+        factory.client("token", 7).get("projects/7/tests/1/")
+    assert len(responses.requests) == 3
+
+
+def test_client_sends_access_token_and_json_body(factory):
+    responses = Responses((200, {"id": 1}, None))
+    httpretty.register_uri(httpretty.PUT, f"{PROJECT_URL}tests/1/", body=responses)
+
+    factory.client("token", 7).put("projects/7/tests/1/", {"name": "test"})
+    request = responses.requests[0]
+    assert request.headers["Authorization"] == "LoaderoAuth token"
+    assert json.loads(request.body) == {"name": "test"}
+
+
+def test_client_is_reused_per_project(factory):
+    client = factory.client("token", 7)
+    assert factory.client(None, 7) is client
+    assert factory.client("token", 8) is not client
+    assert factory.client("other-token", 7).access_token == "other-token"
+
+
+def test_latency_is_observed_for_every_sent_request_by_route(factory, monkeypatch):
+    latency = Histogram("latency", "API request latency.", ("method", "endpoint"))
+    monkeypatch.setattr("loadero.client_factory.API_LATENCY", latency)
+    responses = Responses((503, {"error": "unavailable"}, None), (200, {"id": 1}, None))
+    httpretty.register_uri(httpretty.GET, f"{PROJECT_URL}tests/1/", body=responses)
+
+    factory.client("token", 7).get("projects/7/tests/1/")
+    assert 'latency_count{method="GET",endpoint="/v2/projects/:id/tests/:id/"} 2' in latency.render()
+
+
+def test_projects_are_throttled_only_with_a_rate():
+    factory = ClientFactory()
+    factory.configure_project(8, rate=2)
+
+    assert factory.limits(7)[0] is None
+    bucket = factory.limits(8)[0]
+    assert (bucket.rate, bucket.burst) == (2, 4)
+
+
+def test_pool_and_burst_are_sized_to_parallel_calls(monkeypatch):
+    factory = ClientFactory()
+    monkeypatch.setattr("loadero.client_factory.CLIENTS", factory)
+
+    configure_clients(rate=10, parallel_calls=16)
+    assert factory.pool_size == 16
+    assert factory.limits(7)[0].burst == 16
+
+    configure_clients(pool_size=2, rate=10, burst=3, parallel_calls=16)
+    assert factory.pool_size == 2
+    assert factory.limits(7)[0].burst == 3
@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from loadero.rate_limiter import TokenBucket
+
+
+def test_burst_is_not_delayed():
+    bucket = TokenBucket(rate=1, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+
+
+def test_empty_bucket_waits_for_next_token():
+    bucket = TokenBucket(rate=20, burst=1)
+    bucket.acquire()
+    start = time.monotonic()
+    waited = bucket.acquire()
+    assert waited == pytest.approx(0.05, abs=0.02)
+    assert time.monotonic() - start >= waited
+
+
+def test_waiting_requests_are_let_through_in_order():
+    bucket = TokenBucket(rate=20, burst=1)
+    bucket.acquire()
+    waits = [bucket.acquire() for _ in range(3)]
+    assert all(wait == pytest.approx(0.05, abs=0.02) for wait in waits)
+
+
+def test_tokens_refill_up_to_burst():
+    bucket = TokenBucket(rate=100, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    time.sleep(0.1)
+    assert [bucket.acquire() for _ in range(2)] == [0, 0]
+    assert bucket.acquire() > 0
+
+
+def test_pause_holds_back_next_request():
+    bucket = TokenBucket(rate=100, burst=5)
+    bucket.pause(0.1)
+    assert bucket.acquire() == pytest.approx(0.1, abs=0.02)
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_invalid_limits_are_rejected(rate, burst):
+    with pytest.raises(ValueError):
+        TokenBucket(rate, burst)
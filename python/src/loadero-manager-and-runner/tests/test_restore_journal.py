@@ -0,0 +1,159 @@
+import itertools
+import json
+import logging
+
+import pytest
+
+from loadero import action as act
+from loadero.action_options import ActionOptions
+from loadero.backup_files import write_test_tree
+from loadero.journal import RestoreJournal
+from loadero.local_manager import LocalManager
+from loadero.logger import Logger
+
+SCRIPT = "def test_on_loadero(driver: TestUIDriver):\n    pass\n"
+TEST = {"id": 5, "name": "test", "project_id": 1, "script_file_id": 9, "start_interval": 1,
+        "participant_timeout": 60, "mode": "load", "increment_strategy": "linear"}
+GROUP = {"id": 10, "test_id": 5, "name": "group", "count": 1}
+PARTICIPANT = {"id": 20, "test_id": 5, "group_id": 10, "name": "participant", "count": 1, "compute_unit": "g1",
+               "browser": "chromeLatest", "location": "us-west-2", "network": "default",
+               "audio_feed": "default", "video_feed": "default", "record_audio": False}
+
+
+class FakeRemoteManager:
+    """Loadero project in which every participant create fails and deletes are recorded."""
+
+    def __init__(self, remote_tests=()):
+        self.project_id = 2
+        self.tests = {test["id"]: test for test in remote_tests}
+        self.ids = itertools.count(100)
+        self.created = []
+        self.deleted = []
+        self.failing_deletes = set()
+
+    def read_project(self):
+        return {"id": self.project_id, "language": "python"}
+
+    def read_all_tests(self):
+        return list(self.tests.values())
+
+    def read_test(self, test_id):
+        return dict(self.tests[test_id], script=SCRIPT)
+
+    def read_script(self, _script_file_id):
+        return SCRIPT
+
+    def read_all_groups(self, _test_id):
+        return []
+
+    def read_all_participants(self, _test_id):
+        return []
+
+    def read_all_asserts(self, _test_id):
+        return []
+
+    def update_test(self, _test):
+        pass
+
+    def create(self, kind):
+        object_id = next(self.ids)
+        self.created.append((kind, object_id))
+        return object_id
+
+    def create_test(self, _test):
+        return self.create("test")
+
+    def create_group(self, _group):
+        return self.create("groups")
+
+    def create_participant(self, _participant):
+        raise RuntimeError("participant rejected")
+
+    def create_assert(self, _assert):
+        return self.create("asserts")
+
+    def create_assert_precondition(self, _precondition):
+        return self.create("asserts_preconditions")
+
+    def delete(self, kind, object_id):
+        if kind in self.failing_deletes:
+            raise RuntimeError(f"{kind} delete rejected")
+        self.deleted.append((kind, object_id))
+
+    def delete_test(self, test_id):
+        self.delete("test", test_id)
+
+    def delete_group(self, _test_id, group_id):
+        self.delete("groups", group_id)
+
+
+@pytest.fixture(name="local_manager")
+def fixture_local_manager(tmp_path):
+    test_cases_path = tmp_path / "test_cases"
+    project_directory = test_cases_path / "1_proj"
+    project_directory.mkdir(parents=True)
+    project = {"id": 1, "language": "python", "name": "proj", "manager_config": {"suites": {}}}
+    (project_directory / "1_proj.json").write_text(json.dumps(project), encoding="utf-8")
+
+    local_manager = LocalManager("token", 1, test_cases_path=str(test_cases_path))
+    write_test_tree(local_manager, "proj", {
+        "test": TEST, "script": SCRIPT, "groups": [GROUP], "participants": [PARTICIPANT],
+        "asserts": [], "asserts_preconditions": {}})
+    return local_manager
+
+
+def restore(local_manager, remote_manager, journal, rollback=True):
+    obj = {
+        "logger": Logger(logging.getLogger("test-restore"), "info"),
+        "local_manager": local_manager,
+        "remote_manager": remote_manager,
+    }
+    options = ActionOptions(ignore_project_language_check=True, journal=journal, rollback=rollback)
+    with pytest.raises(RuntimeError, match="participant rejected"):
+        act.restore(obj, 1, options)
+
+
+def test_created_test_is_deleted_when_restore_fails(local_manager, tmp_path):
+    remote_manager = FakeRemoteManager()
+    journal = RestoreJournal(str(tmp_path / "journal.json"))
+
+    restore(local_manager, remote_manager, journal)
+
+    assert remote_manager.created == [("test", 100), ("groups", 101)]
+    # Groups of a created test are deleted with it
+    assert remote_manager.deleted == [("test", 100)]
+    assert not journal.read_objects(2)
+
+
+def test_created_objects_of_updated_test_are_deleted_when_restore_fails(local_manager, tmp_path):
+    remote_manager = FakeRemoteManager([TEST])
+    journal = RestoreJournal(str(tmp_path / "journal.json"))
+
+    restore(local_manager, remote_manager, journal)
+
+    assert remote_manager.created == [("groups", 100)]
+    assert remote_manager.deleted == [("groups", 100)]
+    assert not journal.read_objects(2)
+
+
+def test_created_objects_are_kept_without_rollback(local_manager, tmp_path):
+    remote_manager = FakeRemoteManager()
+    journal = RestoreJournal(str(tmp_path / "journal.json"))
+
+    restore(local_manager, remote_manager, journal, rollback=False)
+
+    assert not remote_manager.deleted
+    assert journal.read_objects(2) == [{"kind": "test", "id": 100, "test_id": 100, "assert_id": None}]
+    # The journal is saved, so objects can be rolled back by a later run
+    assert RestoreJournal(journal.path).read_objects(2) == journal.read_objects(2)
+
+
+def test_objects_that_fail_to_be_deleted_stay_in_journal(local_manager, tmp_path):
+    remote_manager = FakeRemoteManager()
+    remote_manager.failing_deletes.add("test")
+    journal = RestoreJournal(str(tmp_path / "journal.json"))
+
+    restore(local_manager, remote_manager, journal)
+
+    assert not remote_manager.deleted
+    assert journal.read_objects(2) == [{"kind": "test", "id": 100, "test_id": 100, "assert_id": None}]
@@ -0,0 +1,121 @@
+import logging
+
+import pytest
+
+from loadero.history import FlakinessLedger
+from loadero.logger import Logger
+from loadero.report import ReportWriter
+from loadero.retry_policy import RetryPolicy
+from loadero.runner import Runner
+from loadero.runner_config import RunnerConfig, RunRecords
+
+LOGGER = Logger(logging.getLogger("test-retry"), "info")
+
+
+def run_result(run_id, status, success_rate=None):
+    test_run_result = {"id": run_id, "test_id": 1, "status": status}
+    if success_rate is not None:
+        test_run_result["success_rate"] = success_rate
+    return test_run_result
+
+
+class FakeConn:
+    """Pipe end that keeps the messages run_test sends."""
+
+    def __init__(self):
+        self.messages = []
+
+    def send(self, message):
+        self.messages.append(message)
+
+
+class FakeProcess:
+    """Finished test process."""
+
+    def __init__(self, exitcode):
+        self.pid = 1
+        self.exitcode = exitcode
+
+
+@pytest.fixture(name="runner_with_runs")
+def fixture_runner_with_runs(monkeypatch):
+    def runner_with_runs(results, max_retries):
+        runner = Runner("token", 1, "info", RunnerConfig(retry_policy=RetryPolicy(max_retries, delay=0)))
+        run_ids = iter(result["id"] for result in results)
+        run_results = iter(results)
+        monkeypatch.setattr(runner, "start_test", lambda test_id, logger: next(run_ids))
+        monkeypatch.setattr(runner, "wait_for_test_completion", lambda *args: next(run_results))
+        return runner
+    return runner_with_runs
+
+
+def test_only_infrastructure_failures_are_retried():
+    retry_policy = RetryPolicy(max_retries=2)
+
+    assert retry_policy.should_retry(run_result(1, "aws-error"), 1)
+    assert not retry_policy.should_retry(run_result(1, "aws-error"), 2)
+    assert not retry_policy.should_retry(run_result(1, "done", 0.5), 0)
+
+
+def test_infrastructure_failure_is_relaunched(runner_with_runs):
+    results = [run_result(1, "aws-error"), run_result(2, "server-error"), run_result(3, "done", 1)]
+    conn = FakeConn()
+
+    runner_with_runs(results, max_retries=2).run_test(1, LOGGER, conn)
+
+    assert conn.messages == [1, results[0], 2, results[1], 3, results[2]]
+
+
+def test_relaunches_stop_when_retries_run_out(runner_with_runs):
+    results = [run_result(1, "aws-error"), run_result(2, "aws-error"), run_result(3, "done", 1)]
+    conn = FakeConn()
+
+    runner_with_runs(results, max_retries=1).run_test(1, LOGGER, conn)
+
+    assert conn.messages == [1, results[0], 2, results[1]]
+
+
+def test_failed_done_run_is_not_relaunched(runner_with_runs):
+    results = [run_result(1, "done", 0.5), run_result(2, "done", 1)]
+    conn = FakeConn()
+
+    with pytest.raises(SystemExit):
+        runner_with_runs(results, max_retries=2).run_test(1, LOGGER, conn)
+    assert conn.messages == [1, results[0]]
+
+
+def test_ledger_keeps_last_runs_of_window(tmp_path):
+    path = str(tmp_path / "flakiness.json")
+    ledger = FlakinessLedger(path, window=2)
+    ledger.record(1, [run_result(1, "aws-error"), run_result(2, "aws-error")], [True, True])
+    ledger.record(1, [run_result(3, "done", 1)], [False])
+
+    assert [run["run_id"] for run in FlakinessLedger(path).runs["1"]] == [2, 3]
+    assert FlakinessLedger(path).infra_failures(1) == 1
+
+
+def test_test_is_quarantined_at_threshold(tmp_path):
+    ledger = FlakinessLedger(str(tmp_path / "flakiness.json"), quarantine_threshold=2)
+    ledger.record(1, [run_result(1, "aws-error")], [True])
+    assert not ledger.is_quarantined(1)
+
+    ledger.record(1, [run_result(2, "db-error")], [True])
+    assert ledger.is_quarantined(1)
+    assert not FlakinessLedger(str(tmp_path / "flakiness.json")).is_quarantined(1)
+
+
+def test_failure_of_quarantined_test_is_reported_as_skipped(tmp_path):
+    ledger = FlakinessLedger(str(tmp_path / "flakiness.json"), quarantine_threshold=1)
+    ledger.record(1, [run_result(1, "aws-error")], [True])
+    report_writer = ReportWriter(str(tmp_path / "reports"))
+    report_writer.start()
+    runner = Runner("token", 1, "info", RunnerConfig(
+        records=RunRecords(report_writer=report_writer, ledger=ledger)))
+    result = run_result(2, "aws-error")
+    loadero_id = {"test_id": 1, "run_id": 2, "result": result, "attempts": [result],
+                  "start_time": 0, "process": FakeProcess(exitcode=1)}
+
+    assert runner.report_test_process(1, loadero_id) == "quarantined"
+    assert report_writer.test_cases[0].is_skipped()
+    # Attempts of the reported test are recorded in the ledger
+    assert [run["run_id"] for run in ledger.runs["1"]] == [1, 2]
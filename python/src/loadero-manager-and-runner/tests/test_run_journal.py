@@ -0,0 +1,68 @@
+import logging
+
+from loadero.journal import RunJournal
+from loadero.logger import Logger
+from loadero.runner import Runner
+from loadero.runner_config import RunnerConfig, RunRecords
+
+
+class FakeConn:
+    """Pipe end that keeps the messages run_test sends."""
+
+    def __init__(self):
+        self.messages = []
+
+    def send(self, message):
+        self.messages.append(message)
+
+
+def runner_with_journal(path, resume):
+    return Runner("token", 1, "info", RunnerConfig(records=RunRecords(journal=RunJournal(path), resume=resume)))
+
+
+def test_unfinished_journal_of_project_is_read_after_restart(tmp_path):
+    path = str(tmp_path / "runner_state.json")
+    journal = RunJournal(path)
+    journal.start(1)
+    journal.record(10, 100, 5.0)
+
+    assert RunJournal(path).read_runs(1) == {10: {"run_id": 100, "start_time": 5.0}}
+    assert not RunJournal(path).read_runs(2)
+
+    journal.finish()
+    assert not RunJournal(path).read_runs(1)
+
+
+def test_resume_reattaches_only_to_requested_tests(tmp_path):
+    path = str(tmp_path / "runner_state.json")
+    journal = RunJournal(path)
+    journal.start(1)
+    journal.record(10, 100, 5.0)
+    journal.record(20, 200, 6.0)
+
+    assert runner_with_journal(path, resume=True).open_journal(1, [10, 30]) == {
+        10: {"run_id": 100, "start_time": 5.0}}
+
+
+def test_journal_is_started_again_without_resume(tmp_path):
+    path = str(tmp_path / "runner_state.json")
+    journal = RunJournal(path)
+    journal.start(1)
+    journal.record(10, 100, 5.0)
+
+    assert not runner_with_journal(path, resume=False).open_journal(1, [10])
+    assert not RunJournal(path).read_runs(1)
+
+
+def test_reattached_run_is_not_launched_again(monkeypatch):
+    runner = Runner("token", 1, "info", RunnerConfig())
+    result = {"id": 100, "test_id": 10, "status": "done", "success_rate": 1}
+    launches = []
+    monkeypatch.setattr(runner, "start_test", lambda test_id, logger: launches.append(test_id))
+    monkeypatch.setattr(runner, "wait_for_test_completion", lambda *args: result)
+    conn = FakeConn()
+
+    runner.run_test(10, Logger(logging.getLogger("test-journal"), "info"), conn, run_id=100)
+
+    assert not launches
+    assert conn.messages == [100, result]
@@ -0,0 +1,224 @@
+import json
+import re
+import time
+
+import httpretty
+import pytest
+
+from loadero.async_runner import AsyncRunner
+from loadero.client_factory import DEFAULT_API_BASE, ClientFactory
+from loadero.journal import RunJournal
+from loadero.poll_policy import ACTIVE_STATUSES, FixedPollPolicy
+from loadero.report import ReportWriter
+from loadero.run_registry import RunRegistry
+from loadero.runner import Runner
+from loadero.runner_config import RunnerConfig, RunRecords
+
+PROJECT_ID = 4242
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class FakeRuns:
+    """Loadero runs that advance one status every time the run list is read."""
+
+    STATUSES = ["pending", "running", "done"]
+
+    def __init__(self):
+        self.runs = {}
+        self.list_calls = []
+        self.run_reads = []
+
+    def add(self, run_id, test_id, step=0):
+        self.runs[run_id] = {"id": run_id, "test_id": test_id, "step": step}
+
+    def run(self, run_id):
+        run = self.runs[run_id]
+        status = self.STATUSES[min(run["step"], len(self.STATUSES) - 1)]
+        run_dict = {"id": run_id, "test_id": run["test_id"], "status": status,
+                    "start_interval": 1, "participant_timeout": 1, "participant_count": 1}
+        if status == "done":
+            run_dict["success_rate"] = 1
+        return run_dict
+
+    def list_runs(self, query_params):
+        self.list_calls.append(query_params)
+        limit = int(query_params["limit"][0])
+        offset = int(query_params["offset"][0])
+        statuses = query_params.get("filter_status", [])
+        runs = [self.run(run_id) for run_id in sorted(self.runs)]
+        if offset == 0:
+            for run in self.runs.values():
+                run["step"] += 1
+        runs = [run for run in runs if run["status"] in statuses]
+        return {"results": runs[offset:offset + limit],
+                "pagination": {"limit": limit, "offset": offset, "total_items": len(runs)}, "filters": {}}
+
+    def read_run(self, run_id):
+        self.run_reads.append(run_id)
+        return self.run(run_id)
+
+
+class FakeAPIClient:
+    """API client of one project that answers run reads from FakeRuns."""
+
+    project_route = f"projects/{PROJECT_ID}/"
+
+    def __init__(self, fake_runs):
+        self.fake_runs = fake_runs
+
+    def get(self, route, query_params=None):
+        if route == f"{self.project_route}runs/":
+            query = {}
+            for key, value in query_params:
+                query.setdefault(key, []).append(value)
+            return self.fake_runs.list_runs(query)
+        return self.fake_runs.read_run(int(re.search(r"runs/(\d+)/$", route).group(1)))
+
+
+def test_one_list_call_refreshes_all_active_runs():
+    fake_runs = FakeRuns()
+    registry = RunRegistry(FakeAPIClient(fake_runs))
+    for run_id in range(1, 6):
+        fake_runs.add(run_id, test_id=run_id * 10)
+        registry.add(run_id * 10, run_id)
+
+    results = registry.refresh()
+
+    assert [result["status"] for result in results.values()] == ["pending"] * 5
+    assert len(fake_runs.list_calls) == 1
+    assert fake_runs.list_calls[0]["filter_status"] == ACTIVE_STATUSES
+    assert not fake_runs.run_reads
+    assert registry.api_calls == 1
+
+
+def test_finished_runs_are_read_one_by_one():
+    fake_runs = FakeRuns()
+    registry = RunRegistry(FakeAPIClient(fake_runs))
+    fake_runs.add(1, test_id=10, step=2)
+    fake_runs.add(2, test_id=20)
+    registry.add(10, 1)
+    registry.add(20, 2)
+
+    results = registry.refresh()
+
+    assert results[1]["status"] == "done"
+    assert results[2]["status"] == "pending"
+    assert fake_runs.run_reads == [1]
+    assert registry.api_calls == 2
+
+
+def test_active_runs_are_read_page_by_page():
+    fake_runs = FakeRuns()
+    registry = RunRegistry(FakeAPIClient(fake_runs), page_limit=2)
+    for run_id in range(1, 6):
+        fake_runs.add(run_id, test_id=run_id * 10)
+        registry.add(run_id * 10, run_id)
+
+    assert len(registry.refresh()) == 5
+    assert [query["offset"] for query in fake_runs.list_calls] == [[0], [2], [4]]
+    assert not fake_runs.run_reads
+
+
+def test_registry_without_runs_makes_no_calls():
+    fake_runs = FakeRuns()
+    registry = RunRegistry(FakeAPIClient(fake_runs))
+    registry.add(10, 1)
+    registry.remove(1)
+
+    assert not registry.refresh()
+    assert not fake_runs.list_calls
+
+
+def test_invalid_page_limit_is_rejected():
+    with pytest.raises(ValueError):
+        RunRegistry(FakeAPIClient(FakeRuns()), page_limit=0)
+
+
+@pytest.fixture(name="fake_loadero")
+def fixture_fake_loadero(monkeypatch):
+    fake_runs = FakeRuns()
+    launched = []
+    project_url = f"{DEFAULT_API_BASE}projects/{PROJECT_ID}/"
+
+    def launch(_request, uri, response_headers):
+        test_id = int(re.search(r"tests/(\d+)/runs/$", uri).group(1))
+        run_id = 1000 + test_id
+        launched.append(test_id)
+        # Test processes launch runs in their own copy, so runs they poll are added up front
+        if run_id not in fake_runs.runs:
+            fake_runs.add(run_id, test_id)
+        return 200, dict(response_headers, **JSON_HEADERS), json.dumps(fake_runs.run(run_id))
+
+    def list_runs(request, _uri, response_headers):
+        return 200, dict(response_headers, **JSON_HEADERS), json.dumps(fake_runs.list_runs(request.querystring))
+
+    def read_run(_request, uri, response_headers):
+        run_id = int(re.search(r"runs/(\d+)/$", uri).group(1))
+        return 200, dict(response_headers, **JSON_HEADERS), json.dumps(fake_runs.read_run(run_id))
+
+    clients = ClientFactory()
+    clients.configure(rate=1000, burst=1000)
+    monkeypatch.setattr("loadero.runner.CLIENTS", clients)
+    httpretty.enable(allow_net_connect=False)
+    httpretty.register_uri(httpretty.POST, re.compile(rf"{project_url}tests/\d+/runs/$"), body=launch)
+    httpretty.register_uri(httpretty.GET, re.compile(rf"{project_url}runs/(\?.*)?$"), body=list_runs)
+    httpretty.register_uri(httpretty.GET, re.compile(rf"{project_url}runs/\d+/$"), body=read_run)
+    yield fake_runs, launched
+    httpretty.disable()
+    httpretty.reset()
+
+
+def test_async_runner_polls_all_runs_with_one_list_call(fake_loadero, tmp_path):
+    fake_runs, launched = fake_loadero
+    report_writer = ReportWriter(str(tmp_path / "reports"))
+    runner = AsyncRunner("token", PROJECT_ID, "info", RunnerConfig(
+        poll_policy=FixedPollPolicy(0.01), records=RunRecords(report_writer=report_writer)))
+
+    runner.run_tests(PROJECT_ID, [1, 2, 3], 30)
+
+    assert sorted(launched) == [1, 2, 3]
+    test_cases = report_writer.test_cases
+    assert len(test_cases) == 3
+    assert not any(test_case.is_failure() or test_case.is_error() for test_case in test_cases)
+    # Runs are polled together, every run is read alone only once it finished
+    assert sorted(fake_runs.run_reads) == [1001, 1002, 1003]
+    assert len(fake_runs.list_calls) <= 4
+    assert runner.registry.api_calls == len(fake_runs.list_calls) + len(fake_runs.run_reads)
+
+
+def test_process_runner_polls_all_runs_from_parent(fake_loadero, tmp_path):
+    fake_runs, _ = fake_loadero
+    for test_id in [1, 2, 3]:
+        fake_runs.add(1000 + test_id, test_id)
+    report_writer = ReportWriter(str(tmp_path / "reports"))
+    runner = Runner("token", PROJECT_ID, "info", RunnerConfig(
+        poll_policy=FixedPollPolicy(0.01), records=RunRecords(report_writer=report_writer)))
+
+    runner.run_tests(PROJECT_ID, [1, 2, 3], 30)
+
+    test_cases = report_writer.test_cases
+    assert len(test_cases) == 3
+    assert not any(test_case.is_failure() or test_case.is_error() for test_case in test_cases)
+    # Test processes only wait for the results the parent reads with one list call for all runs
+    assert sorted(fake_runs.run_reads) == [1001, 1002, 1003]
+    assert len(fake_runs.list_calls) <= 4
+    assert runner.registry.api_calls == len(fake_runs.list_calls) + len(fake_runs.run_reads)
+
+
+def test_async_runner_reattaches_to_journaled_run(fake_loadero, tmp_path):
+    fake_runs, launched = fake_loadero
+    fake_runs.add(500, test_id=1, step=1)
+    journal = RunJournal(str(tmp_path / "runner_state.json"))
+    journal.start(PROJECT_ID)
+    journal.record(1, 500, time.time())
+    report_writer = ReportWriter(str(tmp_path / "reports"))
+    runner = AsyncRunner("token", PROJECT_ID, "info", RunnerConfig(
+        poll_policy=FixedPollPolicy(0.01),
+        records=RunRecords(report_writer=report_writer, journal=journal, resume=True)))
+
+    runner.run_tests(PROJECT_ID, [1, 2], 30)
+
+    assert launched == [2]
+    assert sorted(fake_runs.run_reads) == [500, 1002]
+    assert not any(test_case.is_failure() or test_case.is_error() for test_case in report_writer.test_cases)
+    assert not RunJournal(journal.path).read_runs(PROJECT_ID)
@@ -0,0 +1,85 @@
+import pytest
+
+from loadero.scheduler import LaunchScheduler, count_compute_units
+
+
+def test_parallel_limit_admits_tests_in_queue_order():
+    scheduler = LaunchScheduler(max_parallel=2)
+    scheduler.enqueue([1, 2, 3])
+
+    assert scheduler.pop_admissible() == [1, 2]
+    assert scheduler.queue == [3]
+    assert not scheduler.pop_admissible()
+
+    scheduler.release(1)
+    assert scheduler.pop_admissible() == [3]
+    assert scheduler.running == [2, 3]
+
+
+def test_smaller_tests_wait_behind_test_that_does_not_fit():
+    scheduler = LaunchScheduler(cu_budget=4, compute_units={1: 3, 2: 2, 3: 1})
+    scheduler.enqueue([1, 2, 3])
+
+    assert scheduler.pop_admissible() == [1]
+    assert scheduler.used_compute_units == 3
+    assert scheduler.queue == [2, 3]
+
+
+def test_large_test_is_not_starved_by_smaller_tests():
+    scheduler = LaunchScheduler(cu_budget=4, compute_units={1: 1, 2: 1, 3: 4, 4: 1, 5: 1})
+    scheduler.enqueue([1, 2, 3, 4, 5])
+
+    assert scheduler.pop_admissible() == [1, 2]
+    # Capacity freed by a small test is kept for the large one
+    scheduler.release(1)
+    assert not scheduler.pop_admissible()
+    scheduler.release(2)
+    assert scheduler.pop_admissible() == [3]
+    scheduler.release(3)
+    assert scheduler.pop_admissible() == [4, 5]
+
+
+def test_test_over_budget_is_admitted_when_nothing_runs():
+    scheduler = LaunchScheduler(cu_budget=2, compute_units={1: 1, 2: 5})
+    scheduler.enqueue([1, 2])
+
+    assert scheduler.pop_admissible() == [1]
+    scheduler.release(1)
+    assert scheduler.pop_admissible() == [2]
+    assert scheduler.used_compute_units == 5
+
+
+def test_test_is_admitted_only_if_it_is_first_in_queue():
+    scheduler = LaunchScheduler(cu_budget=4, compute_units={1: 3, 2: 2, 3: 1})
+    scheduler.enqueue([1, 2, 3])
+
+    assert not scheduler.admit(2)
+    assert scheduler.admit(1)
+    assert not scheduler.admit(3)
+    assert not scheduler.admit(2)
+
+
+def test_attached_test_takes_capacity_without_limit_check():
+    scheduler = LaunchScheduler(max_parallel=1, compute_units={1: 2, 2: 3})
+    scheduler.enqueue([1, 2])
+    scheduler.attach(1)
+    scheduler.attach(2)
+
+    assert not scheduler.queue
+    assert scheduler.running == [1, 2]
+    assert scheduler.used_compute_units == 5
+
+
+@pytest.mark.parametrize("max_parallel, cu_budget", [(0, None), (None, 0), (None, -1)])
+def test_invalid_limits_are_rejected(max_parallel, cu_budget):
+    with pytest.raises(ValueError):
+        LaunchScheduler(max_parallel=max_parallel, cu_budget=cu_budget)
+
+
+def test_compute_units_count_group_and_participant_counts():
+    groups = [{"id": 1, "count": 2}, {"id": 2}]
+    participants = [
+        {"group_id": 1, "count": 3, "compute_unit": "g0.5"},
+        {"group_id": 2, "count": 1, "compute_unit": "g2"},
+    ]
+    assert count_compute_units(groups, participants) == 5
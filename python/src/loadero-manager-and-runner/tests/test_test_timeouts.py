@@ -0,0 +1,41 @@
+import json
+
+from loadero.backup_files import read_test_timeouts, write_test_tree
+from loadero.local_manager import LocalManager
+from loadero.scheduler import test_timeout as run_timeout
+
+SCRIPT = "def test_on_loadero(driver: TestUIDriver):\n    pass\n"
+TEST = {"id": 5, "name": "test", "project_id": 1, "script_file_id": 9, "start_interval": 10,
+        "participant_timeout": 60, "mode": "load", "increment_strategy": "linear"}
+
+
+class FakeRemoteManager:
+    """Loadero project whose tests are read only if they are not backed up."""
+
+    def __init__(self):
+        self.test_reads = []
+
+    def read_test(self, test_id):
+        self.test_reads.append(test_id)
+        return dict(TEST, id=test_id, start_interval=20, participant_timeout=120)
+
+
+def test_run_timeout_adds_margin_to_test_duration():
+    assert run_timeout({"start_interval": 10, "participant_timeout": 60}, 30) == 100
+    assert run_timeout({"start_interval": None}, 30) == 30
+
+
+def test_timeouts_are_read_from_backup_or_from_loadero(tmp_path, monkeypatch):
+    project_directory = tmp_path / "test_cases" / "1_proj"
+    project_directory.mkdir(parents=True)
+    project = {"id": 1, "language": "python", "name": "proj", "manager_config": {"suites": {}}}
+    (project_directory / "1_proj.json").write_text(json.dumps(project), encoding="utf-8")
+    local_manager = LocalManager("token", 1, test_cases_path=str(tmp_path / "test_cases"))
+    write_test_tree(local_manager, "proj", {
+        "test": TEST, "script": SCRIPT, "groups": [], "participants": [], "asserts": [],
+        "asserts_preconditions": {}})
+    remote_manager = FakeRemoteManager()
+    monkeypatch.setattr(local_manager, "get_remote_manager", lambda: remote_manager)
+
+    assert read_test_timeouts(local_manager, [5, 6], 30) == {5: 100, 6: 170}
+    assert remote_manager.test_reads == [6]
@@ -0,0 +1,38 @@
+from loadero.tree_diff import diff_objects, object_body
+
+
+def group(group_id, name, count=1, **fields):
+    return {"id": group_id, "test_id": 5, "name": name, "count": count, **fields}
+
+
+def test_objects_are_selected_for_create_update_and_delete():
+    local_groups = [group(1, "unchanged"), group(2, "renamed"), group(3, "new")]
+    remote_groups = [group(1, "unchanged"), group(2, "old name"), group(4, "removed")]
+
+    created, updated, deleted = diff_objects("groups", local_groups, remote_groups)
+
+    assert created == [local_groups[2]]
+    assert updated == [local_groups[1]]
+    assert deleted == [remote_groups[2]]
+
+
+def test_changed_count_is_updated():
+    _, updated, _ = diff_objects("groups", [group(1, "group", count=2)], [group(1, "group", count=1)])
+    assert [local_group["id"] for local_group in updated] == [1]
+
+
+def test_read_only_fields_are_not_compared():
+    local_group = group(1, "group", created="2024-01-01T00:00:00Z", updated="2024-01-01T00:00:00Z")
+    remote_group = group(1, "group", created="2024-01-01T00:00:00Z", updated="2024-03-01T12:00:00Z")
+
+    assert diff_objects("groups", [local_group], [remote_group]) == ([], [], [])
+
+
+def test_object_body_leaves_out_read_only_fields():
+    body = object_body("groups", group(1, "group", count=3, created="2024-01-01T00:00:00Z"))
+    assert body == {"name": "group", "count": 3}
+
+
+def test_equal_trees_need_no_changes():
+    groups = [group(1, "first"), group(2, "second")]
+    assert diff_objects("groups", groups, [dict(remote_group) for remote_group in groups]) == ([], [], [])